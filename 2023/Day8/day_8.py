@@ -2,6 +2,14 @@ import re
 import math
 from timeit import default_timer as timer
 
+import os
+import sys
+
+# Run from the day directory, so put the repo root (home of aoc_utils) on the path.
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
 from aoc_utils import day_parser
 
 
@@ -135,7 +143,8 @@ def main(data, log=False):
 
 if __name__ == "__main__":
     args = day_parser().parse_args()
-    with open(args.infile) as f:
-        print(f"Using data from {args.infile}.\n")
+    infile = args.infile or ("example.txt" if args.example else "input.txt")
+    with open(infile) as f:
+        print(f"Using data from {infile}.\n")
         data = f.read().strip()
     main(data, log=args.log)
@@ -4,6 +4,14 @@ Day X: [Problem Title]
 [Brief description of the problem]
 """
 
+import os
+import sys
+
+# Run from the day directory, so put the repo root (home of aoc_utils) on the path.
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
 from aoc_utils import *
 
 
@@ -36,6 +36,7 @@ def check_loop(
     c = len(matrix[0]) if r > 0 else 0
     pos, move_idx = start
     x, y = pos
+    original = matrix[x][y]
     matrix[x][y] = "#"
     did_loop = False
     new_searched = set()
@@ -54,7 +55,7 @@ def check_loop(
             x += DIRECTIONS[move_idx][0]
             y += DIRECTIONS[move_idx][1]
 
-    matrix[pos[0]][pos[1]] = "."
+    matrix[pos[0]][pos[1]] = original
     return did_loop
 
 
@@ -79,6 +80,7 @@ def get_route(start: tuple[int, int], matrix: list[list[str]], r: int, c: int):
 def print_map(
     matrix: list[list[str]], moves: list[MOVE], new_obstacles: set[tuple[int, int]]
 ):
+    matrix = [row[:] for row in matrix]  # Leave the shared parsed grid untouched
     r = len(matrix)
     c = len(matrix[0]) if r > 0 else 0
     start = moves[0][0]
@@ -104,15 +106,20 @@ def print_map(
             print(f"{i} " + " ".join(line))
 
 
-def part_1(data, log=False):
+def parse(data):
+    """Parse the map and walk the guard's route once for both parts."""
     matrix, r, c, start = parse_input(data)
     route = get_route(start, matrix, r, c)
-    print(f"Part 1: {len(route)}")
+    return matrix, route
 
 
-def part_2(data, log=False):
-    matrix, r, c, start = parse_input(data)
-    route = get_route(start, matrix, r, c)
+def part_1(parsed, log=False):
+    _, route = parsed
+    return len(route)
+
+
+def part_2(parsed, log=False):
+    matrix, route = parsed
 
     new_obstacles = set()
     moves = [*route.items()]
@@ -122,10 +129,9 @@ def part_2(data, log=False):
         if loops:
             new_obstacles.add((x, y))
 
-    print(f"Part 1: {len(moves)}")
-    print(f"Part 2: {len(new_obstacles)}")
     if log:
         print_map(matrix, moves, new_obstacles)
+    return len(new_obstacles)
 
 
 if __name__ == "__main__":
@@ -184,10 +190,11 @@ if __name__ == "__main__":
     if log:
         print("Log enabled. Data length:", len(data), "\n")
         print(f"Part {part}:\n")
+    parsed = parse(data)
     if args.part == 1:
-        result = part_1(data, log=log)
+        result = part_1(parsed, log=log)
     elif args.part == 2:
-        result = part_2(data, log=log)
+        result = part_2(parsed, log=log)
     else:
         raise ValueError("Invalid part specified. Use 1 or 2.")
     if result is not None:
@@ -0,0 +1,47 @@
+"""Synthetic lab maps for `perf.py --sweep` (see the manifest's "generator")."""
+
+from aoc_utils import input_generator
+
+from day_6 import DIRECTIONS
+
+
+def _escape_length(matrix: list[list[str]], start: tuple[int, int]):
+    """Steps the guard takes to walk off the map, or None if it loops forever."""
+    r, c = len(matrix), len(matrix[0])
+    (x, y), move_idx = start, 0
+    seen = set()
+    while 0 <= x < r and 0 <= y < c:
+        if ((x, y), move_idx) in seen:
+            return None
+        seen.add(((x, y), move_idx))
+        dx, dy = DIRECTIONS[move_idx]
+        if 0 <= x + dx < r and 0 <= y + dy < c and matrix[x + dx][y + dy] == "#":
+            move_idx = (move_idx + 1) % 4
+        else:
+            x, y = x + dx, y + dy
+    return len(seen)
+
+
+@input_generator(sizes=(32, 48, 64, 96, 128), budget={1: 2.3, 2: 3.5}, param="grid side")
+def generate_input(size, rng, candidates=20):
+    """A size x size lab with ~5% obstacles whose guard walks off the map.
+
+    get_route never returns for a guard stuck in a loop, so such maps are
+    redrawn. Most random maps let the guard out within a few turns, so the
+    longest escape out of several candidates is kept, like the real inputs.
+    """
+    best, best_length = None, -1
+    while best is None or candidates > 0:
+        matrix = [
+            ["#" if rng.random() < 0.05 else "." for _ in range(size)]
+            for _ in range(size)
+        ]
+        start = (rng.randrange(size), rng.randrange(size))
+        matrix[start[0]][start[1]] = "^"
+        length = _escape_length(matrix, start)
+        if length is None:
+            continue
+        candidates -= 1
+        if length > best_length:
+            best, best_length = matrix, length
+    return "\n".join("".join(row) for row in best)
@@ -0,0 +1,32 @@
+"""Synthetic calibration equations for `perf.py --sweep` (see the manifest's "generator")."""
+
+from aoc_utils import input_generator
+
+
+@input_generator(
+    sizes=(20, 40, 80, 160, 320),
+    budget={1: 1.3, 2: 1.3},
+    param="equation count",
+)
+def generate_input(size, rng):
+    """`size` equations of 3-12 numbers, about half of them solvable.
+
+    Solvable targets come from applying random +, * and || operators; the
+    rest are off by one so the search has to exhaust them.
+    """
+    lines = []
+    for _ in range(size):
+        numbers = [int(10 ** rng.uniform(0, 3)) for _ in range(rng.randint(3, 12))]
+        target = numbers[0]
+        for number in numbers[1:]:
+            op = rng.randrange(3)
+            if op == 0:
+                target += number
+            elif op == 1:
+                target *= number
+            else:
+                target = int(f"{target}{number}")
+        if rng.random() < 0.5:
+            target += 1
+        lines.append(f"{target}: {' '.join(map(str, numbers))}")
+    return "\n".join(lines)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark point representations on the Day 8 part 2 antinode walk.
+"""
+
+import os
+import sys
+import time
+from itertools import combinations
+
+# Run from the day directory, so put the repo root (home of aoc_utils) on the path.
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
+from aoc_utils import Point, pack_point, parse_grid, unpack_point
+
+
+class LegacyPoint:
+    """
+    aoc_utils.Point before it got slots and a cached hash: a __dict__ per
+    instance and a tuple built on every hash.
+    """
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __add__(self, other):
+        return LegacyPoint(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other):
+        return LegacyPoint(self.x - other.x, self.y - other.y)
+
+    def __eq__(self, other):
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    def inBounds(self, grid):
+        return 0 <= self.x < len(grid) and 0 <= self.y < len(grid[0])
+
+
+def antenna_pairs(grid):
+    """(x, y) coordinate pairs of same-frequency antennas."""
+    antennas = {}
+    for y, row in enumerate(grid):
+        for x, cell in enumerate(row):
+            if cell != ".":
+                antennas.setdefault(cell, []).append((x, y))
+    return [pair for points in antennas.values() for pair in combinations(points, 2)]
+
+
+def count_legacy(grid, pairs):
+    antinodes = set()
+    for (ax, ay), (bx, by) in pairs:
+        a, b = LegacyPoint(ax, ay), LegacyPoint(bx, by)
+        diff = b - a
+        while a.inBounds(grid):
+            antinodes.add(a)
+            a -= diff
+        while b.inBounds(grid):
+            antinodes.add(b)
+            b += diff
+    return len(antinodes)
+
+
+def count_point(grid, pairs):
+    x_size, y_size = len(grid), len(grid[0])
+    antinodes = set()
+    for a, b in pairs:
+        a, b = Point(*a), Point(*b)
+        diff = b - a
+        while a.within(x_size, y_size):
+            antinodes.add(a)
+            a -= diff
+        while b.within(x_size, y_size):
+            antinodes.add(b)
+            b += diff
+    return len(antinodes)
+
+
+def count_packed(grid, pairs):
+    # Bounds checks need x and y back, so every step pays for unpack_point.
+    x_size, y_size = len(grid), len(grid[0])
+    antinodes = set()
+    for (ax, ay), (bx, by) in pairs:
+        step = pack_point(bx - ax, by - ay)
+        for p, step in ((pack_point(ax, ay), -step), (pack_point(bx, by), step)):
+            while True:
+                x, y = unpack_point(p)
+                if not (0 <= x < x_size and 0 <= y < y_size):
+                    break
+                antinodes.add(p)
+                p += step
+    return len(antinodes)
+
+
+def count_complex(grid, pairs):
+    x_size, y_size = len(grid), len(grid[0])
+    antinodes = set()
+    for (ax, ay), (bx, by) in pairs:
+        a, b = complex(ax, ay), complex(bx, by)
+        diff = b - a
+        while 0 <= a.real < x_size and 0 <= a.imag < y_size:
+            antinodes.add(a)
+            a -= diff
+        while 0 <= b.real < x_size and 0 <= b.imag < y_size:
+            antinodes.add(b)
+            b += diff
+    return len(antinodes)
+
+
+def benchmark_methods(data, runs=5):
+    """
+    Compare performance of the point representations.
+    """
+    grid = parse_grid(data)
+    pairs = antenna_pairs(grid)
+    methods = {
+        "LegacyPoint": count_legacy,
+        "Point": count_point,
+        "Packed int": count_packed,
+        "Complex": count_complex,
+    }
+
+    print("Performance Comparison:")
+    print("=" * 50)
+
+    for name, method_func in methods.items():
+        times = []
+        result = None
+
+        for _ in range(runs):
+            start_time = time.perf_counter()
+            result = method_func(grid, pairs)
+            end_time = time.perf_counter()
+            times.append(end_time - start_time)
+
+        avg_time = sum(times) / len(times)
+        min_time = min(times)
+        max_time = max(times)
+
+        print(
+            f"{name:12}: {result:6} | Avg: {avg_time:.6f}s | Min: {min_time:.6f}s | Max: {max_time:.6f}s"
+        )
+
+
+if __name__ == "__main__":
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    # Test with example data
+    with open("example.txt") as f:
+        example_data = f.read().strip()
+
+    print("Benchmarking with example data:")
+    benchmark_methods(example_data)
+
+    print("\n" + "=" * 50)
+
+    # Test with actual input if available
+    try:
+        with open("input.txt") as f:
+            input_data = f.read().strip()
+        print("Benchmarking with actual input data:")
+        benchmark_methods(input_data, runs=100)
+    except FileNotFoundError:
+        print("input.txt not found, skipping full input benchmark")
@@ -2,6 +2,14 @@
 --- Day 8: Resonant Collinearity ---
 """
 
+import os
+import sys
+
+# Run from the day directory, so put the repo root (home of aoc_utils) on the path.
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
 from aoc_utils import *
 from itertools import combinations
 
@@ -75,6 +83,7 @@ def part_2(data, log=False):
     if log:
         debug_print(f"Antenna positions: {antennas}")
     antinodes = set()
+    x_size, y_size = len(grid), len(grid[0])
     for antenna, points in antennas.items():
         combos = combinations(points, 2)
         if log:
@@ -88,10 +97,10 @@ def part_2(data, log=False):
             antinodes.add(b)
             a_back = a - diff
             b_forward = b + diff
-            while a_back.inBounds(grid):
+            while a_back.within(x_size, y_size):
                 antinodes.add(a_back)
                 a_back -= diff
-            while b_forward.inBounds(grid):
+            while b_forward.within(x_size, y_size):
                 antinodes.add(b_forward)
                 b_forward += diff
     if log:
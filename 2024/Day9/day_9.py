@@ -10,9 +10,29 @@ from importlib.metadata import files
 from math import e
 from operator import le
 from tabnanny import check
+import os
+import sys
+
+# Run from the day directory, so put the repo root (home of aoc_utils) on the path.
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
 from aoc_utils import *
 
 
+@input_generator(
+    sizes=(1000, 2000, 4000, 8000, 16000),
+    budget={1: 1.3, 2: 2.2},
+    param="disk map length",
+)
+def generate_input(size, rng):
+    """A disk map of `size` digits: files of 1-9 blocks alternating with 0-9 free."""
+    return "".join(
+        str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)) for i in range(size)
+    )
+
+
 def parse_input(data):
     """Parse the input data into a useful format."""
     # TODO: Implement parsing logic
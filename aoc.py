@@ -4,6 +4,7 @@ Script to create directory structure and files for a new day of Advent of Code.
 
 import argparse
 from datetime import datetime
+import json
 import os
 import requests
 import sys
@@ -34,9 +35,8 @@ def aoc_new_day(day, year, id, update=False, name=None, submit=False):
     if update:
         sys.exit()
 
-    # Copy boilerplate.py and aoc_utils.py file
+    # Copy boilerplate.py; the template imports the shared aoc_utils package
     template_path = f"{path}{name}.py"
-    utils_path = f"{path}aoc_utils.py"
 
     # Check if files already exist to avoid overwriting
     if not os.path.exists(template_path):
@@ -45,11 +45,12 @@ def aoc_new_day(day, year, id, update=False, name=None, submit=False):
     else:
         print(f"File {template_path} already exists, skipping...")
 
-    if not os.path.exists(utils_path):
-        os.system(f"cp aoc_utils.py {utils_path}")
-        print(f"Created {utils_path}")
-    else:
-        print(f"File {utils_path} already exists, skipping...")
+    # Name the entry point for run.py/perf.py; answers are added once solved
+    manifest_path = f"{path}manifest.json"
+    if not os.path.exists(manifest_path):
+        with open(manifest_path, "w") as f:
+            f.write(json.dumps({"entry": f"{name}.py"}, indent=2) + "\n")
+        print(f"Created {manifest_path}")
 
     # Save personal challenge input data
     out_path = f"{path}input.txt"
@@ -83,7 +84,7 @@ def aoc_new_day(day, year, id, update=False, name=None, submit=False):
     print(f"Setup complete for Day {day}, {year}!")
     print(f"Working directory: {os.getcwd()}")
     print(
-        f"Files created: {name}.py, aoc_utils.py, input.txt, example.txt, README.md, solutions.txt"
+        f"Files created: {name}.py, manifest.json, input.txt, example.txt, README.md, solutions.txt"
     )
 
 
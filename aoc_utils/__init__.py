@@ -0,0 +1,108 @@
+"""
+Advent of Code Utility Functions
+Common patterns and helper functions for AoC problems.
+
+The helpers live in submodules (parsing, grid, search, math, ranges, timing,
+cli, generators, cache) that are only imported when one of their names is
+first used, so `import aoc_utils` itself costs next to nothing. `from aoc_utils import *`
+brings in everything listed in __all__, including the collections,
+itertools and functools names solutions have always got from here. The
+typing aliases (List, Dict, ...) and the parse cache (ParseCache,
+PARSE_CACHE, cached_parse) are imported by name: typing alone costs more
+than all the submodules together.
+"""
+
+import importlib
+
+_SUBMODULE_NAMES = {
+    "parsing": [
+        "parse_ints",
+        "parse_grid",
+        "parse_blocks",
+        "parse_lines",
+        "EMAIL_PATTERN",
+        "NUMBER_PATTERN",
+        "WORD_PATTERN",
+    ],
+    "grid": [
+        "neighbors_4",
+        "neighbors_8",
+        "in_bounds",
+        "print_grid",
+        "DIRECTIONS",
+        "move",
+        "manhattan_distance",
+        "Point",
+        "Grid",
+        "pack_point",
+        "unpack_point",
+        "to_complex",
+        "from_complex",
+    ],
+    "search": [
+        "bfs",
+        "dfs",
+        "dfs_walk",
+        "iddfs",
+        "find_cycle",
+        "topological_order",
+        "bfs_search",
+        "bfs_indexed",
+        "dijkstra",
+        "dijkstra_indexed",
+        "astar",
+        "SearchResult",
+    ],
+    "math": ["gcd", "lcm", "lcm_list"],
+    "ranges": ["range_overlap", "merge_ranges"],
+    "timing": ["Span", "Tracer", "TRACER", "span", "traced", "timer"],
+    "cli": ["day_parser", "debug_print"],
+    "generators": ["input_generator"],
+}
+
+# Standard library names that used to come along with the star import.
+_STDLIB_NAMES = {
+    "collections": ["defaultdict", "deque", "Counter"],
+    "functools": ["lru_cache"],
+    "itertools": ["combinations", "permutations", "product"],
+    "typing": ["List", "Tuple", "Dict", "Set", "Any", "Optional"],
+}
+
+# Importable by name but left out of the star import.
+_EXTRA_NAMES = {
+    "cache": ["ParseCache", "PARSE_CACHE", "cached_parse"],
+    "generators": ["InputGenerator", "find_input_generator"],
+}
+
+_LOCATIONS = {}
+for _module, _names in _SUBMODULE_NAMES.items():
+    _LOCATIONS.update(dict.fromkeys(_names, f"{__name__}.{_module}"))
+for _module, _names in _EXTRA_NAMES.items():
+    _LOCATIONS.update(dict.fromkeys(_names, f"{__name__}.{_module}"))
+for _module, _names in _STDLIB_NAMES.items():
+    _LOCATIONS.update(dict.fromkeys(_names, _module))
+del _module, _names
+
+# typing stays out of the star import; see the module docstring.
+__all__ = [
+    name
+    for group in (_SUBMODULE_NAMES, _STDLIB_NAMES)
+    for module, names in group.items()
+    if module != "typing"
+    for name in names
+]
+
+
+def __getattr__(name):
+    # Cached in globals() so later lookups skip this hook. The warm worker
+    # drops the whole package from sys.modules when any of its files change,
+    # so a cached name never outlives the submodule it came from.
+    location = _LOCATIONS.get(name)
+    if location is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(importlib.import_module(location), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LOCATIONS))
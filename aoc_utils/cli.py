@@ -0,0 +1,49 @@
+"""Command-line and console helpers for day scripts."""
+
+
+def day_parser():
+    """Standard argument parser for AoC problems.
+
+    -i/--infile overrides the input file chosen by -e/--example.
+    """
+    import argparse  # Deferred: only scripts run from the command line need it
+
+    parser = argparse.ArgumentParser(
+        description="Run Advent of Code problem.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "-l",
+        "--log",
+        action="store_true",
+        help="Enable log (default: %(default)s)",
+        default=False,
+    )
+    parser.add_argument(
+        "-e",
+        "--example",
+        action="store_true",
+        help="Use example input file (default: %(default)s)",
+        default=False,
+    )
+    parser.add_argument(
+        "-p",
+        "--part",
+        type=int,
+        choices=[1, 2],
+        help="Specify part to run (1 or 2, default: %(default)s)",
+        default=1,
+    )
+    parser.add_argument(
+        "-i",
+        "--infile",
+        help="Input file to read instead of input.txt / example.txt",
+        default=None,
+    )
+    return parser
+
+
+def debug_print(*args, enabled=True, **kwargs):
+    """Conditional print for debugging."""
+    if enabled:
+        print(*args, **kwargs)
@@ -0,0 +1,51 @@
+"""Synthetic input generators for size-sweep benchmarks."""
+
+
+class InputGenerator:
+    """A day's generator of valid inputs, with the sizes to sweep.
+
+    budget maps a part to the highest acceptable empirical complexity
+    exponent, i.e. the slope of log(runtime) against log(size).
+    """
+
+    __slots__ = ("func", "sizes", "budget", "param")
+
+    def __init__(self, func, sizes, budget=None, param="size"):
+        self.func = func
+        self.sizes = tuple(sizes)
+        if budget is None:
+            budget = {}
+        elif not isinstance(budget, dict):
+            budget = {1: budget, 2: budget}
+        self.budget = budget
+        self.param = param
+
+    def __call__(self, size: int, seed: int = 0) -> str:
+        """Generate the input for `size`; the same seed gives the same input."""
+        import random  # Deferred: only sweeps need it
+
+        return self.func(size, random.Random(seed))
+
+
+def input_generator(sizes, budget=None, param="size"):
+    """Declare func(size, rng) -> str as the day's generator of puzzle inputs.
+
+    sizes are swept by `perf.py --sweep`; param says what size means (grid
+    side, equation count, ...); budget is a max exponent for both parts or a
+    {part: exponent} dict.
+    """
+
+    def decorate(func):
+        func.__input_generator__ = InputGenerator(func, sizes, budget, param)
+        return func
+
+    return decorate
+
+
+def find_input_generator(module):
+    """The InputGenerator declared in a day module, or None."""
+    for value in vars(module).values():
+        generator = getattr(value, "__input_generator__", None)
+        if isinstance(generator, InputGenerator):
+            return generator
+    return None
@@ -0,0 +1,294 @@
+"""Grid, direction and point helpers."""
+
+from operator import attrgetter
+
+
+# Grid utilities
+def neighbors_4(row: int, col: int) -> list[tuple[int, int]]:
+    """Get 4-directional neighbors (up, down, left, right)."""
+    return [(row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)]
+
+
+def neighbors_8(row: int, col: int) -> list[tuple[int, int]]:
+    """Get 8-directional neighbors (including diagonals)."""
+    directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+    return [(row + dr, col + dc) for dr, dc in directions]
+
+
+def in_bounds(row: int, col: int, grid: list[list]) -> bool:
+    """Check if coordinates are within grid bounds."""
+    return 0 <= row < len(grid) and 0 <= col < len(grid[0])
+
+
+def print_grid(grid: list[list], separator: str = ""):
+    """Pretty print a 2D grid."""
+    for row in grid:
+        print(separator.join(str(cell) for cell in row))
+
+
+# Direction utilities
+DIRECTIONS = {
+    "N": (-1, 0),
+    "S": (1, 0),
+    "E": (0, 1),
+    "W": (0, -1),
+    "NE": (-1, 1),
+    "NW": (-1, -1),
+    "SE": (1, 1),
+    "SW": (1, -1),
+    "U": (-1, 0),
+    "D": (1, 0),
+    "L": (0, -1),
+    "R": (0, 1),
+    "^": (-1, 0),
+    "v": (1, 0),
+    "<": (0, -1),
+    ">": (0, 1),
+}
+
+
+def move(pos: tuple[int, int], direction: str) -> tuple[int, int]:
+    """Move from position in given direction."""
+    dr, dc = DIRECTIONS[direction]
+    return (pos[0] + dr, pos[1] + dc)
+
+
+def manhattan_distance(p1: tuple[int, int], p2: tuple[int, int]) -> int:
+    """Calculate Manhattan distance between two points."""
+    return abs(p1[0] - p2[0]) + abs(p1[1] - p2[1])
+
+
+# Flat grids
+class Grid:
+    """A character grid stored row-major in one bytearray.
+
+    A one-cell border of `border` surrounds the cells, so a neighbour of any
+    cell is always a valid index: stepping off the edge lands on the border,
+    which `in_bounds` (or comparing `cells[i]` with `sentinel`) detects
+    without any row/column arithmetic. Cells are addressed by integer index;
+    `index`/`position` convert to and from (row, col). `deltas` holds the
+    DIRECTIONS table as index offsets, and `deltas_4`/`deltas_8` the
+    neighbour offsets in the order of neighbors_4/neighbors_8.
+    """
+
+    __slots__ = (
+        "height",
+        "width",
+        "stride",
+        "cells",
+        "border",
+        "sentinel",
+        "deltas",
+        "deltas_4",
+        "deltas_8",
+    )
+
+    def __init__(self, rows, border: str = "\0"):
+        rows = ["".join(row) for row in rows]
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else 0
+        if any(len(row) != self.width for row in rows):
+            raise ValueError("Grid rows have different lengths")
+        self.stride = self.width + 2
+        self.border = border
+        self.sentinel = ord(border)
+        edge = border * self.stride
+        text = "".join([edge, *(border + row + border for row in rows), edge])
+        self.cells = bytearray(text, "latin-1")
+
+        stride = self.stride
+        self.deltas = {name: dr * stride + dc for name, (dr, dc) in DIRECTIONS.items()}
+        self.deltas_4 = (-stride, stride, -1, 1)
+        self.deltas_8 = tuple(
+            dr * stride + dc
+            for dr, dc in ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+        )
+
+    @classmethod
+    def from_text(cls, data: str, border: str = "\0") -> "Grid":
+        """Parse puzzle input the way parse_grid does."""
+        return cls(data.strip().split("\n"), border)
+
+    @classmethod
+    def from_lists(cls, grid: list[list], border: str = "\0") -> "Grid":
+        """Convert a parse_grid-style list of rows of characters."""
+        return cls(grid, border)
+
+    def to_lists(self) -> list[list[str]]:
+        """The grid as a parse_grid-style list of rows of characters."""
+        return [list(self.row(r).tobytes().decode("latin-1")) for r in range(self.height)]
+
+    def copy(self) -> "Grid":
+        grid = Grid.__new__(Grid)
+        for name in self.__slots__:
+            setattr(grid, name, getattr(self, name))
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    # Indices
+    def index(self, row: int, col: int) -> int:
+        """Cell index of (row, col)."""
+        return (row + 1) * self.stride + col + 1
+
+    def position(self, index: int) -> tuple[int, int]:
+        """(row, col) of a cell index."""
+        row, col = divmod(index, self.stride)
+        return row - 1, col - 1
+
+    def in_bounds(self, index: int) -> bool:
+        """True unless index is on the border (indices step at most one cell off)."""
+        return self.cells[index] != self.sentinel
+
+    def contains(self, row: int, col: int) -> bool:
+        """Check if coordinates are within grid bounds."""
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def manhattan(self, a: int, b: int) -> int:
+        """Manhattan distance between two cell indices, e.g. as an A* heuristic."""
+        (ra, ca), (rb, cb) = divmod(a, self.stride), divmod(b, self.stride)
+        return abs(ra - rb) + abs(ca - cb)
+
+    def indices(self):
+        """Indices of all cells, row by row."""
+        stride = self.stride
+        for start in range(stride + 1, (self.height + 1) * stride, stride):
+            yield from range(start, start + self.width)
+
+    def neighbors_4(self, index: int) -> list[int]:
+        """In-bounds 4-directional neighbours of a cell."""
+        cells, sentinel = self.cells, self.sentinel
+        return [n for d in self.deltas_4 if cells[n := index + d] != sentinel]
+
+    def neighbors_8(self, index: int) -> list[int]:
+        """In-bounds 8-directional neighbours of a cell."""
+        cells, sentinel = self.cells, self.sentinel
+        return [n for d in self.deltas_8 if cells[n := index + d] != sentinel]
+
+    # Cells
+    def __getitem__(self, key) -> str:
+        """Character at an index or a (row, col) pair."""
+        if isinstance(key, tuple):
+            key = self.index(*key)
+        return chr(self.cells[key])
+
+    def __setitem__(self, key, char: str):
+        if isinstance(key, tuple):
+            key = self.index(*key)
+        self.cells[key] = ord(char)
+
+    def find(self, char: str, start: int = 0) -> int:
+        """Index of the first cell holding char at or after start, or -1."""
+        return self.cells.find(ord(char), start)
+
+    def find_all(self, char: str) -> list[int]:
+        """Indices of every cell holding char, in row order."""
+        cells, code = self.cells, ord(char)
+        found = []
+        index = cells.find(code)
+        while index != -1:
+            found.append(index)
+            index = cells.find(code, index + 1)
+        return found
+
+    def row(self, row: int) -> memoryview:
+        """Writable zero-copy view of a row's cells (as byte values)."""
+        start = (row + 1) * self.stride + 1
+        return memoryview(self.cells)[start : start + self.width]
+
+    def column(self, col: int) -> memoryview:
+        """Writable zero-copy view of a column's cells (as byte values)."""
+        start = self.stride + col + 1
+        return memoryview(self.cells)[start : start + self.height * self.stride : self.stride]
+
+    def as_array(self):
+        """The cells, border included, as a zero-copy (height + 2, stride) numpy uint8 array."""
+        import numpy as np  # Deferred: only array-based days need it
+
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height + 2, self.stride)
+
+    def __str__(self):
+        return "\n".join(self.row(r).tobytes().decode("latin-1") for r in range(self.height))
+
+    def __repr__(self):
+        return f"Grid({self.height}x{self.width})"
+
+
+# Common data structures
+class Point:
+    """An immutable (x, y) point with a cached hash.
+
+    Slots instead of a per-instance __dict__, read-only x and y, and the
+    hash computed once at construction, so set and dict lookups on a Point
+    cost one attribute read. A Point only equals another Point: compared
+    with a tuple or anything else it is unequal, and it has no ordering.
+    """
+
+    __slots__ = ("_x", "_y", "_hash")
+
+    def __init__(self, x: int, y: int):
+        self._x = x
+        self._y = y
+        self._hash = hash((x, y))
+
+    x = property(attrgetter("_x"))
+    y = property(attrgetter("_y"))
+
+    def __reduce__(self):
+        return Point, (self._x, self._y)
+
+    def __add__(self, other):
+        return Point(self._x + other._x, self._y + other._y)
+
+    def __sub__(self, other):
+        return Point(self._x - other._x, self._y - other._y)
+
+    def __eq__(self, other):
+        if other.__class__ is not Point:
+            return NotImplemented
+        return self._x == other._x and self._y == other._y
+
+    def __hash__(self):
+        return self._hash
+
+    def inBounds(self, grid: list[list]) -> bool:
+        """Check if the point is within the bounds of the grid."""
+        return 0 <= self._x < len(grid) and 0 <= self._y < len(grid[0])
+
+    def within(self, x_size: int, y_size: int) -> bool:
+        """inBounds for a grid of x_size rows of y_size cells, sizes computed once."""
+        return 0 <= self._x < x_size and 0 <= self._y < y_size
+
+    def __repr__(self):
+        return f"Point({self._x}, {self._y})"
+
+
+# Allocation-free points
+#
+# Hot loops can skip Point objects altogether: a complex number x + yj adds
+# and hashes as a single value, and so does an int packing y into the low
+# POINT_BITS bits and x above them. Packed points add component-wise as long
+# as y stays within +/- 2**(POINT_BITS - 1).
+POINT_BITS = 32
+_HALF = 1 << (POINT_BITS - 1)
+_MASK = (1 << POINT_BITS) - 1
+
+
+def pack_point(x: int, y: int) -> int:
+    """(x, y) as one int; pack_point(dx, dy) is the matching step."""
+    return (x << POINT_BITS) + y
+
+
+def unpack_point(packed: int) -> tuple[int, int]:
+    """The (x, y) of a pack_point value."""
+    y = ((packed + _HALF) & _MASK) - _HALF
+    return (packed - y) >> POINT_BITS, y
+
+
+def to_complex(x: int, y: int) -> complex:
+    """(x, y) as the complex number x + yj."""
+    return complex(x, y)
+
+
+def from_complex(z: complex) -> tuple[int, int]:
+    """The integer (x, y) of a to_complex value."""
+    return int(z.real), int(z.imag)
@@ -0,0 +1,21 @@
+"""Number theory helpers."""
+
+
+def gcd(a: int, b: int) -> int:
+    """Greatest common divisor."""
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def lcm(a: int, b: int) -> int:
+    """Least common multiple."""
+    return abs(a * b) // gcd(a, b)
+
+
+def lcm_list(numbers: list[int]) -> int:
+    """LCM of a list of numbers."""
+    result = numbers[0]
+    for i in range(1, len(numbers)):
+        result = lcm(result, numbers[i])
+    return result
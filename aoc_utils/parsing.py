@@ -0,0 +1,29 @@
+"""Input parsing helpers."""
+
+
+def parse_ints(text: str) -> list[int]:
+    """Extract all integers from a string."""
+    import re  # Deferred: re (and enum) cost several ms to import
+
+    return [int(x) for x in re.findall(NUMBER_PATTERN, text)]
+
+
+def parse_grid(data: str) -> list[list[str]]:
+    """Parse input into a 2D grid."""
+    return [list(line) for line in data.strip().split("\n")]
+
+
+def parse_blocks(data: str) -> list[str]:
+    """Split input by blank lines."""
+    return data.strip().split("\n\n")
+
+
+def parse_lines(data: str) -> list[str]:
+    """Split input into lines, removing empty lines."""
+    return [line for line in data.strip().split("\n") if line]
+
+
+# Common regex patterns
+EMAIL_PATTERN = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+NUMBER_PATTERN = r"-?\d+"
+WORD_PATTERN = r"\b[A-Za-z]+\b"
@@ -0,0 +1,26 @@
+"""Inclusive integer range helpers."""
+
+
+def range_overlap(r1: tuple[int, int], r2: tuple[int, int]) -> tuple[int, int] | None:
+    """Find overlap between two ranges (inclusive)."""
+    start = max(r1[0], r2[0])
+    end = min(r1[1], r2[1])
+    return (start, end) if start <= end else None
+
+
+def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping ranges."""
+    if not ranges:
+        return []
+
+    ranges.sort()
+    merged = [ranges[0]]
+
+    for current in ranges[1:]:
+        last = merged[-1]
+        if current[0] <= last[1] + 1:  # Overlapping or adjacent
+            merged[-1] = (last[0], max(last[1], current[1]))
+        else:
+            merged.append(current)
+
+    return merged
@@ -0,0 +1,378 @@
+"""Graph search helpers.
+
+heapq and array are imported inside the functions that use them, which keeps
+`from aoc_utils import *` from loading them for solutions that never search.
+"""
+
+from itertools import count
+
+
+class SearchResult:
+    """Distances and parents found by a search, and the goal it stopped at.
+
+    distances and parents are dicts keyed by node for hashable-state searches,
+    or arrays indexed by node (-1 where unreached) for the integer-indexed
+    ones: bfs_indexed uses array('i') for both, dijkstra_indexed array('q')
+    for distances and array('i') for parents. goal is None unless goal_func
+    matched a node.
+    expanded counts the nodes whose neighbours were generated and
+    peak_frontier the largest queue (or heap, stale entries included) seen.
+    """
+
+    __slots__ = ("distances", "parents", "goal", "expanded", "peak_frontier")
+
+    def __init__(self, distances, parents, goal=None):
+        self.distances = distances
+        self.parents = parents
+        self.goal = goal
+        self.expanded = 0
+        self.peak_frontier = 0
+
+    def distance(self, node):
+        """Steps (or cost) from the nearest source to node, or None if not reached."""
+        if isinstance(self.distances, dict):
+            return self.distances.get(node)
+        distance = self.distances[node]
+        return None if distance < 0 else distance
+
+    def reached(self, node) -> bool:
+        return self.distance(node) is not None
+
+    def path(self, node=None):
+        """Nodes from a source to node (default: the goal), or None if not reached."""
+        if node is None:
+            node = self.goal
+        if node is None or not self.reached(node):
+            return None
+        none = None if isinstance(self.parents, dict) else -1
+        path = [node]
+        node = self.parents[node]
+        while node != none:
+            path.append(node)
+            node = self.parents[node]
+        path.reverse()
+        return path
+
+
+def bfs_search(sources, neighbors_func, goal_func=None, max_depth=None) -> SearchResult:
+    """Breadth-first search over hashable nodes from one or more sources.
+
+    Stops at the first node goal_func accepts (the nearest, sources
+    included); nodes max_depth steps out are reached but not expanded.
+    """
+    distances = dict.fromkeys(sources, 0)
+    parents = dict.fromkeys(distances)
+    result = SearchResult(distances, parents)
+    if goal_func:
+        for node in distances:
+            if goal_func(node):
+                result.goal = node
+                return result
+
+    # Expanding one whole level at a time means a node's distance is the
+    # level counter, with no per-node lookups.
+    frontier = list(distances)
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        result.expanded += len(frontier)
+        result.peak_frontier = max(result.peak_frontier, len(frontier))
+        next_frontier = []
+        for node in frontier:
+            for neighbor in neighbors_func(node):
+                if neighbor not in distances:
+                    distances[neighbor] = depth
+                    parents[neighbor] = node
+                    if goal_func and goal_func(neighbor):
+                        result.goal = neighbor
+                        return result
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return result
+
+
+def bfs_indexed(size, sources, neighbors_func, goal_func=None, max_depth=None) -> SearchResult:
+    """bfs_search over nodes numbered 0..size-1, e.g. Grid cell indices.
+
+    Distances and parents live in preallocated array('i') buffers instead of
+    dicts, which is both smaller and faster for dense graphs.
+    """
+    from array import array
+
+    distances = array("i", [-1]) * size
+    parents = array("i", [-1]) * size
+    result = SearchResult(distances, parents)
+    frontier = []
+    for node in sources:
+        if distances[node] < 0:
+            distances[node] = 0
+            frontier.append(node)
+            if goal_func and goal_func(node):
+                result.goal = node
+                return result
+
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        result.expanded += len(frontier)
+        result.peak_frontier = max(result.peak_frontier, len(frontier))
+        next_frontier = []
+        for node in frontier:
+            for neighbor in neighbors_func(node):
+                if distances[neighbor] < 0:
+                    distances[neighbor] = depth
+                    parents[neighbor] = node
+                    if goal_func and goal_func(neighbor):
+                        result.goal = neighbor
+                        return result
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return result
+
+
+def _cheapest_first(result, heap, neighbors_func, goal_func, heuristic, max_cost):
+    """The Dijkstra/A* loop shared by the hashable and indexed variants.
+
+    Heap entries are (cost + heuristic, cost, tiebreak, node). A node whose
+    cost improves is pushed again rather than updated in place, and entries
+    whose cost is above the node's best are skipped when popped.
+    """
+    from heapq import heappop, heappush
+
+    distances, parents = result.distances, result.parents
+    indexed = not isinstance(distances, dict)
+    tiebreak = count(len(heap))
+    while heap:
+        _, cost, _, node = heappop(heap)
+        if cost > distances[node]:
+            continue  # Stale entry
+        if goal_func and goal_func(node):
+            result.goal = node
+            break
+        result.expanded += 1
+        for neighbor, step in neighbors_func(node):
+            new_cost = cost + step
+            if max_cost is not None and new_cost > max_cost:
+                continue
+            known = distances[neighbor] if indexed else distances.get(neighbor, -1)
+            if known < 0 or new_cost < known:
+                distances[neighbor] = new_cost
+                parents[neighbor] = node
+                priority = new_cost + heuristic(neighbor) if heuristic else new_cost
+                heappush(heap, (priority, new_cost, next(tiebreak), neighbor))
+        if len(heap) > result.peak_frontier:
+            result.peak_frontier = len(heap)
+    return result
+
+
+def dijkstra(sources, neighbors_func, goal_func=None, heuristic=None, max_cost=None):
+    """Cheapest paths over hashable nodes from one or more sources.
+
+    neighbors_func(node) yields (neighbor, step cost) pairs with non-negative
+    costs. Stops when goal_func accepts a popped node, whose distance is then
+    final (other nodes' distances are upper bounds until popped); nodes
+    costing more than max_cost are not reached. heuristic(node),
+    if given, turns this into A* and must never overestimate the remaining
+    cost to a goal. Returns a SearchResult.
+    """
+    from heapq import heapify
+
+    distances = dict.fromkeys(sources, 0)
+    parents = dict.fromkeys(distances)
+    heap = [
+        (heuristic(node) if heuristic else 0, 0, i, node)
+        for i, node in enumerate(distances)
+    ]
+    heapify(heap)
+    result = SearchResult(distances, parents)
+    result.peak_frontier = len(heap)
+    return _cheapest_first(result, heap, neighbors_func, goal_func, heuristic, max_cost)
+
+
+def dijkstra_indexed(
+    size, sources, neighbors_func, goal_func=None, heuristic=None, max_cost=None
+):
+    """dijkstra over nodes numbered 0..size-1, e.g. Grid cell indices.
+
+    Costs must be integers: distances live in an array('q') buffer (-1 where
+    unreached) and parents in an array('i').
+    """
+    from array import array
+    from heapq import heapify
+
+    distances = array("q", [-1]) * size
+    parents = array("i", [-1]) * size
+    heap = []
+    for node in sources:
+        if distances[node] < 0:
+            distances[node] = 0
+            heap.append((heuristic(node) if heuristic else 0, 0, len(heap), node))
+    heapify(heap)
+    result = SearchResult(distances, parents)
+    result.peak_frontier = len(heap)
+    return _cheapest_first(result, heap, neighbors_func, goal_func, heuristic, max_cost)
+
+
+def astar(sources, neighbors_func, goal_func, heuristic, max_cost=None):
+    """A* search: dijkstra guided by an admissible heuristic."""
+    return dijkstra(sources, neighbors_func, goal_func, heuristic, max_cost)
+
+
+def bfs(start, neighbors_func, goal_func=None):
+    """Generic BFS implementation.
+
+    Returns (goal, distance) when goal_func matches a node, otherwise
+    (visited, distances); bfs_search returns a SearchResult either way.
+    """
+    result = bfs_search([start], neighbors_func, goal_func)
+    if goal_func and result.goal is not None:
+        return result.goal, result.distances[result.goal]
+    return set(result.distances), result.distances
+
+
+def dfs_walk(sources, neighbors_func, order="pre", max_depth=None, paths=False, visited=None):
+    """Yield nodes reachable from sources depth-first, lazily.
+
+    order is "pre" (a node before anything reached through it) or "post" (a
+    node after everything reached through it). Nodes max_depth steps from
+    their source are visited but not expanded. With paths=True, yields
+    (node, path) pairs, path being the tuple of nodes from the source.
+    Nodes already in visited are skipped; every node walked is added to it.
+
+    The stack holds one neighbour iterator per node on the current path, so
+    depth is not limited by the recursion limit.
+    """
+    if order not in ("pre", "post"):
+        raise ValueError(f"order must be 'pre' or 'post', not {order!r}")
+    pre = order == "pre"
+    if visited is None:
+        visited = set()
+    nothing = iter(())
+
+    for source in sources:
+        if source in visited:
+            continue
+        visited.add(source)
+        path = [source]
+        if pre:
+            yield (source, tuple(path)) if paths else source
+        expand = max_depth is None or max_depth > 0
+        stack = [iter(neighbors_func(source)) if expand else nothing]
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    path.append(neighbor)
+                    if pre:
+                        yield (neighbor, tuple(path)) if paths else neighbor
+                    expand = max_depth is None or len(path) <= max_depth
+                    stack.append(iter(neighbors_func(neighbor)) if expand else nothing)
+                    break
+            else:
+                stack.pop()
+                if not pre:
+                    yield (path[-1], tuple(path)) if paths else path[-1]
+                path.pop()
+
+
+def iddfs(start, neighbors_func, goal_func, max_depth):
+    """Fewest-steps path from start to a node goal_func accepts, or None.
+
+    Iterative deepening: depth-limited DFS with limits 0..max_depth. Each
+    round remembers the shallowest depth it reached every node at and only
+    revisits a node along a shorter path. Stops early once a round is not
+    cut short by its limit.
+    """
+    for limit in range(max_depth + 1):
+        depths = {start: 0}
+        path = [start]
+        stack = [iter(neighbors_func(start))] if limit else []
+        cut = limit == 0
+        if goal_func(start):
+            return path
+        while stack:
+            for neighbor in stack[-1]:
+                depth = len(path)
+                if depths.get(neighbor, depth + 1) > depth:
+                    depths[neighbor] = depth
+                    path.append(neighbor)
+                    if goal_func(neighbor):
+                        return path
+                    if depth < limit:
+                        stack.append(iter(neighbors_func(neighbor)))
+                    else:
+                        cut = True
+                        path.pop()
+                        continue
+                    break
+            else:
+                stack.pop()
+                path.pop()
+        if not cut:
+            return None
+    return None
+
+
+def _directed_postorder(sources, neighbors_func):
+    """(post-order, None) for a directed graph, or (partial order, cycle)."""
+    on_path = {}  # node -> True while on the current path, False once finished
+    order = []
+    for source in sources:
+        if source in on_path:
+            continue
+        on_path[source] = True
+        path = [source]
+        stack = [iter(neighbors_func(source))]
+        while stack:
+            for neighbor in stack[-1]:
+                state = on_path.get(neighbor)
+                if state is None:
+                    on_path[neighbor] = True
+                    path.append(neighbor)
+                    stack.append(iter(neighbors_func(neighbor)))
+                    break
+                if state:
+                    return order, path[path.index(neighbor) :]
+            else:
+                stack.pop()
+                node = path.pop()
+                on_path[node] = False
+                order.append(node)
+    return order, None
+
+
+def find_cycle(sources, neighbors_func):
+    """A directed cycle reachable from sources, as a list of nodes, or None.
+
+    Unlike a visited set, this tells a back edge (into the current path)
+    from an edge into an already finished part of the graph.
+    """
+    return _directed_postorder(sources, neighbors_func)[1]
+
+
+def topological_order(sources, neighbors_func):
+    """Nodes reachable from sources, each before all nodes it points to.
+
+    Raises ValueError if the graph has a cycle.
+    """
+    order, cycle = _directed_postorder(sources, neighbors_func)
+    if cycle is not None:
+        raise ValueError(f"Graph has a cycle: {cycle}")
+    order.reverse()
+    return order
+
+
+def dfs(start, neighbors_func, goal_func=None, visited=None):
+    """Generic DFS implementation.
+
+    Returns the first node in pre-order that goal_func accepts, or None.
+    Neighbours already in visited are skipped, and visited collects every
+    node walked.
+    """
+    if visited is None:
+        visited = set()
+    visited.discard(start)
+    for node in dfs_walk([start], neighbors_func, visited=visited):
+        if goal_func and goal_func(node):
+            return node
+    return None
@@ -0,0 +1,124 @@
+"""Timing and tracing."""
+
+import time
+from collections import namedtuple
+from functools import wraps
+
+
+class Span(namedtuple("Span", "name path depth start_ns duration_ns")):
+    """One timed region; path is the slash-joined names of its enclosing spans."""
+
+    __slots__ = ()
+
+
+class Tracer:
+    """Per-run registry of nested timing spans.
+
+    Disabled by default, in which case span() and @traced cost one attribute
+    check. run.py and perf.py enable it around each part to split parse time
+    from solve time.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.spans: list[Span] = []
+        self._stack: list[str] = []
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.spans = []
+        self._stack = []
+
+    def span(self, name: str):
+        """Context manager timing a region as a child of the current span."""
+        if not self.enabled:
+            return _NO_SPAN
+        return _ActiveSpan(self, name)
+
+    def total_ns(self, name: str) -> int:
+        """Time spent in spans called `name`, not double counting nested ones."""
+        return sum(
+            s.duration_ns
+            for s in self.spans
+            if s.name == name and name not in s.path.split("/")[:-1]
+        )
+
+
+class _ActiveSpan:
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer: Tracer, name: str):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.tracer._stack.append(self.name)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        duration = time.perf_counter_ns() - self.start
+        stack = self.tracer._stack
+        self.tracer.spans.append(
+            Span(self.name, "/".join(stack), len(stack) - 1, self.start, duration)
+        )
+        stack.pop()
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+TRACER = Tracer()
+
+
+def span(name: str):
+    """Time a block as a span in the global tracer (no-op unless enabled)."""
+    return TRACER.span(name)
+
+
+def traced(func=None, *, name: str | None = None):
+    """Decorator recording each call of func as a span in the global tracer."""
+
+    def decorate(func):
+        span_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            with _ActiveSpan(TRACER, span_name):
+                return func(*args, **kwargs)
+
+        wrapper.__traced__ = True
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+
+def timer(func):
+    """Decorator to time function execution (also recorded as a span)."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        with TRACER.span(func.__name__):
+            result = func(*args, **kwargs)
+        end = time.perf_counter()
+        print(f"{func.__name__} took {end - start:.4f} seconds")
+        return result
+
+    return wrapper
@@ -3,74 +3,498 @@
 Advent of Code Performance Analysis
 Track and compare solution performance across days and years.
 """
+import gc
 import json
+import math
+import multiprocessing
 import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
 import subprocess
+import sys
+import tempfile
+import threading
 import time
-from collections import defaultdict
+import urllib.request
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
+from run import (
+    REPO_DIR,
+    DayManifest,
+    MemoryResult,
+    ResultCache,
+    find_solution_file,
+    format_bytes,
+    load_solution,
+    measure_memory_isolated,
+    print_memory_result,
+    read_input,
+    results_from_output,
+    run_part_in_process,
+    solution_env,
+    solution_fingerprint,
+)
+
+# How a runtime was measured: a fresh `python3` per call, or calls into a
+# module imported once. The two differ by interpreter startup, so best times,
+# baselines and regression checks only ever compare runs of the same mode.
+SUBPROCESS = "subprocess"
+IN_PROCESS = "in-process"
+
+
+def benchmark_mode(in_process=False, parse_cache=False, **options):
+    """The mode benchmark_parts measures in with these options."""
+    return IN_PROCESS if in_process or parse_cache else SUBPROCESS
+
+
+# Name measurements are recorded under; AOC_HOST overrides it where hostnames
+# are not stable (containers) or to tell several workers on one machine apart.
+HOST = os.environ.get("AOC_HOST") or platform.node() or "localhost"
+
+
+def host_info():
+    """Hardware and interpreter details stored with a host's measurements."""
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.platform(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
 
 class PerformanceTracker:
-    def __init__(self, data_file="performance.json"):
+    """Performance history stored in an indexed SQLite database.
+
+    Every measurement is a single INSERT, and lookups by (year, day, part)
+    go through indexes, so recording and summarising stay cheap however much
+    history accumulates. Both live at the repo root, next to run.py's result
+    cache, whatever directory perf.py runs from. An existing performance.json
+    is imported on first use.
+
+    Measurements carry the host they were taken on, and lookups only ever see
+    one host's rows (this machine's unless another is named), so timings from
+    different hardware are never compared. Rows from before hosts were
+    recorded count as this machine's.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS measurements (
+            id INTEGER PRIMARY KEY,
+            year INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            part INTEGER NOT NULL,
+            timestamp TEXT NOT NULL,
+            runtime REAL NOT NULL,
+            result TEXT
+        );
+        CREATE INDEX IF NOT EXISTS measurements_by_time
+            ON measurements (year, day, part, timestamp);
+        CREATE INDEX IF NOT EXISTS measurements_by_runtime
+            ON measurements (year, day, part, runtime);
+        CREATE TABLE IF NOT EXISTS baselines (
+            year INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            part INTEGER NOT NULL,
+            mode TEXT NOT NULL,
+            runtime REAL NOT NULL,
+            loops INTEGER,
+            stats TEXT,
+            timestamp TEXT NOT NULL,
+            PRIMARY KEY (year, day, part, mode)
+        );
+        CREATE TABLE IF NOT EXISTS hosts (
+            host TEXT PRIMARY KEY,
+            info TEXT NOT NULL,
+            last_seen TEXT NOT NULL
+        );
+    """
+
+    # Columns added after the initial schema; created on open if missing.
+    # JSON columns hold a dict per measurement.
+    EXTRA_COLUMNS = {
+        "stats": "TEXT",
+        "memory": "TEXT",
+        "parse_time": "REAL",
+        "solve_time": "REAL",
+        "cached_time": "REAL",
+        "cached_parse_time": "REAL",
+        "verified": "INTEGER",
+        "commit_sha": "TEXT",
+        "user_time": "REAL",
+        "sys_time": "REAL",
+        "max_rss_kb": "INTEGER",
+        "vol_ctx_switches": "INTEGER",
+        "invol_ctx_switches": "INTEGER",
+        "major_faults": "INTEGER",
+        "minor_faults": "INTEGER",
+        "host": "TEXT",
+        "mode": "TEXT",
+        "loops": "INTEGER",
+    }
+    JSON_COLUMNS = ("stats", "memory")
+
+    def __init__(
+        self,
+        data_file=REPO_DIR / "performance.db",
+        legacy_file=REPO_DIR / "performance.json",
+        host=HOST,
+    ):
         self.data_file = data_file
-        self.data = self.load_data()
+        self.host = host
+        self.conn = sqlite3.connect(data_file)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+        self._add_missing_columns()
+        self._add_baseline_modes()
+        self.register_host(host, host_info())
+        if legacy_file and os.path.exists(legacy_file):
+            self.migrate_json(legacy_file)
 
-    def load_data(self):
-        """Load existing performance data."""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r") as f:
-                    return json.load(f)
-            except:
-                pass
-        return {}
-
-    def save_data(self):
-        """Save performance data to file."""
-        with open(self.data_file, "w") as f:
-            json.dump(self.data, f, indent=2)
-
-    def record_performance(self, year, day, part, runtime, result=None):
-        """Record a performance measurement."""
-        key = f"{year}-{day}"
-        if key not in self.data:
-            self.data[key] = {}
-
-        if f"part_{part}" not in self.data[key]:
-            self.data[key][f"part_{part}"] = []
-
-        entry = {
+    def close(self):
+        self.conn.close()
+
+    def _add_missing_columns(self):
+        existing = {row["name"] for row in self.conn.execute("PRAGMA table_info(measurements)")}
+        with self.conn:
+            for name, sql_type in self.EXTRA_COLUMNS.items():
+                if name not in existing:
+                    self.conn.execute(f"ALTER TABLE measurements ADD COLUMN {name} {sql_type}")
+            if "mode" not in existing:
+                # Only in-process runs record the parse/solve split.
+                self.conn.execute(
+                    "UPDATE measurements SET mode = CASE WHEN solve_time IS NULL"
+                    " THEN ? ELSE ? END",
+                    (SUBPROCESS, IN_PROCESS),
+                )
+            if "loops" not in existing:
+                self.conn.execute(
+                    "UPDATE measurements SET loops = json_extract(stats, '$.loops')"
+                    " WHERE stats IS NOT NULL"
+                )
+
+    def _add_baseline_modes(self):
+        """Rebuild a baselines table from before modes, keyed by mode too.
+
+        An old pin takes the mode of a measurement with the same runtime.
+        """
+        existing = {row["name"] for row in self.conn.execute("PRAGMA table_info(baselines)")}
+        if "mode" in existing:
+            if "stats" not in existing:
+                with self.conn:
+                    self.conn.execute("ALTER TABLE baselines ADD COLUMN stats TEXT")
+            return
+        with self.conn:
+            self.conn.execute("ALTER TABLE baselines RENAME TO old_baselines")
+            self.conn.executescript(self.SCHEMA)
+            self.conn.execute(
+                "INSERT INTO baselines (year, day, part, mode, runtime, loops, stats, timestamp)"
+                " SELECT b.year, b.day, b.part, COALESCE(m.mode, ?), b.runtime, m.loops,"
+                " m.stats, b.timestamp FROM old_baselines b LEFT JOIN measurements m"
+                " ON m.id = (SELECT id FROM measurements WHERE year = b.year AND day = b.day"
+                " AND part = b.part AND runtime = b.runtime LIMIT 1)",
+                (SUBPROCESS,),
+            )
+            self.conn.execute("DROP TABLE old_baselines")
+
+    def _host_filter(self, host=None):
+        """SQL condition and parameters selecting one host's measurements."""
+        host = host or self.host
+        if host == self.host:
+            return "(host = ? OR host IS NULL)", [host]
+        return "host = ?", [host]
+
+    def register_host(self, host, info):
+        """Store (or refresh) the hardware details of a host."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO hosts (host, info, last_seen) VALUES (?, ?, ?)",
+                (host, json.dumps(info, sort_keys=True), datetime.now().isoformat()),
+            )
+
+    def get_hosts(self):
+        """{host: info} for every host that has used this database."""
+        return {
+            row["host"]: json.loads(row["info"])
+            for row in self.conn.execute("SELECT host, info FROM hosts ORDER BY host")
+        }
+
+    def migrate_json(self, json_file):
+        """Import a legacy performance.json and rename it so it is only imported once."""
+        try:
+            with open(json_file, "r") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Could not migrate {json_file}: {e}")
+            return 0
+
+        rows = []
+        for key, day_data in data.items():
+            year, day = (int(x) for x in key.split("-"))
+            for part_key, measurements in day_data.items():
+                part = int(part_key.split("_")[1])
+                for m in measurements:
+                    result = m.get("result")
+                    rows.append(
+                        (
+                            year,
+                            day,
+                            part,
+                            m["timestamp"],
+                            m["runtime"],
+                            None if result is None else str(result),
+                        )
+                    )
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO measurements (year, day, part, timestamp, runtime, result)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        os.replace(json_file, f"{json_file}.migrated")
+        print(f"Migrated {len(rows)} measurements from {json_file}")
+        return len(rows)
+
+    def record_benchmark(self, year, day, part, part_data):
+        """Record one part's benchmark_parts() entry."""
+        extra = {
+            name: part_data[name] for name in self.EXTRA_COLUMNS if name in part_data
+        }
+        self.record_performance(
+            year, day, part, part_data["best_time"], part_data["result"], **extra
+        )
+
+    def record_performance(self, year, day, part, runtime, result=None, **extra):
+        """Record a performance measurement.
+
+        Keyword arguments fill the EXTRA_COLUMNS, e.g. stats=BenchmarkStats.as_dict();
+        host defaults to the tracker's own and mode to SUBPROCESS.
+        """
+        unknown = set(extra) - set(self.EXTRA_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown measurement fields: {sorted(unknown)}")
+        row = {
+            "year": year,
+            "day": day,
+            "part": part,
             "timestamp": datetime.now().isoformat(),
             "runtime": runtime,
-            "result": result,
+            "result": None if result is None else str(result),
+            "host": self.host,
+            "mode": SUBPROCESS,
         }
+        for name, value in extra.items():
+            if name in self.JSON_COLUMNS and value is not None:
+                value = json.dumps(value)
+            row[name] = value
+        columns = ", ".join(row)
+        placeholders = ", ".join("?" for _ in row)
+        with self.conn:
+            self.conn.execute(
+                f"INSERT INTO measurements ({columns}) VALUES ({placeholders})",
+                list(row.values()),
+            )
+
+    def _decode(self, row):
+        entry = dict(row)
+        for name in self.JSON_COLUMNS:
+            if entry.get(name):
+                entry[name] = json.loads(entry[name])
+        return entry
+
+    def get_history(self, year, day, part, since=None, host=None):
+        """Measurements for one part in timestamp order, optionally since an ISO time."""
+        host_sql, params = self._host_filter(host)
+        query = (
+            "SELECT * FROM measurements"
+            f" WHERE year = ? AND day = ? AND part = ? AND {host_sql}"
+        )
+        params = [year, day, part, *params]
+        if since:
+            query += " AND timestamp >= ?"
+            params.append(since)
+        query += " ORDER BY timestamp"
+        return [self._decode(row) for row in self.conn.execute(query, params)]
 
-        self.data[key][f"part_{part}"].append(entry)
-        self.save_data()
+    def get_best_times(self, year=None, host=None, mode=None):
+        """Get best times for each problem, of one mode if given."""
+        host_sql, params = self._host_filter(host)
+        query = f"SELECT year, day, part, MIN(runtime) AS best FROM measurements WHERE {host_sql}"
+        if year:
+            query += " AND year = ?"
+            params.append(year)
+        if mode:
+            query += " AND mode = ?"
+            params.append(mode)
+        query += " GROUP BY year, day, part"
 
-    def get_best_times(self, year=None):
-        """Get best times for each problem."""
         results = {}
-        for key, day_data in self.data.items():
-            year_day, day_num = key.split("-")
-            if year and int(year_day) != year:
-                continue
+        for row in self.conn.execute(query, params):
+            key = f"{row['year']}-{row['day']}"
+            results.setdefault(key, {})[f"part_{row['part']}"] = row["best"]
+
+        return results
+
+    def get_latest_usage(self, year=None, host=None, mode=None):
+        """Resource usage of the most recent measurement that has it, per part.
 
-            results[key] = {}
-            for part, measurements in day_data.items():
-                if measurements:
-                    best_time = min(m["runtime"] for m in measurements)
-                    results[key][part] = best_time
+        Keyed like get_best_times; values are ResourceUsage with the
+        measurement's runtime as wall time.
+        """
+        names = [n for n in ResourceUsage.__dataclass_fields__ if n != "wall_time"]
+        host_sql, params = self._host_filter(host)
+        if mode:
+            host_sql += " AND mode = ?"
+            params.append(mode)
+        query = (
+            f"SELECT year, day, part, runtime, {', '.join(names)} FROM measurements"
+            " WHERE id IN (SELECT MAX(id) FROM measurements WHERE user_time IS NOT NULL"
+            f" AND {host_sql} GROUP BY year, day, part)"
+        )
+        if year:
+            query += " AND year = ?"
+            params.append(year)
+
+        results = {}
+        for row in self.conn.execute(query, params):
+            key = f"{row['year']}-{row['day']}"
+            usage = ResourceUsage.from_columns(row["runtime"], dict(row))
+            results.setdefault(key, {})[f"part_{row['part']}"] = usage
+        return results
+
+    def get_latest_memory(self, year=None, host=None):
+        """Most recent memory record per part, keyed like get_best_times."""
+        host_sql, params = self._host_filter(host)
+        query = (
+            "SELECT year, day, part, memory FROM measurements WHERE id IN"
+            f" (SELECT MAX(id) FROM measurements WHERE memory IS NOT NULL AND {host_sql}"
+            " GROUP BY year, day, part)"
+        )
+        if year:
+            query += " AND year = ?"
+            params.append(year)
+
+        results = {}
+        for row in self.conn.execute(query, params):
+            key = f"{row['year']}-{row['day']}"
+            results.setdefault(key, {})[f"part_{row['part']}"] = json.loads(row["memory"])
+
+        return results
+
+    def pin_baseline(self, year, day, part, runtime, mode=SUBPROCESS, loops=None, stats=None):
+        """Pin a runtime (and its stats) as the mode's reference for --check.
+
+        Replaces any earlier pin of the part in that mode.
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO baselines"
+                " (year, day, part, mode, runtime, loops, stats, timestamp)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    year,
+                    day,
+                    part,
+                    mode,
+                    runtime,
+                    loops,
+                    None if stats is None else json.dumps(stats),
+                    datetime.now().isoformat(),
+                ),
+            )
+
+    def _latest_rows(self, year=None, day=None, host=None, mode=SUBPROCESS):
+        """This host's most recent measurement of each selected part in mode."""
+        host_sql, params = self._host_filter(host)
+        query = (
+            "SELECT * FROM measurements WHERE id IN (SELECT MAX(id) FROM measurements"
+            f" WHERE {host_sql} AND mode = ? GROUP BY year, day, part)"
+        )
+        params.append(mode)
+        if year:
+            query += " AND year = ?"
+            params.append(year)
+        if day:
+            query += " AND day = ?"
+            params.append(day)
+        return [self._decode(row) for row in self.conn.execute(query, params)]
+
+    def pin_latest(self, year=None, day=None, mode=SUBPROCESS):
+        """Pin this host's latest measurement of each selected part in mode.
+
+        Returns the number of parts pinned.
+        """
+        rows = self._latest_rows(year, day, mode=mode)
+        for row in rows:
+            self.pin_baseline(
+                row["year"], row["day"], row["part"], row["runtime"], mode, row["loops"],
+                row["stats"],
+            )
+        return len(rows)
+
+    def get_baselines(self, year=None, mode=SUBPROCESS):
+        """Pinned baselines of one mode.
+
+        Same {"year-day": {"part_N": runtime}} shape as get_best_times.
+        """
+        query = "SELECT year, day, part, runtime FROM baselines WHERE mode = ?"
+        params = [mode]
+        if year:
+            query += " AND year = ?"
+            params.append(year)
+
+        results = {}
+        for row in self.conn.execute(query, params):
+            key = f"{row['year']}-{row['day']}"
+            results.setdefault(key, {})[f"part_{row['part']}"] = row["runtime"]
 
         return results
 
-    def print_summary(self, year=None):
-        """Print a summary of performance data."""
-        best_times = self.get_best_times(year)
+    def get_estimates(self, year=None, mode=SUBPROCESS, source="pinned", host=None):
+        """Estimates of each part's runtime, keyed like get_best_times.
 
-        print(f"Performance Summary{' for ' + str(year) if year else ''}")
+        source is "pinned" for the mode's pinned baselines or "latest" for
+        the host's most recent measurement in that mode.
+        """
+        if source == "pinned":
+            query = "SELECT * FROM baselines WHERE mode = ?"
+            params = [mode]
+            if year:
+                query += " AND year = ?"
+                params.append(year)
+            rows = [self._decode(row) for row in self.conn.execute(query, params)]
+        else:
+            rows = self._latest_rows(year, host=host, mode=mode)
+
+        results = {}
+        for row in rows:
+            key = f"{row['year']}-{row['day']}"
+            estimate = Estimate.from_stats(row["stats"], row["runtime"])
+            results.setdefault(key, {})[f"part_{row['part']}"] = estimate
+        return results
+
+    def print_summary(self, year=None, host=None, mode=SUBPROCESS):
+        """Print a summary of one host's performance data in one mode."""
+        best_times = self.get_best_times(year, host, mode)
+        memory = self.get_latest_memory(year, host)
+        usages = self.get_latest_usage(year, host, mode)
+        memory_bound = []
+
+        print(
+            f"Performance Summary{' for ' + str(year) if year else ''}"
+            f" on {host or self.host} ({mode})"
+        )
         print("=" * 50)
 
         total_time = 0
@@ -85,7 +509,22 @@ class PerformanceTracker:
                 if part in best_times[key]:
                     runtime = best_times[key][part]
                     day_total += runtime
-                    print(f"  {part}: {runtime:.4f}s")
+                    line = f"  {part}: {runtime:.4f}s"
+                    part_memory = memory.get(key, {}).get(part)
+                    if part_memory:
+                        rss = part_memory["maxrss_kb"]
+                        line += f"  peak {format_bytes(part_memory['peak_bytes'])}"
+                        line += f", max RSS {format_bytes(rss * 1024 if rss else None)}"
+                    usage = usages.get(key, {}).get(part)
+                    if usage:
+                        line += f"  cpu/wall {usage.cpu_ratio:.2f}"
+                        if usage.memory_bound:
+                            line += (
+                                f"  MEMORY-BOUND ({usage.major_faults} major,"
+                                f" {usage.minor_faults} minor faults)"
+                            )
+                            memory_bound.append(f"{year_day} day {day_num} {part}")
+                    print(line)
                     problem_count += 1
 
             if day_total > 0:
@@ -97,59 +536,1257 @@ class PerformanceTracker:
             print(f"  Total problems solved: {problem_count}")
             print(f"  Total runtime: {total_time:.4f}s")
             print(f"  Average per problem: {total_time/problem_count:.4f}s")
+        if memory_bound:
+            print(f"  Memory-bound (heavy paging): {', '.join(memory_bound)}")
+        others = [h for h in self.get_hosts() if h != (host or self.host)]
+        if others:
+            print(f"\nOther hosts (see --host): {', '.join(others)}")
+
+
+# Benchmark engine
+#
+# A bare min/avg over a handful of wall-clock runs cannot separate a 5% win
+# from scheduler noise. Each variant gets warmup calls, an inner loop count
+# scaled like timeit.autorange, runs interleaved with the other variants so
+# drift hits them all equally, and a median/IQR/bootstrap-CI summary.
+
+
+@dataclass
+class BenchmarkStats:
+    """Summary statistics over per-call times (seconds)."""
+
+    samples: list
+    loops: int = 1
+    warmup: int = 0
+    gc_disabled: bool = False
+    confidence: float = 0.95
+    best: float = 0.0
+    mean: float = 0.0
+    median: float = 0.0
+    iqr: float = 0.0
+    ci_low: float = 0.0
+    ci_high: float = 0.0
+
+    @classmethod
+    def from_samples(cls, samples, confidence=0.95, **kwargs):
+        stats = cls(list(samples), confidence=confidence, **kwargs)
+        stats.best = min(samples)
+        stats.mean = statistics.fmean(samples)
+        stats.median = statistics.median(samples)
+        if len(samples) > 1:
+            q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+            stats.iqr = q3 - q1
+        stats.ci_low, stats.ci_high = bootstrap_ci(samples, confidence=confidence)
+        return stats
+
+    def as_dict(self):
+        return asdict(self)
+
+    def describe(self):
+        pct = int(self.confidence * 100)
+        return (
+            f"median {self.median:.6f}s (IQR {self.iqr:.6f}s, "
+            f"{pct}% CI {self.ci_low:.6f}-{self.ci_high:.6f}s, "
+            f"{len(self.samples)}x{self.loops} loops)"
+        )
+
+
+def bootstrap_ci(samples, stat=statistics.median, confidence=0.95, resamples=2000, seed=0):
+    """Percentile bootstrap confidence interval for a statistic of the samples."""
+    if len(samples) < 2:
+        return samples[0], samples[0]
+    rng = random.Random(seed)
+    n = len(samples)
+    estimates = sorted(stat(rng.choices(samples, k=n)) for _ in range(resamples))
+    tail = (1 - confidence) / 2
+    low = estimates[int(tail * (resamples - 1))]
+    high = estimates[int((1 - tail) * (resamples - 1))]
+    return low, high
+
+
+@dataclass
+class Estimate:
+    """A part's typical runtime: a median and its confidence interval."""
+
+    median: float
+    ci_low: float
+    ci_high: float
+
+    @classmethod
+    def from_stats(cls, stats, runtime):
+        """From a stored BenchmarkStats dict; a bare runtime for older rows."""
+        if not stats or "median" not in stats:
+            return cls(runtime, runtime, runtime)
+        return cls(stats["median"], stats["ci_low"], stats["ci_high"])
+
+    def overlaps(self, other):
+        return self.ci_low <= other.ci_high and other.ci_low <= self.ci_high
+
+
+def _run_timed(func, number=1):
+    """Call func number times; returns (last result, total seconds).
+
+    A func marked self_timed returns (result, seconds) for just the work it
+    timed itself, e.g. the traced span of an in-process part, so the harness
+    around that work stays out of the sample.
+    """
+    if getattr(func, "self_timed", False):
+        total = 0.0
+        for _ in range(number):
+            result, seconds = func()
+            total += seconds
+        return result, total
+    start = time.perf_counter()
+    for _ in range(number):
+        result = func()
+    return result, time.perf_counter() - start
 
 
-def benchmark_solution(solution_file, runs=3):
+def autorange(func, min_time=0.2):
+    """Smallest loop count in 1, 2, 5, 10, 20, 50... taking at least min_time."""
+    loops = 1
+    while True:
+        for factor in (1, 2, 5):
+            number = loops * factor
+            if _run_timed(func, number)[1] >= min_time:
+                return number
+        loops *= 10
+
+
+def measure_variants(variants, repeat=5, warmup=1, min_time=0.0, disable_gc=False):
+    """Time each callable in `variants` (name -> func), interleaving their runs.
+
+    Returns (stats, results, errors): BenchmarkStats and the last return value
+    per variant, and the exception message for variants that raised (those are
+    dropped from the remaining rounds).
+    """
+    results, errors, loops = {}, {}, {}
+    for name, func in variants.items():
+        try:
+            for _ in range(warmup):
+                results[name] = _run_timed(func)[0]
+            loops[name] = autorange(func, min_time) if min_time > 0 else 1
+        except Exception as e:
+            errors[name] = str(e)
+
+    samples = {name: [] for name in loops}
+    gc_was_enabled = gc.isenabled()
+    for round_num in range(repeat):
+        names = [n for n in loops if n not in errors]
+        if not names:
+            break
+        # Rotate the starting variant each round so none always goes first.
+        shift = round_num % len(names)
+        for name in names[shift:] + names[:shift]:
+            func, number = variants[name], loops[name]
+            if disable_gc:
+                gc.collect()
+                gc.disable()
+            try:
+                results[name], elapsed = _run_timed(func, number)
+            except Exception as e:
+                errors[name] = str(e)
+                continue
+            finally:
+                if disable_gc and gc_was_enabled:
+                    gc.enable()
+            samples[name].append(elapsed / number)
+
+    stats = {
+        name: BenchmarkStats.from_samples(
+            times, loops=loops[name], warmup=warmup, gc_disabled=disable_gc
+        )
+        for name, times in samples.items()
+        if times and name not in errors
+    }
+    return stats, results, errors
+
+
+# Resource accounting
+#
+# Wall time alone mixes CPU-bound solving with paging and scheduler waits.
+# Subprocess runs are reaped with os.wait4, which returns the child's own
+# getrusage figures; in-process runs take getrusage(RUSAGE_SELF) deltas
+# (max RSS there is the harness process's peak). The figures of the fastest
+# call are recorded next to its runtime.
+
+
+@dataclass
+class ResourceUsage:
+    """getrusage(2) figures of one run; times in seconds, max RSS in KiB."""
+
+    wall_time: float
+    user_time: float
+    sys_time: float
+    max_rss_kb: int
+    vol_ctx_switches: int
+    invol_ctx_switches: int
+    major_faults: int
+    minor_faults: int
+
+    # Thresholds for memory_bound.
+    MAJOR_FAULTS = 10
+    MINOR_FAULTS = 10_000
+    SYS_SHARE = 0.3
+
+    @classmethod
+    def from_rusage(cls, wall_time, rusage, before=None):
+        """Build from a struct_rusage, as a delta from `before` if given."""
+
+        def delta(name):
+            value = getattr(rusage, name)
+            return value - getattr(before, name) if before else value
+
+        maxrss = rusage.ru_maxrss
+        return cls(
+            wall_time=wall_time,
+            user_time=delta("ru_utime"),
+            sys_time=delta("ru_stime"),
+            # ru_maxrss is in bytes on macOS and KiB on Linux.
+            max_rss_kb=maxrss // 1024 if sys.platform == "darwin" else maxrss,
+            vol_ctx_switches=delta("ru_nvcsw"),
+            invol_ctx_switches=delta("ru_nivcsw"),
+            major_faults=delta("ru_majflt"),
+            minor_faults=delta("ru_minflt"),
+        )
+
+    @property
+    def cpu_ratio(self):
+        """CPU time over wall time; well below 1 means the run mostly waited."""
+        cpu = self.user_time + self.sys_time
+        return cpu / self.wall_time if self.wall_time > 0 else 0.0
+
+    @property
+    def memory_bound(self):
+        """Heavy paging: major faults, or kernel time spent on many minor faults."""
+        cpu = self.user_time + self.sys_time
+        faulting = (
+            self.minor_faults > self.MINOR_FAULTS
+            and cpu > 0
+            and self.sys_time / cpu > self.SYS_SHARE
+        )
+        return self.major_faults > self.MAJOR_FAULTS or faulting
+
+    def columns(self):
+        """The fields stored in the tracker (wall time is the runtime itself)."""
+        fields = asdict(self)
+        del fields["wall_time"]
+        return fields
+
+    @classmethod
+    def from_columns(cls, wall_time, data):
+        """Rebuild from columns() output or a measurement row; None if absent."""
+        if data.get("user_time") is None:
+            return None
+        names = [name for name in cls.__dataclass_fields__ if name != "wall_time"]
+        return cls(wall_time, **{name: data[name] for name in names})
+
+    def describe(self):
+        return (
+            f"cpu {self.cpu_ratio:.0%} of wall (user {self.user_time:.4f}s,"
+            f" sys {self.sys_time:.4f}s), max RSS {format_bytes(self.max_rss_kb * 1024)},"
+            f" ctx switches {self.vol_ctx_switches}/{self.invol_ctx_switches},"
+            f" page faults {self.major_faults}/{self.minor_faults}"
+            f"{', memory-bound' if self.memory_bound else ''}"
+        )
+
+
+def _self_rusage():
+    """getrusage(RUSAGE_SELF), or None where the resource module is missing."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF)
+
+
+def run_child(cmd, cwd, env, timeout):
+    """Run cmd to completion; returns (returncode, stdout, stderr, ResourceUsage).
+
+    The usage is None where os.wait4 is unavailable. Raises
+    subprocess.TimeoutExpired after killing a child that overruns timeout.
+    """
+    if not hasattr(os, "wait4"):
+        process = subprocess.run(
+            cmd, cwd=cwd, env=env, capture_output=True, text=True, timeout=timeout
+        )
+        return process.returncode, process.stdout, process.stderr, None
+
+    # Output goes to files rather than pipes: nothing reads while we block in
+    # wait4, and a full pipe would stall the child.
+    with tempfile.TemporaryFile("w+") as out, tempfile.TemporaryFile("w+") as err:
+        timed_out = threading.Event()
+        start = time.perf_counter()
+        process = subprocess.Popen(cmd, cwd=cwd, env=env, stdout=out, stderr=err)
+
+        def kill():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            _, status, rusage = os.wait4(process.pid, 0)
+        finally:
+            timer.cancel()
+        wall_time = time.perf_counter() - start
+        # wait4 reaped the child; tell Popen so it does not wait for it again.
+        process.returncode = os.waitstatus_to_exitcode(status)
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        out.seek(0)
+        err.seek(0)
+        usage = ResourceUsage.from_rusage(wall_time, rusage)
+        return process.returncode, out.read(), err.read(), usage
+
+
+def _subprocess_call(solution_file, part, timeout=30, root=REPO_DIR, usage=None):
+    """Callable running one part of a solution in a fresh interpreter.
+
+    root is the checkout whose aoc_utils the solution should import. Each
+    call's ResourceUsage is appended to `usage` if given.
+    """
+
+    def call():
+        cmd = ["python3", solution_file.name, "-p", str(part)]
+        try:
+            returncode, stdout, stderr, child_usage = run_child(
+                cmd, solution_file.parent, solution_env(root), timeout
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"Part {part} timed out (>{timeout}s)")
+        if returncode != 0:
+            raise RuntimeError(f"Error in part {part}: {stderr}")
+        if usage is not None and child_usage is not None:
+            usage.append(child_usage)
+        return results_from_output(stdout).get(part)
+
+    return call
+
+
+def _in_process_call(solution, part, data, breakdown, parse_cache=None, usage=None):
+    """Self-timed callable running one part of an already imported solution.
+
+    Each call returns (result, seconds), seconds being the part's traced span
+    (parse plus solve) rather than the whole run_part_in_process, whose entry
+    lookup, output capture and result scan would otherwise swamp
+    sub-millisecond parts. Appends the traced (parse_ns, solve_ns) to
+    `breakdown`, and the call's ResourceUsage to `usage` if given. Every call
+    parses afresh, so parse-once solutions are timed the same way as a
+    standalone run of the part; with parse_cache the parse is a load from the
+    on-disk parse cache instead.
+    """
+
+    def call():
+        before = _self_rusage() if usage is not None else None
+        outcome = run_part_in_process(
+            solution, part, data, reuse_parsed=False, parse_cache=parse_cache
+        )
+        if not outcome.ok:
+            raise RuntimeError(f"Error in part {part}: {outcome.error}")
+        breakdown.append((outcome.parse_ns, outcome.solve_ns))
+        seconds = ((outcome.parse_ns or 0) + outcome.solve_ns) / 1e9
+        if before is not None:
+            usage.append(ResourceUsage.from_rusage(seconds, _self_rusage(), before))
+        return outcome.result, seconds
+
+    call.self_timed = True
+    return call
+
+
+def benchmark_parts(
+    solution_file,
+    parts=(1, 2),
+    runs=3,
+    warmup=1,
+    min_time=0.2,
+    in_process=False,
+    disable_gc=False,
+    memory=False,
+    parse_cache=False,
+):
+    """Benchmark parts of a solution file, interleaving their runs.
+
+    Subprocess runs already take tens of milliseconds each, so autoranging
+    (min_time) and disable_gc only apply in-process. With memory=True each
+    part is also run once more under tracemalloc in its own process; that run
+    is not timed. parse_cache (in-process only) adds a second variant per
+    part whose parser is served from the on-disk parse cache, reported as
+    cached_time and cached_parse_time next to the uncached timings.
+
+    Parts whose answer contradicts the day's manifest are dropped, so a fast
+    wrong answer is never recorded; verified is set when the answer matched,
+    and budget is copied from the manifest. The ResourceUsage columns of each
+    part's fastest call are included too.
+    """
+    in_process = in_process or parse_cache
+    usages = {p: [] for p in parts}
+    if in_process:
+        solution = load_solution(solution_file)
+        data = read_input(solution.day_dir)
+        breakdowns = {p: [] for p in parts}
+        variants = {
+            p: _in_process_call(solution, p, data, breakdowns[p], usage=usages[p])
+            for p in parts
+        }
+        if parse_cache:
+            for p in parts:
+                breakdowns[p, "cached"] = []
+                variants[p, "cached"] = _in_process_call(
+                    solution, p, data, breakdowns[p, "cached"], parse_cache=True
+                )
+    else:
+        breakdowns = {}
+        variants = {p: _subprocess_call(solution_file, p, usage=usages[p]) for p in parts}
+        min_time, disable_gc = 0.0, False
+
+    stats, results, errors = measure_variants(
+        variants, repeat=runs, warmup=warmup, min_time=min_time, disable_gc=disable_gc
+    )
+    for part, message in errors.items():
+        print(message)
+
+    mode = IN_PROCESS if in_process else SUBPROCESS
+    measured = {
+        part: {
+            "best_time": part_stats.best,
+            "avg_time": part_stats.mean,
+            "result": results.get(part),
+            "stats": part_stats.as_dict(),
+            "mode": mode,
+            "loops": part_stats.loops,
+        }
+        for part, part_stats in stats.items()
+        if part in parts
+    }
+    manifest = DayManifest.load(Path(solution_file).parent)
+    for part in list(measured):
+        verdict = manifest.check_answer(part, measured[part]["result"])
+        if verdict is False:
+            print(
+                f"Part {part}: answer {measured[part]['result']} does not match"
+                f" the expected {manifest.expected(part)}, not recording it"
+            )
+            del measured[part]
+        elif verdict:
+            measured[part]["verified"] = 1
+        if part in measured and part in manifest.budget:
+            measured[part]["budget"] = manifest.budget[part]
+    for part, part_data in measured.items():
+        if usages[part]:
+            fastest = min(usages[part], key=lambda u: u.wall_time)
+            part_data.update(fastest.columns())
+        # Fastest traced split of the in-process calls, matching best_time.
+        calls = breakdowns.get(part)
+        if calls:
+            parse_ns, solve_ns = min(calls, key=lambda c: (c[0] or 0) + c[1])
+            part_data["parse_time"] = None if parse_ns is None else parse_ns / 1e9
+            part_data["solve_time"] = solve_ns / 1e9
+        cached = stats.get((part, "cached"))
+        if cached:
+            if results.get((part, "cached")) != part_data["result"]:
+                print(f"Part {part}: result differs with the parse cache, ignoring it")
+                continue
+            parse_ns, _ = min(
+                breakdowns[part, "cached"], key=lambda c: (c[0] or 0) + c[1]
+            )
+            part_data["cached_time"] = cached.best
+            part_data["cached_parse_time"] = None if parse_ns is None else parse_ns / 1e9
+    if memory:
+        for part, part_data in measured.items():
+            part_memory = measure_memory_isolated(solution_file, part)
+            if part_memory.error:
+                print(f"Memory measurement of part {part} failed: {part_memory.error}")
+            else:
+                part_data["memory"] = asdict(part_memory)
+    return measured
+
+
+def benchmark_part(solution_file, part, runs=3, **options):
+    """Benchmark one part of a solution file."""
+    return benchmark_parts(solution_file, (part,), runs, **options).get(part)
+
+
+def benchmark_solution(solution_file, runs=3, **options):
     """Benchmark a solution file."""
     if not solution_file.exists():
         return None
 
-    results = {}
+    results = benchmark_parts(solution_file, (1, 2), runs, **options)
+    return {f"part_{part}": part_data for part, part_data in sorted(results.items())}
 
-    for part in [1, 2]:
-        times = []
-        result = None
 
-        for _ in range(runs):
-            cmd = ["python3", str(solution_file), "-p", str(part)]
-            start_time = time.time()
+# Parallel scheduling
+#
+# A full sweep is a few hundred independent (year, day, part) jobs, so they are
+# farmed out to a process pool with one worker per core. Jobs are started
+# longest-first (using the best recorded time) so a slow day does not end up
+# running alone at the end of the sweep.
 
-            try:
-                process = subprocess.run(
-                    cmd,
-                    cwd=solution_file.parent,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,  # 30 second timeout
+
+def find_benchmark_jobs(base_dir=Path("."), year=None, day=None):
+    """List (year, day, part, solution_file) jobs for every solved day."""
+    year_dirs = [d for d in base_dir.iterdir() if d.is_dir() and d.name.isdigit()]
+    if year:
+        year_dirs = [d for d in year_dirs if int(d.name) == year]
+
+    jobs = []
+    for year_dir in sorted(year_dirs):
+        day_dirs = sorted(
+            [d for d in year_dir.iterdir() if d.is_dir() and d.name.startswith("Day")],
+            key=lambda d: int(d.name.replace("Day", "")),
+        )
+        for day_dir in day_dirs:
+            day_num = int(day_dir.name.replace("Day", ""))
+            if day and day_num != day:
+                continue
+            solution_file = find_solution_file(day_dir)
+            if solution_file is None:
+                continue
+            for part in [1, 2]:
+                jobs.append((int(year_dir.name), day_num, part, solution_file))
+    return jobs
+
+
+def order_jobs(jobs, tracker):
+    """Sort jobs slowest-first; jobs with no history are treated as slowest."""
+    best_times = tracker.get_best_times()
+
+    def expected_time(job):
+        year, day, part, _ = job
+        return best_times.get(f"{year}-{day}", {}).get(f"part_{part}", float("inf"))
+
+    return sorted(jobs, key=expected_time, reverse=True)
+
+
+def _available_cores():
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _pin_worker(core_queue):
+    """Pool initializer: pin this worker (and its children) to one core."""
+    core = core_queue.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {core})
+
+
+def _run_job(job, runs, options):
+    year, day, part, solution_file = job
+    return job, benchmark_part(solution_file, part, runs, **options)
+
+
+def run_jobs(jobs, runs=3, workers=None, **options):
+    """Run benchmark jobs on a pinned process pool, yielding results as they finish."""
+    cores = _available_cores()
+    workers = min(workers or len(cores), len(jobs)) if jobs else 0
+
+    if workers <= 1:
+        for job in jobs:
+            yield _run_job(job, runs, options)
+        return
+
+    core_queue = multiprocessing.Queue()
+    for i in range(workers):
+        core_queue.put(cores[i % len(cores)])
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_pin_worker, initargs=(core_queue,)
+    ) as pool:
+        futures = [pool.submit(_run_job, job, runs, options) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def benchmark_all(tracker, year=None, runs=3, workers=None, force=False, **options):
+    """Benchmark every day in parallel, recording results as they complete.
+
+    Parts whose solution, local imports, input and benchmark options are
+    unchanged since their last sweep are reported from the result cache and
+    not re-run (or re-recorded) unless force is set.
+    """
+    cache = ResultCache(tracker.data_file)
+    settings = json.dumps({"runs": runs, **options}, sort_keys=True)
+    fingerprints, jobs = {}, []
+    for job in find_benchmark_jobs(year=year):
+        job_year, day, part, solution_file = job
+        fingerprints[job] = solution_fingerprint(solution_file, extra=settings)
+        cached = None if force else cache.get(job_year, day, part, "benchmark", fingerprints[job])
+        if cached:
+            part_data, timestamp = cached
+            print(
+                f"  {job_year} Day {day} part {part}: {part_data['best_time']:.4f}s"
+                f" (unchanged since {timestamp[:10]})"
+            )
+        else:
+            jobs.append(job)
+    jobs = order_jobs(jobs, tracker)
+    workers = workers or len(_available_cores())
+    print(f"Benchmarking {len(jobs)} parts on {min(workers, len(jobs))} worker(s)...")
+
+    sweep_start = time.time()
+    for job, part_data in run_jobs(jobs, runs, workers, **options):
+        job_year, day, part, solution_file = job
+        label = f"  {job_year} Day {day} part {part}: "
+        if part_data:
+            tracker.record_benchmark(job_year, day, part, part_data)
+            cache.put(job_year, day, part, "benchmark", fingerprints[job], part_data)
+            budget = part_data.get("budget")
+            over = budget is not None and part_data["best_time"] > budget
+            note = f" (over its {budget:g}s budget)" if over else ""
+            print(f"{label}{part_data['best_time']:.4f}s{note}", flush=True)
+        else:
+            print(f"{label}Failed", flush=True)
+
+    print(f"\nSweep finished in {time.time() - sweep_start:.2f}s")
+    cache.close()
+
+
+# Regression gate
+#
+# --check compares like with like: the median of this run's samples against
+# the median of the baseline's, each with its bootstrap confidence interval.
+# The baseline is a pinned measurement, or else the latest one in the same
+# mode; never the best-ever time, which is biased low by every lucky run in
+# the history. A part only regresses (or improves) when the two intervals do
+# not overlap and the change in medians exceeds both thresholds.
+
+
+@dataclass
+class Comparison:
+    """A benchmarked part's median compared against its baseline's."""
+
+    year: int
+    day: int
+    part: int
+    baseline: float
+    current: float
+    status: str
+
+    @property
+    def change(self):
+        return (self.current - self.baseline) / self.baseline if self.baseline else 0.0
+
+
+def classify_change(baseline, current, rel_threshold=0.1, abs_threshold=0.005):
+    """'regression'/'improvement' only when both the relative and absolute change exceed the thresholds."""
+    delta = current - baseline
+    if abs(delta) <= abs_threshold or abs(delta) <= rel_threshold * baseline:
+        return "ok"
+    return "regression" if delta > 0 else "improvement"
+
+
+def check_regressions(
+    tracker,
+    year=None,
+    day=None,
+    runs=3,
+    workers=None,
+    baseline="auto",
+    rel_threshold=0.1,
+    abs_threshold=0.005,
+    **options,
+):
+    """Benchmark the selected days and compare each part with its baseline.
+
+    baseline is "pinned", "latest" or "auto" (pinned where one exists, else
+    latest), both taken from runs in the same mode (in-process or subprocess)
+    as this one. Parts without a baseline are reported as "new". Returns the
+    comparisons.
+    """
+    mode = benchmark_mode(**options)
+    pinned = tracker.get_estimates(year, mode, "pinned")
+    latest = tracker.get_estimates(year, mode, "latest")
+    jobs = order_jobs(find_benchmark_jobs(year=year, day=day), tracker)
+
+    comparisons = []
+    for (job_year, job_day, part, _), part_data in run_jobs(
+        jobs, runs, workers, **options
+    ):
+        key, part_key = f"{job_year}-{job_day}", f"part_{part}"
+        if baseline == "pinned":
+            reference = pinned.get(key, {}).get(part_key)
+        elif baseline == "latest":
+            reference = latest.get(key, {}).get(part_key)
+        else:
+            reference = pinned.get(key, {}).get(part_key, latest.get(key, {}).get(part_key))
+
+        if not part_data:
+            status = "failed"
+            current = float("nan")
+        else:
+            estimate = Estimate.from_stats(part_data.get("stats"), part_data["best_time"])
+            current = estimate.median
+            tracker.record_benchmark(job_year, job_day, part, part_data)
+            if reference is None:
+                status = "new"
+            elif reference.overlaps(estimate):
+                status = "ok"
+            else:
+                status = classify_change(
+                    reference.median, current, rel_threshold, abs_threshold
                 )
-                end_time = time.time()
-
-                if process.returncode == 0:
-                    times.append(end_time - start_time)
-                    # Extract result from output
-                    output_lines = process.stdout.strip().split("\n")
-                    for line in output_lines:
-                        if line.startswith("Result for Part"):
-                            result = line.split(": ", 1)[1] if ": " in line else None
-                            break
-                else:
-                    print(f"Error in part {part}: {process.stderr}")
-
-            except subprocess.TimeoutExpired:
-                print(f"Part {part} timed out (>30s)")
-                break
-            except Exception as e:
-                print(f"Error running part {part}: {e}")
-                break
-
-        if times:
-            results[f"part_{part}"] = {
-                "best_time": min(times),
-                "avg_time": sum(times) / len(times),
-                "result": result,
+
+        comparisons.append(
+            Comparison(
+                job_year,
+                job_day,
+                part,
+                float("nan") if reference is None else reference.median,
+                current,
+                status,
+            )
+        )
+
+    comparisons.sort(key=lambda c: (c.year, c.day, c.part))
+    return comparisons
+
+
+def print_comparisons(comparisons):
+    """Print a per-day table of the --check results."""
+    def seconds(value):
+        return "-" if math.isnan(value) else f"{value:.4f}s"
+
+    print(f"{'Year':>4} {'Day':>3} {'Part':>4} {'Baseline':>10} {'Current':>10} {'Change':>8}  Status")
+    for c in comparisons:
+        change = f"{c.change:+.1%}" if c.status in ("ok", "regression", "improvement") else ""
+        print(
+            f"{c.year:>4} {c.day:>3} {c.part:>4} {seconds(c.baseline):>10} {seconds(c.current):>10} "
+            f"{change:>8}  {c.status.upper()}"
+        )
+
+    counts = defaultdict(int)
+    for c in comparisons:
+        counts[c.status] += 1
+    print("\n" + ", ".join(f"{n} {status}" for status, n in sorted(counts.items())))
+
+
+# Revision comparison
+#
+# --compare checks both revisions out into temporary git worktrees and times
+# each selected part on both sides in the same measure_variants call, so the
+# A and B runs alternate and drift hits them equally. Each side runs as a
+# subprocess with its own checkout first on PYTHONPATH, so changes to the
+# shared aoc_utils package are compared too. The speedup is the median of the
+# per-round A/B time ratios, with a bootstrap confidence interval.
+
+
+@dataclass
+class RevisionComparison:
+    """One part timed at two revisions; speedup > 1 means B is faster."""
+
+    year: int
+    day: int
+    part: int
+    time_a: float = float("nan")
+    time_b: float = float("nan")
+    speedup: float = float("nan")
+    ci_low: float = float("nan")
+    ci_high: float = float("nan")
+    status: str = "ok"
+
+
+def resolve_revision(rev):
+    """Full commit SHA of a revision name; raises ValueError if unknown."""
+    process = subprocess.run(
+        ["git", "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"],
+        cwd=REPO_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise ValueError(f"Unknown revision {rev!r}")
+    return process.stdout.strip()
+
+
+@contextmanager
+def revision_worktrees(shas):
+    """Check each commit out into a temporary worktree; yields their paths."""
+    tmp_dir = Path(tempfile.mkdtemp(prefix="aoc-compare-"))
+    paths = []
+    try:
+        for i, sha in enumerate(shas):
+            path = tmp_dir / f"{i}-{sha[:12]}"
+            subprocess.run(
+                ["git", "worktree", "add", "--detach", "--quiet", str(path), sha],
+                cwd=REPO_DIR,
+                check=True,
+                capture_output=True,
+            )
+            paths.append(path)
+        yield paths
+    finally:
+        for path in paths:
+            subprocess.run(
+                ["git", "worktree", "remove", "--force", str(path)],
+                cwd=REPO_DIR,
+                capture_output=True,
+            )
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        subprocess.run(["git", "worktree", "prune"], cwd=REPO_DIR, capture_output=True)
+
+
+def _copy_missing_inputs(day_dir, source_dir):
+    """Give a checked-out day the current tree's inputs if it has none."""
+    for name in ("input.txt", "example.txt"):
+        if not (day_dir / name).exists() and (source_dir / name).exists():
+            shutil.copy2(source_dir / name, day_dir / name)
+
+
+def compare_revisions(
+    tracker, rev_a, rev_b, year=None, day=None, runs=5, warmup=1, timeout=120
+):
+    """Benchmark the selected days at two revisions; returns RevisionComparisons.
+
+    Both sides are recorded in the tracker with their commit SHA, except parts
+    whose answer contradicts that side's manifest.
+    """
+    shas = [resolve_revision(rev_a), resolve_revision(rev_b)]
+    days = sorted({(y, d) for y, d, _, _ in find_benchmark_jobs(REPO_DIR, year, day)})
+    comparisons = []
+    with revision_worktrees(shas) as roots:
+        for job_year, job_day in days:
+            current_dir = REPO_DIR / str(job_year) / f"Day{job_day}"
+            solution_files = []
+            for root in roots:
+                day_dir = root / str(job_year) / f"Day{job_day}"
+                solution_file = find_solution_file(day_dir) if day_dir.exists() else None
+                if solution_file:
+                    _copy_missing_inputs(day_dir, current_dir)
+                solution_files.append(solution_file)
+            if None in solution_files:
+                comparisons.extend(
+                    RevisionComparison(job_year, job_day, p, status="missing")
+                    for p in (1, 2)
+                )
+                continue
+
+            print(f"  {job_year} Day {job_day}...", flush=True)
+            variants = {
+                (side, p): _subprocess_call(solution_files[side], p, timeout, roots[side])
+                for p in (1, 2)
+                for side in (0, 1)
             }
+            stats, results, errors = measure_variants(variants, repeat=runs, warmup=warmup)
+            for message in errors.values():
+                print(f"    {message.strip().splitlines()[-1]}")
+
+            for p in (1, 2):
+                comparison = RevisionComparison(job_year, job_day, p)
+                comparisons.append(comparison)
+                for side, field_name in ((0, "time_a"), (1, "time_b")):
+                    side_stats = stats.get((side, p))
+                    if side_stats is None:
+                        continue
+                    setattr(comparison, field_name, side_stats.median)
+                    result = results.get((side, p))
+                    manifest = DayManifest.load(solution_files[side].parent)
+                    if manifest.check_answer(p, result) is False:
+                        comparison.status = "wrong answer"
+                        continue
+                    tracker.record_benchmark(
+                        job_year,
+                        job_day,
+                        p,
+                        {
+                            "best_time": side_stats.best,
+                            "avg_time": side_stats.mean,
+                            "result": result,
+                            "stats": side_stats.as_dict(),
+                            "commit_sha": shas[side],
+                            "mode": SUBPROCESS,
+                            "loops": side_stats.loops,
+                        },
+                    )
+
+                if (0, p) not in stats or (1, p) not in stats:
+                    comparison.status = "failed"
+                    continue
+                if str(results[0, p]) != str(results[1, p]) and comparison.status == "ok":
+                    comparison.status = "answers differ"
+                # Samples are appended round by round, so pairing them by index
+                # pairs the A and B runs that were timed back to back.
+                ratios = [
+                    a / b
+                    for a, b in zip(stats[0, p].samples, stats[1, p].samples)
+                    if b > 0
+                ]
+                if ratios:
+                    comparison.speedup = statistics.median(ratios)
+                    comparison.ci_low, comparison.ci_high = bootstrap_ci(ratios)
+    return shas, comparisons
+
+
+def print_revision_comparisons(shas, comparisons):
+    """Print per-part times at both revisions and the speedup of B over A."""
+
+    def seconds(value):
+        return "-" if math.isnan(value) else f"{value:.4f}s"
+
+    def ratio(value):
+        return "-" if math.isnan(value) else f"{value:.2f}x"
+
+    a, b = (sha[:8] for sha in shas)
+    print(
+        f"{'Year':>4} {'Day':>3} {'Part':>4} {'A ' + a:>11} {'B ' + b:>11}"
+        f" {'Speedup':>8}  95% CI"
+    )
+    for c in comparisons:
+        ci = "" if math.isnan(c.ci_low) else f"{ratio(c.ci_low)}-{ratio(c.ci_high)}"
+        status = "" if c.status == "ok" else f"  {c.status.upper()}"
+        print(
+            f"{c.year:>4} {c.day:>3} {c.part:>4} {seconds(c.time_a):>11}"
+            f" {seconds(c.time_b):>11} {ratio(c.speedup):>8}  {ci}{status}"
+        )
+
+
+# Scaling sweeps
+#
+# One input says little about how a part scales. Days can declare a generator
+# of valid inputs by size (aoc_utils.input_generator), in the solution or in
+# the module named by the manifest's "generator"; a sweep times each part
+# on every size, interleaved like any other variants, and fits the slope of
+# log(time) against log(size) as an empirical complexity exponent. A part
+# whose exponent exceeds the budget declared with the generator is flagged.
+
+
+@dataclass
+class SweepResult:
+    """Timings of one part across generated input sizes."""
+
+    part: int
+    param: str
+    sizes: list
+    medians: list
+    exponent: float = None
+    budget: float = None
+    error: str = None
+
+    @property
+    def over_budget(self):
+        return (
+            self.budget is not None
+            and self.exponent is not None
+            and self.exponent > self.budget
+        )
+
+
+def fit_exponent(sizes, times):
+    """Least-squares slope of log(time) against log(size), or None if underdetermined."""
+    points = [(math.log(s), math.log(t)) for s, t in zip(sizes, times) if t > 0]
+    if len({x for x, _ in points}) < 2:
+        return None
+    xs, ys = zip(*points)
+    slope, _ = statistics.linear_regression(xs, ys)
+    return slope
+
+
+def sweep_solution(
+    solution_file,
+    parts=(1, 2),
+    sizes=None,
+    repeat=3,
+    warmup=1,
+    min_time=0.0,
+    disable_gc=False,
+    seed=0,
+):
+    """Time each part on generated inputs of every size; returns SweepResults.
+
+    Raises ValueError if the solution declares no input generator.
+    """
+    from aoc_utils import find_input_generator
+
+    solution = load_solution(solution_file)
+    if solution.manifest.generator:
+        module = load_solution(solution.day_dir / solution.manifest.generator).module
+    else:
+        module = solution.module
+    generator = find_input_generator(module)
+    if generator is None:
+        raise ValueError(f"{solution_file} declares no input generator")
+    sizes = sorted(sizes or generator.sizes)
+    inputs = {size: generator(size, seed) for size in sizes}
+
+    variants = {
+        (p, size): _in_process_call(solution, p, inputs[size], [])
+        for p in parts
+        for size in sizes
+    }
+    stats, _, errors = measure_variants(
+        variants, repeat=repeat, warmup=warmup, min_time=min_time, disable_gc=disable_gc
+    )
+
+    sweeps = []
+    for p in parts:
+        measured = [size for size in sizes if (p, size) in stats]
+        medians = [stats[p, size].median for size in measured]
+        failed = [errors[p, size] for size in sizes if (p, size) in errors]
+        sweeps.append(
+            SweepResult(
+                part=p,
+                param=generator.param,
+                sizes=measured,
+                medians=medians,
+                exponent=fit_exponent(measured, medians),
+                budget=generator.budget.get(p),
+                error=failed[0] if failed else None,
+            )
+        )
+    return sweeps
+
+
+def print_sweep(sweeps):
+    """Print per-size medians and the fitted exponent of each part."""
+    for sweep in sweeps:
+        print(f"Part {sweep.part} ({sweep.param}):")
+        for size, median in zip(sweep.sizes, sweep.medians):
+            print(f"  {size:>8}  {median:.6f}s")
+        if sweep.error:
+            print(f"  Error: {sweep.error}")
+        if sweep.exponent is None:
+            print("  exponent: - (fewer than two sizes measured)")
+            continue
+        budget = "" if sweep.budget is None else f" (budget {sweep.budget:.2f})"
+        status = "  OVER BUDGET" if sweep.over_budget else ""
+        print(f"  exponent: {sweep.exponent:.2f}{budget}{status}")
+
+
+# Distributed benchmarking
+#
+# A coordinator (--coordinator) serves the selected (year, day, part) jobs over
+# HTTP, slowest first. Workers (--worker URL) on the build hosts, each with
+# its own checkout, pull one job at a time, run it through benchmark_part with
+# the coordinator's settings and post the measurement back. The coordinator
+# records every measurement in its own database under the worker's host name,
+# so each machine's timings stay separate. A job whose worker has not
+# reported back when its lease runs out is handed to the next worker asking.
+# If nothing is taken or reported for two leases in a row (every worker died
+# holding a job, or none ever came), the coordinator gives up.
+
+
+@dataclass
+class BenchmarkJob:
+    """One part to benchmark, as sent to workers."""
+
+    id: int
+    year: int
+    day: int
+    part: int
+    runs: int = 3
+    options: dict = field(default_factory=dict)
+
+
+class JobBoard:
+    """Jobs waiting for a worker, leased to one, or finished."""
+
+    def __init__(self, jobs, lease=600.0):
+        self.waiting = deque(jobs)
+        self.leased = {}  # job id -> (job, host, deadline)
+        self.finished = {}  # job id -> (host, part_data or None)
+        self.lease = lease
+        self.last_progress = time.monotonic()  # Last take or accepted report
+
+    @property
+    def done(self):
+        return not self.waiting and not self.leased
+
+    def expire(self, now=None):
+        """Put jobs whose lease ran out back at the front of the queue."""
+        now = time.monotonic() if now is None else now
+        for job_id, (job, holder, deadline) in list(self.leased.items()):
+            if deadline < now:
+                print(f"  Job {job_id} timed out on {holder}, handing it out again")
+                del self.leased[job_id]
+                self.waiting.appendleft(job)
+
+    def stalled(self, now=None):
+        """True if jobs remain but none was taken or reported for two leases."""
+        now = time.monotonic() if now is None else now
+        return not self.done and now - self.last_progress > 2 * self.lease
+
+    def take(self, host, now=None):
+        """Lease the next job to host, or None if nothing is waiting."""
+        now = time.monotonic() if now is None else now
+        self.expire(now)
+        if not self.waiting:
+            return None
+        job = self.waiting.popleft()
+        self.leased[job.id] = (job, host, now + self.lease)
+        self.last_progress = now
+        return job
 
-    return results
+    def finish(self, job_id, host, part_data, now=None):
+        """Accept host's report for a job it holds; returns the job or None."""
+        entry = self.leased.get(job_id)
+        if entry is None or entry[1] != host:
+            return None  # A report arriving after the lease moved on
+        del self.leased[job_id]
+        self.finished[job_id] = (host, part_data)
+        self.last_progress = time.monotonic() if now is None else now
+        return entry[0]
+
+
+class _CoordinatorHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if self.path == "/job":
+                response = self.server.next_job(request)
+            elif self.path == "/result":
+                response = self.server.report(request)
+            else:
+                self.send_error(404, f"Unknown endpoint {self.path}")
+                return
+        except (ValueError, KeyError, TypeError) as e:
+            self.send_error(400, f"Bad request: {e}")
+            return
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Progress is printed per job instead
+
+
+class CoordinatorServer(HTTPServer):
+    """Hands out a JobBoard's jobs and records the workers' measurements.
+
+    Requests are handled one at a time on the serving thread, which also owns
+    the tracker's SQLite connection. Waiting for a request times out after a
+    tenth of the lease, so expired leases are requeued and a stalled board
+    noticed even when no worker is left to ask.
+    """
+
+    def __init__(self, address, board, tracker):
+        self.board = board
+        self.tracker = tracker
+        self.hosts = set()
+        self.timeout = board.lease / 10
+        super().__init__(address, _CoordinatorHandler)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def next_job(self, request):
+        host = request["host"]
+        if host not in self.hosts and request.get("info"):
+            self.tracker.register_host(host, request["info"])
+            self.hosts.add(host)
+        job = self.board.take(host)
+        if job is None:
+            return {"job": None, "done": self.board.done}
+        print(f"  {job.year} Day {job.day} part {job.part} -> {host}", flush=True)
+        return {"job": asdict(job), "done": False}
+
+    def report(self, request):
+        host = request["host"]
+        part_data = request.get("part_data")
+        job = self.board.finish(request["id"], host, part_data)
+        if job is None:
+            return {"accepted": False}
+        label = f"  {job.year} Day {job.day} part {job.part} on {host}: "
+        if part_data:
+            part_data["host"] = host
+            self.tracker.record_benchmark(job.year, job.day, job.part, part_data)
+            print(f"{label}{part_data['best_time']:.4f}s", flush=True)
+        else:
+            print(f"{label}Failed ({request.get('error', 'no result')})", flush=True)
+        return {"accepted": True}
+
+    def handle_timeout(self):
+        self.board.expire()
+
+    def serve_until_done(self):
+        """Serve requests until every job has been reported.
+
+        Raises TimeoutError if the board stalls with jobs left.
+        """
+        while not self.board.done:
+            self.handle_request()
+            if self.board.stalled():
+                left = len(self.board.waiting) + len(self.board.leased)
+                raise TimeoutError(
+                    f"No job taken or reported for {2 * self.board.lease:g}s;"
+                    f" giving up with {left} job(s) left"
+                )
+
+
+def make_jobs(tracker, year=None, day=None, runs=3, **options):
+    """BenchmarkJobs for every selected part, slowest first."""
+    jobs = order_jobs(find_benchmark_jobs(year=year, day=day), tracker)
+    return [
+        BenchmarkJob(i, job_year, job_day, part, runs, options)
+        for i, (job_year, job_day, part, _) in enumerate(jobs)
+    ]
+
+
+def _post(url, path, payload, timeout=30):
+    request = urllib.request.Request(
+        url.rstrip("/") + path,
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.load(response)
+
+
+def _run_remote_job(job, base_dir, commit_sha):
+    """Benchmark a job from the coordinator; returns the /result payload fields."""
+    solution_file = find_solution_file(Path(base_dir) / str(job["year"]) / f"Day{job['day']}")
+    if solution_file is None:
+        return {"error": "No solution file found"}
+    try:
+        part_data = benchmark_part(solution_file, job["part"], job["runs"], **job["options"])
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+    if not part_data:
+        return {"error": "Benchmark failed"}
+    part_data["commit_sha"] = commit_sha
+    return {"part_data": part_data}
+
+
+def run_worker(url, base_dir=REPO_DIR, host=HOST, poll=1.0, connect_timeout=30.0):
+    """Benchmark jobs pulled from a coordinator until it has none left.
+
+    Waits up to connect_timeout for the coordinator to come up; once it has
+    answered, a refused connection means it finished. Returns the number of
+    jobs run.
+    """
+    try:
+        commit_sha = resolve_revision("HEAD")
+    except ValueError:
+        commit_sha = None
+    info = host_info()
+    deadline = time.monotonic() + connect_timeout
+    connected, count = False, 0
+    while True:
+        try:
+            response = _post(url, "/job", {"host": host, "info": info})
+        except OSError:
+            if connected or time.monotonic() > deadline:
+                return count
+            time.sleep(poll)
+            continue
+        connected = True
+        job = response["job"]
+        if job is None:
+            if response["done"]:
+                return count
+            time.sleep(poll)  # Everything left is leased; one may expire
+            continue
+        print(f"{job['year']} Day {job['day']} part {job['part']}...", flush=True)
+        payload = {"id": job["id"], "host": host, **_run_remote_job(job, base_dir, commit_sha)}
+        if not _post(url, "/result", payload)["accepted"]:
+            print("  Coordinator had already handed the job to another worker")
+        count += 1
 
 
 def main():
@@ -161,72 +1798,227 @@ def main():
     parser.add_argument(
         "--benchmark-all", action="store_true", help="Benchmark all solutions"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With --benchmark-all, re-run parts even if unchanged since their last sweep",
+    )
     parser.add_argument(
         "--summary", action="store_true", help="Show performance summary"
     )
     parser.add_argument(
         "--runs", type=int, default=3, help="Number of runs for benchmarking"
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for --benchmark-all (default: one per core)",
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="Untimed warmup runs per part"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Minimum seconds per timed sample; fast parts are looped (in-process only)",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Import each solution once and time its parts without interpreter startup",
+    )
+    parser.add_argument(
+        "--no-gc",
+        action="store_true",
+        help="Disable garbage collection while timing (in-process only)",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="Also time each part with its parser served from the on-disk parse"
+        " cache (implies --in-process)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Also record tracemalloc peak, allocation sites and max RSS per part",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Benchmark and exit non-zero if any part regressed against its baseline",
+    )
+    parser.add_argument(
+        "--baseline",
+        choices=["auto", "pinned", "latest"],
+        default="auto",
+        help="Baseline for --check (auto: pinned if set, otherwise the latest measurement)",
+    )
+    parser.add_argument(
+        "--rel-threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown tolerated by --check",
+    )
+    parser.add_argument(
+        "--abs-threshold",
+        type=float,
+        default=0.005,
+        help="Absolute slowdown in seconds tolerated by --check",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("REV_A", "REV_B"),
+        help="Benchmark the selected days at two git revisions, interleaved, and"
+        " report the speedup of REV_B over REV_A",
+    )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Time the day's parts on generated inputs of increasing size and fit"
+        " their complexity exponents; exits non-zero if one exceeds its budget",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda text: [int(x) for x in text.split(",")],
+        help="Comma-separated sizes for --sweep (default: the generator's own)",
+    )
+    parser.add_argument(
+        "--coordinator",
+        metavar="HOST:PORT",
+        help="Serve the selected parts as benchmark jobs to --worker processes and"
+        " record their results here",
+    )
+    parser.add_argument(
+        "--worker",
+        metavar="URL",
+        help="Benchmark jobs from the coordinator at URL until it has none left"
+        " (the host name is AOC_HOST or the machine's name)",
+    )
+    parser.add_argument(
+        "--lease",
+        type=float,
+        default=600.0,
+        help="Seconds a worker may hold a --coordinator job before it is handed out again;"
+        " the coordinator gives up after two leases without progress",
+    )
+    parser.add_argument(
+        "--host",
+        help="Show --summary for this host's measurements instead of this machine's",
+    )
+    parser.add_argument(
+        "--pin",
+        action="store_true",
+        help="Pin the latest measurements of the selected days as --check baselines"
+        " (for in-process checks with --in-process)",
+    )
 
     args = parser.parse_args()
 
     tracker = PerformanceTracker()
+    options = {
+        "warmup": args.warmup,
+        "min_time": args.min_time,
+        "in_process": args.in_process,
+        "disable_gc": args.no_gc,
+        "memory": args.memory,
+        "parse_cache": args.parse_cache,
+    }
 
+    mode = benchmark_mode(**options)
     if args.summary:
-        tracker.print_summary(args.year)
-        return
+        tracker.print_summary(args.year, args.host, mode)
+        return 0
 
-    if args.benchmark_all:
-        # Find all solution files
-        base_dir = Path(".")
-        year_dirs = [d for d in base_dir.iterdir() if d.is_dir() and d.name.isdigit()]
-
-        if args.year:
-            year_dirs = [d for d in year_dirs if int(d.name) == args.year]
-
-        for year_dir in sorted(year_dirs):
-            year = int(year_dir.name)
-            print(f"\nBenchmarking {year}...")
-
-            day_dirs = sorted(
-                [
-                    d
-                    for d in year_dir.iterdir()
-                    if d.is_dir() and d.name.startswith("Day")
-                ]
-            )
+    if args.worker:
+        count = run_worker(args.worker)
+        print(f"Ran {count} job(s)")
+        return 0
 
-            for day_dir in day_dirs:
-                day_num = int(day_dir.name.replace("Day", ""))
+    if args.coordinator:
+        address, _, port = args.coordinator.rpartition(":")
+        jobs = make_jobs(tracker, args.year, args.day, args.runs, **options)
+        server = CoordinatorServer((address, int(port)), JobBoard(jobs, args.lease), tracker)
+        print(f"Serving {len(jobs)} jobs on {server.url}...")
+        with server:
+            try:
+                server.serve_until_done()
+            except TimeoutError as e:
+                print(e)
+                return 1
+        failed = [i for i, (_, part_data) in server.board.finished.items() if not part_data]
+        print(f"Finished {len(jobs)} jobs, {len(failed)} failed")
+        return 1 if failed else 0
 
-                # Find solution file
-                solution_files = [
-                    f for f in day_dir.glob("*.py") if f.name != "aoc_utils.py"
-                ]
-                if not solution_files:
-                    continue
+    if args.pin:
+        pinned = tracker.pin_latest(args.year, args.day, mode)
+        print(f"Pinned {pinned} {mode} baselines")
+        return 0
 
-                solution_file = solution_files[0]  # Take the first one
-                print(f"  Day {day_num}: ", end="", flush=True)
+    if args.check:
+        comparisons = check_regressions(
+            tracker,
+            args.year,
+            args.day,
+            args.runs,
+            args.jobs,
+            baseline=args.baseline,
+            rel_threshold=args.rel_threshold,
+            abs_threshold=args.abs_threshold,
+            **options,
+        )
+        print_comparisons(comparisons)
+        failed = [c for c in comparisons if c.status in ("regression", "failed")]
+        return 1 if failed else 0
 
-                results = benchmark_solution(solution_file, args.runs)
-                if results:
-                    for part_key, part_data in results.items():
-                        part_num = int(part_key.split("_")[1])
-                        tracker.record_performance(
-                            year,
-                            day_num,
-                            part_num,
-                            part_data["best_time"],
-                            part_data["result"],
-                        )
+    if args.compare:
+        print(f"Comparing {args.compare[0]} and {args.compare[1]}...")
+        try:
+            shas, comparisons = compare_revisions(
+                tracker,
+                *args.compare,
+                year=args.year,
+                day=args.day,
+                runs=args.runs,
+                warmup=args.warmup,
+            )
+        except ValueError as e:
+            print(e)
+            return 1
+        print_revision_comparisons(shas, comparisons)
+        return 1 if any(c.status == "failed" for c in comparisons) else 0
 
-                    part1_time = results.get("part_1", {}).get("best_time", 0)
-                    part2_time = results.get("part_2", {}).get("best_time", 0)
-                    total_time = part1_time + part2_time
-                    print(f"{total_time:.4f}s")
-                else:
-                    print("Failed")
+    if args.sweep:
+        if not args.day:
+            print("--sweep needs a day (-d)")
+            return 1
+        year = args.year or datetime.now().year
+        solution_file = find_solution_file(Path(f"{year}/Day{args.day}"))
+        if solution_file is None:
+            print(f"No solution file found for {year} day {args.day}")
+            return 1
+        print(f"Sweeping {solution_file}...")
+        try:
+            sweeps = sweep_solution(
+                solution_file,
+                sizes=args.sizes,
+                repeat=args.runs,
+                warmup=args.warmup,
+                min_time=args.min_time,
+                disable_gc=args.no_gc,
+            )
+        except ValueError as e:
+            print(e)
+            return 1
+        print_sweep(sweeps)
+        return 1 if any(s.over_budget or s.error for s in sweeps) else 0
+
+    if args.benchmark_all:
+        benchmark_all(tracker, args.year, args.runs, args.jobs, args.force, **options)
 
     elif args.day:
         # Benchmark specific day
@@ -237,34 +2029,51 @@ def main():
             print(f"Day directory {day_dir} does not exist")
             return 1
 
-        solution_files = [f for f in day_dir.glob("*.py") if f.name != "aoc_utils.py"]
-        if not solution_files:
+        solution_file = find_solution_file(day_dir)
+        if not solution_file:
             print(f"No solution file found in {day_dir}")
             return 1
 
-        solution_file = solution_files[0]
         print(f"Benchmarking {solution_file}...")
 
-        results = benchmark_solution(solution_file, args.runs)
+        results = benchmark_solution(solution_file, args.runs, **options)
         if results:
             for part_key, part_data in results.items():
                 part_num = int(part_key.split("_")[1])
+                stats = BenchmarkStats(**part_data["stats"])
                 print(
                     f"Part {part_num}: {part_data['best_time']:.4f}s (avg: {part_data['avg_time']:.4f}s)"
                 )
+                print(f"  {stats.describe()}")
+                if part_data.get("solve_time") is not None:
+                    parse_time = part_data["parse_time"]
+                    parse_text = "-" if parse_time is None else f"{parse_time:.6f}s"
+                    print(f"  parse {parse_text}, solve {part_data['solve_time']:.6f}s")
+                if part_data.get("cached_time") is not None:
+                    load = part_data["cached_parse_time"]
+                    load_text = "-" if load is None else f"{load:.6f}s"
+                    print(
+                        f"  with parse cached: {part_data['cached_time']:.4f}s"
+                        f" (cache load {load_text})"
+                    )
+                usage = ResourceUsage.from_columns(part_data["best_time"], part_data)
+                if usage:
+                    print(f"  {usage.describe()}")
+                if "memory" in part_data:
+                    print_memory_result(MemoryResult(**part_data["memory"]))
                 if part_data["result"]:
-                    print(f"  Result: {part_data['result']}")
+                    verified = " (verified)" if part_data.get("verified") else ""
+                    print(f"  Result: {part_data['result']}{verified}")
+                budget = part_data.get("budget")
+                if budget is not None and part_data["best_time"] > budget:
+                    print(f"  Over its {budget:g}s budget")
 
-                tracker.record_performance(
-                    year,
-                    args.day,
-                    part_num,
-                    part_data["best_time"],
-                    part_data["result"],
-                )
+                tracker.record_benchmark(year, args.day, part_num, part_data)
     else:
-        tracker.print_summary(args.year)
+        tracker.print_summary(args.year, mode=mode)
+
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
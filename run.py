@@ -4,15 +4,159 @@ Solution runner for Advent of Code problems.
 Provides easy testing and execution of solutions.
 """
 import argparse
+import ast
+import asyncio
+import contextlib
+import cProfile
+import hashlib
+import importlib.util
+import inspect
+import io
+import json
 import os
+import pstats
+import re
+import sqlite3
 import subprocess
 import sys
+import threading
+import time
+import traceback
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional
+
+import aoc_utils
+
+REPO_DIR = Path(__file__).resolve().parent
+
+
+def solution_env(root=REPO_DIR):
+    """Environment for solution subprocesses, with the repo root importable.
+
+    Day scripts run from their own directory, so the shared aoc_utils package
+    is only importable through PYTHONPATH (or the day's own sys.path setup).
+    root can point at another checkout, e.g. a worktree of an older revision.
+    """
+    env = dict(os.environ)
+    paths = [str(root), *filter(None, [env.get("PYTHONPATH")])]
+    env["PYTHONPATH"] = os.pathsep.join(paths)
+    return env
+
+
+# Day manifests
+#
+# A day directory may declare its solution in a manifest.json instead of
+# leaving it to be guessed from file names:
+#
+#     {
+#       "entry": "day_7.py",
+#       "callables": {"parse": "parse", "part_1": "part_1", "part_2": "part_2"},
+#       "inputs": {"actual": "input.txt", "example": "example.txt"},
+#       "answers": {"actual": {"1": 3749}, "example": {"1": 3749, "2": 11387}},
+#       "budget": {"1": 0.5, "2": 2.0},
+#       "generator": "generator.py"
+#     }
+#
+# Every key is optional; "budget" may also be one number of seconds for both
+# parts. "generator" names a module in the day directory holding the day's
+# aoc_utils.input_generator, so the solution itself need not import it. Discovery reads the manifest and never prompts, answers are checked
+# by --test and the in-process runner, and perf.py will not record a timing
+# whose answer does not match.
+
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass
+class DayManifest:
+    """What a day directory declares about its solution (see section comment)."""
+
+    day_dir: Path
+    entry: Optional[str] = None
+    callables: dict = field(default_factory=dict)
+    inputs: dict = field(default_factory=dict)
+    answers: dict = field(default_factory=dict)  # kind -> {part: answer str}
+    budget: dict = field(default_factory=dict)  # part -> seconds
+    generator: Optional[str] = None  # module declaring the input generator
+
+    @classmethod
+    def load(cls, day_dir) -> "DayManifest":
+        """The day's manifest, or an empty one if it has none."""
+        day_dir = Path(day_dir)
+        try:
+            with open(day_dir / MANIFEST_NAME) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls(day_dir)
+        budget = data.get("budget", {})
+        if not isinstance(budget, dict):
+            budget = {1: budget, 2: budget}
+        return cls(
+            day_dir,
+            entry=data.get("entry"),
+            callables=data.get("callables", {}),
+            inputs=data.get("inputs", {}),
+            answers={
+                kind: {int(p): str(a) for p, a in parts.items()}
+                for kind, parts in data.get("answers", {}).items()
+            },
+            budget={int(p): float(seconds) for p, seconds in budget.items()},
+            generator=data.get("generator"),
+        )
+
+    @property
+    def path(self) -> Path:
+        return self.day_dir / MANIFEST_NAME
+
+    def save(self):
+        data = {
+            "entry": self.entry,
+            "callables": self.callables,
+            "inputs": self.inputs,
+            "answers": {
+                kind: {str(p): a for p, a in sorted(parts.items())}
+                for kind, parts in sorted(self.answers.items())
+            },
+            "budget": {str(p): s for p, s in sorted(self.budget.items())},
+            "generator": self.generator,
+        }
+        data = {key: value for key, value in data.items() if value}
+        self.path.write_text(json.dumps(data, indent=2) + "\n")
+
+    def input_file(self, example=False) -> Path:
+        default = "example.txt" if example else "input.txt"
+        return self.day_dir / self.inputs.get("example" if example else "actual", default)
+
+    def callable_name(self, name) -> str:
+        """Module attribute to call for parse/part_1/part_2/main."""
+        return self.callables.get(name, name)
+
+    def expected(self, part, example=False) -> Optional[str]:
+        return self.answers.get("example" if example else "actual", {}).get(part)
+
+    def check_answer(self, part, result, example=False) -> Optional[bool]:
+        """Whether result matches the declared answer; None if none is declared."""
+        expected = self.expected(part, example)
+        if expected is None:
+            return None
+        return result is not None and str(result).strip() == expected
 
 
 def find_solution_file(day_dir):
-    """Find the main solution file in a day directory."""
+    """Find the main solution file in a day directory, without prompting.
+
+    The manifest's entry wins; otherwise the usual file names are tried, then
+    a lone .py file. Days with several candidates need a manifest.
+    """
     day_path = Path(day_dir)
+    manifest = DayManifest.load(day_path)
+    if manifest.entry:
+        candidate = day_path / manifest.entry
+        return candidate if candidate.exists() else None
 
     # Look for common patterns
     patterns = [
@@ -28,26 +172,30 @@ def find_solution_file(day_dir):
             return candidate
 
     # If no pattern matches, look for any .py file that's not aoc_utils.py
-    py_files = [f for f in day_path.glob("*.py") if f.name != "aoc_utils.py"]
+    py_files = sorted(f for f in day_path.glob("*.py") if f.name != "aoc_utils.py")
     if len(py_files) == 1:
         return py_files[0]
     elif len(py_files) > 1:
-        print(f"Multiple Python files found in {day_dir}:")
-        for i, f in enumerate(py_files):
-            print(f"  {i+1}. {f.name}")
-        choice = input("Which file to run? (number): ")
-        try:
-            return py_files[int(choice) - 1]
-        except (ValueError, IndexError):
-            print("Invalid choice")
-            return None
+        names = ", ".join(f.name for f in py_files)
+        print(
+            f"Multiple Python files found in {day_dir} ({names});"
+            f" name the entry in {MANIFEST_NAME}"
+        )
 
     return None
 
 
 def run_solution(solution_file, part=None, example=False, log=False):
     """Run a solution file with the given parameters."""
-    cmd = ["python3", str(solution_file)]
+    return stream_solution(solution_file, part, example, log)[0]
+
+
+def stream_solution(solution_file, part=None, example=False, log=False):
+    """Run a solution file, echoing its output as it arrives.
+
+    Returns (success, output, seconds).
+    """
+    cmd = ["python3", solution_file.name]
 
     if part:
         cmd.extend(["-p", str(part)])
@@ -59,57 +207,1312 @@ def run_solution(solution_file, part=None, example=False, log=False):
     print(f"Running: {' '.join(cmd)}")
     print("-" * 50)
 
+    lines = []
+    start = time.perf_counter()
     try:
-        result = subprocess.run(cmd, cwd=solution_file.parent, capture_output=False)
-        return result.returncode == 0
+        with subprocess.Popen(
+            cmd,
+            cwd=solution_file.parent,
+            env=solution_env(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        ) as process:
+            for line in process.stdout:
+                print(line, end="", flush=True)
+                lines.append(line)
+        success = process.returncode == 0
     except Exception as e:
         print(f"Error running solution: {e}")
+        success = False
+    return success, "".join(lines), time.perf_counter() - start
+
+
+# In-process execution
+#
+# Running each part in a fresh `python3` process means every timing includes
+# interpreter startup and the imports of numpy/termcolor/aoc_utils. The helpers
+# below import a day module once and call its entry points directly, timing
+# each stage with perf_counter_ns.
+
+RESULT_PATTERNS = [
+    re.compile(r"Result for [Pp]art (\d)\s*:\s*(.*)"),
+    re.compile(r"^[Pp]art (\d)\s*:\s*(.+)$"),
+]
+
+
+@dataclass
+class LoadedSolution:
+    """A day module imported from its own directory."""
+
+    path: Path
+    module: ModuleType
+    import_ns: int
+    parsed: dict = field(default_factory=dict, repr=False)
+    manifest: Optional[DayManifest] = field(default=None, repr=False)
+
+    @property
+    def day_dir(self) -> Path:
+        return self.path.parent
+
+    def function(self, name):
+        """The module's parse/part_N/main, under the manifest's name for it."""
+        if self.manifest:
+            name = self.manifest.callable_name(name)
+        return getattr(self.module, name, None)
+
+    @property
+    def parse_once(self) -> bool:
+        """True when the day defines parse(data) and its parts take the result."""
+        return callable(self.function("parse"))
+
+    def entry_points(self) -> dict:
+        """Map part numbers to callables; key None means main() solves both.
+
+        Only functions callable with the input alone count, so a main taking
+        several inputs (e.g. 2021/Day4) is left to run as a script.
+        """
+        parts = {}
+        for part in (1, 2):
+            func = self.function(f"part_{part}")
+            if callable(func) and _required_args(func) <= 1:
+                parts[part] = func
+        main = self.function("main")
+        if not parts and callable(main) and _required_args(main) <= 1:
+            parts[None] = main
+        return parts
+
+
+@dataclass
+class PartResult:
+    """Outcome and timings of one in-process call."""
+
+    part: Optional[int]
+    result: Any = None
+    output: str = ""
+    import_ns: int = 0
+    parse_ns: Optional[int] = None
+    solve_ns: int = 0
+    error: Optional[str] = None
+    results: dict = field(default_factory=dict)
+    spans: list = field(default_factory=list)
+    parse_cached: bool = False
+    expected: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def correct(self) -> Optional[bool]:
+        """Whether the answer matches the manifest; None if none is declared."""
+        if self.expected is None or not self.ok:
+            return None
+        return self.result is not None and str(self.result).strip() == self.expected
+
+    @property
+    def total_ns(self) -> int:
+        return self.import_ns + (self.parse_ns or 0) + self.solve_ns
+
+
+class _Tee(io.StringIO):
+    """StringIO that also forwards writes to another stream."""
+
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+
+    def write(self, s):
+        self.stream.write(s)
+        return super().write(s)
+
+    def flush(self):
+        self.stream.flush()
+
+
+@contextlib.contextmanager
+def _in_day_dir(day_dir):
+    """Make the day directory the cwd and the first import location."""
+    day_dir = str(day_dir)
+    cwd = os.getcwd()
+    os.chdir(day_dir)
+    sys.path.insert(0, day_dir)
+    try:
+        yield
+    finally:
+        sys.path.remove(day_dir)
+        os.chdir(cwd)
+
+
+def load_solution(solution_file) -> LoadedSolution:
+    """Import a solution file without letting its local modules leak.
+
+    Day directories carry their own helper modules (often with generic names
+    like utils.py), so any same-named module already imported is hidden while
+    the day is imported, and the day's local modules are evicted afterwards.
+    """
+    path = Path(solution_file).resolve()
+    day_dir = path.parent
+    name = f"aoc_{day_dir.parent.name}_{day_dir.name}_{path.stem}".lower()
+    local_names = {f.stem for f in day_dir.glob("*.py")}
+    hidden = {n: sys.modules.pop(n) for n in local_names if n in sys.modules}
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        with _in_day_dir(day_dir):
+            start = time.perf_counter_ns()
+            spec.loader.exec_module(module)
+            import_ns = time.perf_counter_ns() - start
+    except BaseException:
+        sys.modules.pop(name, None)
+        raise
+    finally:
+        for local in local_names:
+            mod = sys.modules.get(local)
+            mod_file = getattr(mod, "__file__", None)
+            if mod_file and Path(mod_file).resolve().parent == day_dir:
+                del sys.modules[local]
+        sys.modules.update(hidden)
+
+    return LoadedSolution(path, module, import_ns, manifest=DayManifest.load(day_dir))
+
+
+def read_input(day_dir, example=False):
+    """Read the example or actual input the same way the day scripts do."""
+    with open(DayManifest.load(day_dir).input_file(example)) as f:
+        return f.read().strip()
+
+
+def _required_args(func):
+    """Number of positional parameters without defaults."""
+    try:
+        params = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return 0
+    return sum(
+        1
+        for p in params
+        if p.default is p.empty and p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+    )
+
+
+def _entry_call(func, log):
+    """Caller of part_N/main taking the input, with log passed by keyword.
+
+    log is only passed if func has a parameter of that name; other optional
+    parameters keep their defaults. The signature is inspected here, once,
+    rather than inside the timed span.
+    """
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        params = {}
+    kwargs = {"log": log} if "log" in params else {}
+    return lambda data: _invoke(func, (data,), kwargs)
+
+
+def _invoke(func, args, kwargs):
+    """The boundary between harness and solution code; profiles are rooted here."""
+    return func(*args, **kwargs)
+
+
+def results_from_output(output):
+    """Pick 'Result for Part N: X' / 'Part N: X' answers out of printed output.
+
+    The answer may also be on the line after 'Result for part N:'.
+    """
+    results = {}
+    lines = [line.strip() for line in output.splitlines()]
+    for i, line in enumerate(lines):
+        for pattern in RESULT_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                answer = match.group(2).strip()
+                if not answer and i + 1 < len(lines):
+                    answer = lines[i + 1]
+                if answer:
+                    results.setdefault(int(match.group(1)), answer)
+                break
+    return results
+
+
+def _parse_once(solution, data, tracer, reuse=True, parser=None):
+    """Return parse(data) for a parse-once solution and whether it was cached.
+
+    Only the most recent input is kept, so switching between example and
+    actual input re-parses instead of growing the cache.
+    """
+    if reuse and data in solution.parsed:
+        return solution.parsed[data], True
+    with tracer.span("parse"):
+        parsed = (parser or solution.function("parse"))(data)
+    if reuse:
+        solution.parsed = {data: parsed}
+    return parsed, False
+
+
+def _with_parse_cache(func, cache):
+    """Wrap a parser with the on-disk parse cache unless the day already does.
+
+    cache is an aoc_utils.ParseCache, True for the repo-wide cache, or None.
+    """
+    if cache is None or getattr(func, "__cached_parse__", False):
+        return func
+    if cache is True:
+        cache = aoc_utils.PARSE_CACHE
+    return aoc_utils.cached_parse(func, cache=cache)
+
+
+def run_part_in_process(
+    solution, part, data, log=False, quiet=True, reuse_parsed=True, parse_cache=None
+) -> PartResult:
+    """Call one entry point of a loaded solution and time it.
+
+    The call runs with the solution's aoc_utils tracer enabled. For parse-once
+    solutions parse(data) runs inside the part's span and its result is handed
+    to the part; with `reuse_parsed` a later part given the same input gets
+    the cached object and reports parse_cached instead of a parse time. For
+    older solutions the module's parse_input() is traced if the day has not
+    done so itself. Time spent in parse spans is reported as parse_ns and
+    subtracted from solve_ns; every recorded span is kept in PartResult.spans.
+
+    With parse_cache (an aoc_utils.ParseCache, or True for the repo's), the
+    parser is looked up in and stored to that on-disk cache, so parse_ns
+    becomes the cache load time on a hit.
+    """
+    entry = solution.entry_points()
+    func = entry.get(part, entry.get(None))
+    outcome = PartResult(part=part, import_ns=solution.import_ns)
+    if func is None:
+        wanted = f"part_{part}" if part else "part_N"
+        outcome.error = f"No {wanted} or main(data) entry point in {solution.path.name}"
+        return outcome
+
+    tracer = aoc_utils.TRACER
+    module = solution.module
+    parse_once = solution.parse_once
+    parse = None if parse_once else getattr(module, "parse_input", None)
+    wrap_parse = callable(parse) and (
+        parse_cache is not None or not getattr(parse, "__traced__", False)
+    )
+    if wrap_parse:
+        module.parse_input = aoc_utils.traced(
+            _with_parse_cache(parse, parse_cache), name="parse_input"
+        )
+    parser = None
+    if parse_once:
+        parser = _with_parse_cache(solution.function("parse"), parse_cache)
+
+    call = _entry_call(func, log)
+    buffer = io.StringIO() if quiet else _Tee(sys.stdout)
+    tracer.reset()
+    tracer.enable()
+    try:
+        with _in_day_dir(solution.day_dir), contextlib.redirect_stdout(buffer):
+            with tracer.span(f"part_{part}" if part else "main"):
+                arg = data
+                if parse_once:
+                    arg, outcome.parse_cached = _parse_once(
+                        solution, data, tracer, reuse_parsed, parser
+                    )
+                outcome.result = call(arg)
+    except (Exception, SystemExit):
+        outcome.error = traceback.format_exc()
+    finally:
+        tracer.disable()
+        if wrap_parse:
+            module.parse_input = parse
+
+    outcome.spans = list(tracer.spans)
+    elapsed = outcome.spans[-1].duration_ns if outcome.spans else 0
+    if parse_once:
+        outcome.parse_ns = tracer.total_ns("parse")
+    elif callable(parse):
+        outcome.parse_ns = tracer.total_ns("parse_input")
+    outcome.solve_ns = elapsed - (outcome.parse_ns or 0)
+    tracer.reset()
+
+    outcome.output = buffer.getvalue()
+    outcome.results = results_from_output(outcome.output)
+    if outcome.result is None and part is not None:
+        outcome.result = outcome.results.get(part)
+    return outcome
+
+
+def run_in_process(
+    solution_file, part=None, example=False, log=False, quiet=False, parse_cache=None
+):
+    """Import a solution once and run the requested part(s) in this process.
+
+    Returns a list of PartResult, one per part run (a single entry with
+    part=None for main()-style solutions that solve both parts at once).
+    """
+    solution = load_solution(solution_file)
+    data = read_input(solution.day_dir, example)
+    entry = solution.entry_points()
+    if part is not None:
+        parts = [part]
+    elif None in entry or not entry:
+        parts = [None]  # With no entry point, a single outcome carries the error
+    else:
+        parts = sorted(entry)
+    outcomes = []
+    for p in parts:
+        outcome = run_part_in_process(solution, p, data, log, quiet, parse_cache=parse_cache)
+        outcome.expected = solution.manifest.expected(p, example)
+        outcomes.append(outcome)
+    return outcomes
+
+
+def write_manifest(solution_file):
+    """Create or update the day's manifest from in-process runs of the solution.
+
+    The entry becomes solution_file and the answers it gives on each existing
+    input are recorded as the expected ones, so check them before relying on
+    the manifest. Declared callables, inputs and budget are kept.
+    """
+    solution_file = Path(solution_file).resolve()
+    manifest = DayManifest.load(solution_file.parent)
+    manifest.entry = solution_file.name
+    for example, kind in ((True, "example"), (False, "actual")):
+        if not manifest.input_file(example).exists():
+            continue
+        for outcome in run_in_process(solution_file, example=example, quiet=True):
+            if not outcome.ok:
+                reason = outcome.error.strip().splitlines()[-1][:120]
+                print(f"Not recording {kind} answers: {reason}")
+                continue
+            found = outcome.results if outcome.part is None else {outcome.part: outcome.result}
+            for part, answer in found.items():
+                if answer is not None:
+                    manifest.answers.setdefault(kind, {})[part] = str(answer).strip()
+    manifest.save()
+    return manifest
+
+
+def format_ns(ns):
+    """Human readable duration for a nanosecond count."""
+    if ns is None:
+        return "-"
+    if ns < 1_000_000:
+        return f"{ns / 1_000:.1f}µs"
+    if ns < 1_000_000_000:
+        return f"{ns / 1_000_000:.2f}ms"
+    return f"{ns / 1_000_000_000:.3f}s"
+
+
+def print_part_result(outcome):
+    """Print the answer and timing breakdown of a PartResult."""
+    label = f"Part {outcome.part}" if outcome.part else "main"
+    if not outcome.ok:
+        print(f"{label}: failed")
+        print(outcome.error)
+        return
+    answer = outcome.result
+    if answer is None and outcome.results:
+        answer = ", ".join(f"Part {p}: {r}" for p, r in sorted(outcome.results.items()))
+    parse = "cached" if outcome.parse_cached else format_ns(outcome.parse_ns)
+    if outcome.correct is not None:
+        answer = f"{answer} ✅" if outcome.correct else f"{answer} ❌ (expected {outcome.expected})"
+    print(
+        f"{label}: {answer}  "
+        f"(import {format_ns(outcome.import_ns)}, parse {parse}, "
+        f"solve {format_ns(outcome.solve_ns)})"
+    )
+
+
+def benchmark_in_process(solution_file, runs=5):
+    """Benchmark a solution by importing it once and calling each part `runs` times."""
+    solution = load_solution(solution_file)
+    data = read_input(solution.day_dir)
+    print(f"Imported {solution.path.name} in {format_ns(solution.import_ns)}")
+
+    for part in sorted(solution.entry_points(), key=lambda p: p or 0):
+        label = f"Part {part}" if part else "main"
+        print(f"\nBenchmarking {label} in-process ({runs} runs)...")
+        solve, parse = [], []
+        for i in range(runs):
+            outcome = run_part_in_process(solution, part, data, reuse_parsed=False)
+            if not outcome.ok:
+                print(f"  Run {i+1}: failed\n{outcome.error}")
+                break
+            solve.append(outcome.solve_ns)
+            parse.append(outcome.parse_ns)
+            print(f"  Run {i+1}: {format_ns(outcome.solve_ns)}")
+
+        if solve:
+            print(f"  Average: {format_ns(sum(solve) // len(solve))}")
+            print(f"  Min: {format_ns(min(solve))}")
+            print(f"  Max: {format_ns(max(solve))}")
+            if parse[0] is not None:
+                print(f"  Parse (min): {format_ns(min(parse))}")
+
+
+# Memory tracking
+#
+# tracemalloc only reports where live memory was allocated when a snapshot is
+# taken, and by the time a part returns its big structures are gone. While a
+# part runs, a profile hook therefore takes a fresh snapshot whenever traced
+# memory grows 10% past the last one, so the reported sites are those live
+# near the peak. This slows the solve down considerably, so it is opt-in and
+# its timings are not recorded.
+
+
+@dataclass
+class MemoryResult:
+    """Peak memory use of one part."""
+
+    part: Optional[int]
+    peak_bytes: int = 0
+    blocks: int = 0
+    maxrss_kb: Optional[int] = None
+    top_sites: list = field(default_factory=list)
+    result: Any = None
+    error: Optional[str] = None
+
+
+class _PeakSnapshotter:
+    """Profile hook keeping a tracemalloc snapshot taken close to the peak."""
+
+    GROWTH = 1.1
+
+    def __init__(self):
+        self.snapshot = None
+        self.snapshot_size = 0
+
+    def __call__(self, frame, event, arg):
+        if event in ("return", "c_return"):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.snapshot_size * self.GROWTH:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size = current
+
+    def __enter__(self):
+        sys.setprofile(self)
+        return self
+
+    def __exit__(self, *exc):
+        sys.setprofile(None)
+
+
+def _maxrss_kb():
+    """Peak resident set size of this process in KiB, if the platform reports it.
+
+    Linux's ru_maxrss survives exec, so a spawned child would start from its
+    parent's peak; VmHWM belongs to the child's own address space.
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB on Linux.
+    return maxrss // 1024 if sys.platform == "darwin" else maxrss
+
+
+def measure_memory(solution_file, part, example=False, top=5) -> MemoryResult:
+    """Run one part in-process under tracemalloc and report its memory use.
+
+    maxrss_kb is the high-water mark of the whole process, so call this in a
+    fresh process (measure_memory_isolated) for a per-part figure.
+    """
+    solution = load_solution(solution_file)
+    data = read_input(solution.day_dir, example)
+    memory = MemoryResult(part=part)
+
+    tracemalloc.start()
+    try:
+        with _PeakSnapshotter() as snapshotter:
+            outcome = run_part_in_process(solution, part, data)
+        _, memory.peak_bytes = tracemalloc.get_traced_memory()
+        snapshot = snapshotter.snapshot or tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    memory.result, memory.error = outcome.result, outcome.error
+    memory.maxrss_kb = _maxrss_kb()
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, inspect.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+    stats = snapshot.statistics("lineno")
+    memory.blocks = sum(stat.count for stat in stats)
+    memory.top_sites = [
+        {
+            "site": f"{Path(stat.traceback[0].filename).name}:{stat.traceback[0].lineno}",
+            "size": stat.size,
+            "count": stat.count,
+        }
+        for stat in stats[:top]
+    ]
+    return memory
+
+
+def measure_memory_isolated(solution_file, part, example=False, timeout=120):
+    """Run measure_memory in a fresh interpreter so max RSS is per part."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        future = pool.submit(measure_memory, Path(solution_file).resolve(), part, example)
+        try:
+            return future.result(timeout=timeout)
+        except Exception as e:
+            return MemoryResult(part=part, error=f"{type(e).__name__}: {e}")
+
+
+def format_bytes(size):
+    """Human readable size for a byte count."""
+    if size is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f}{unit}" if unit != "B" else f"{size}B"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+def print_memory_result(memory):
+    """Print the peak, RSS and top allocation sites of a MemoryResult."""
+    label = f"Part {memory.part}" if memory.part else "main"
+    if memory.error:
+        print(f"{label}: failed")
+        print(memory.error)
+        return
+    rss = None if memory.maxrss_kb is None else memory.maxrss_kb * 1024
+    print(
+        f"{label}: {memory.result}  (peak {format_bytes(memory.peak_bytes)}, "
+        f"{memory.blocks} blocks, max RSS {format_bytes(rss)})"
+    )
+    for site in memory.top_sites:
+        print(f"  {site['site']}: {format_bytes(site['size'])} in {site['count']} blocks")
+
+
+# Profiling
+#
+# Deterministic mode runs the part under cProfile and writes the raw .pstats
+# plus a collapsed-stack file (one "a;b;c <µs>" line per stack) for
+# flamegraph.pl / speedscope. cProfile only records caller->callee edges, so
+# the stacks are rebuilt by splitting each function's time across its callers
+# in proportion to the edge times. Sampling mode instead records the real
+# stack of the solving thread every `interval` seconds, which costs far less
+# on long runs.
+
+
+def _frame_label(filename, lineno, name):
+    if filename == "~":  # built-in
+        return name.replace(";", ":")
+    return f"{name} ({Path(filename).name}:{lineno})".replace(";", ":")
+
+
+def pstats_to_collapsed(stats, root=None, max_depth=64):
+    """Collapsed stack lines rebuilt from a pstats.Stats call graph.
+
+    Stacks start at the callees of `root` (a code object) when given, else at
+    every function with no recorded caller.
+    """
+    raw = stats.stats
+    children = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((func, edge[3]))
+
+    totals = {}
+
+    def walk(func, stack, scale):
+        _, _, tt, ct, _ = raw[func]
+        if tt * scale > 0:
+            key = ";".join(stack)
+            totals[key] = totals.get(key, 0) + tt * scale
+        if len(stack) >= max_depth:
+            return
+        for callee, edge_ct in children.get(func, ()):
+            callee_ct = raw[callee][3]
+            if callee == func or not callee_ct or _frame_label(*callee) in stack:
+                continue
+            walk(callee, stack + [_frame_label(*callee)], scale * edge_ct / callee_ct)
+
+    if root is not None:
+        root_key = (root.co_filename, root.co_firstlineno, root.co_name)
+        for callee, edge_ct in children.get(root_key, ()):
+            if raw[callee][3]:
+                walk(callee, [_frame_label(*callee)], edge_ct / raw[callee][3])
+    else:
+        for func, (_, _, _, _, callers) in raw.items():
+            if not callers:
+                walk(func, [_frame_label(*func)], 1.0)
+
+    return [f"{stack} {round(t * 1e6)}" for stack, t in totals.items() if round(t * 1e6)]
+
+
+class StackSampler:
+    """Samples one thread's Python stack on a background thread."""
+
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts = {}
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        harness = str(Path(__file__).resolve())
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                if code.co_filename == harness:
+                    break  # everything above this is run.py itself
+                stack.append(_frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if stack:
+                key = ";".join(reversed(stack))
+                self.counts[key] = self.counts.get(key, 0) + 1
+                self.samples += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self):
+        return [f"{stack} {count}" for stack, count in self.counts.items()]
+
+    def print_top(self, top=15):
+        self_counts, cumulative = {}, {}
+        for stack, count in self.counts.items():
+            frames = stack.split(";")
+            self_counts[frames[-1]] = self_counts.get(frames[-1], 0) + count
+            for frame in set(frames):
+                cumulative[frame] = cumulative.get(frame, 0) + count
+        for title, counts in (("cumulative", cumulative), ("self", self_counts)):
+            print(f"\nTop {top} functions by {title} samples ({self.samples} samples):")
+            ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+            for frame, count in ranked[:top]:
+                print(f"  {count / self.samples:6.1%}  {frame}")
+
+
+def profile_part(
+    solution_file, part, example=False, mode="deterministic", top=15, interval=0.001
+):
+    """Profile one part and write .pstats/.collapsed files next to the solution.
+
+    Returns (PartResult, [written paths]).
+    """
+    solution = load_solution(solution_file)
+    data = read_input(solution.day_dir, example)
+    label = f"part{part}" if part else "main"
+    stem = solution.day_dir / f"{solution.path.stem}_{label}"
+    written = []
+
+    if mode == "sample":
+        with StackSampler(threading.get_ident(), interval) as sampler:
+            outcome = run_part_in_process(solution, part, data)
+        collapsed = sampler.collapsed()
+        sampler.print_top(top)
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        outcome = run_part_in_process(solution, part, data)
+        profiler.disable()
+        stats = pstats.Stats(profiler)
+        pstats_path = stem.with_suffix(".pstats")
+        stats.dump_stats(pstats_path)
+        written.append(pstats_path)
+        collapsed = pstats_to_collapsed(stats, root=_invoke.__code__)
+        for sort_key in ("cumulative", "tottime"):
+            print(f"\nTop {top} functions by {sort_key} time:")
+            stats.sort_stats(sort_key).print_stats(top)
+
+    collapsed_path = stem.with_suffix(".collapsed")
+    collapsed_path.write_text("\n".join(collapsed) + "\n")
+    written.append(collapsed_path)
+    return outcome, written
+
+
+# Result cache
+#
+# Re-running an unchanged day only reproduces its last answers. A day's
+# fingerprint hashes the solution file, the local modules it imports (and the
+# shared aoc_utils package), the input file, the day's manifest and the
+# interpreter version; while it matches, run.py --test and perf.py
+# --benchmark-all reuse the stored outcome instead of running the day again.
+
+
+def local_imports(solution_file):
+    """Source files of the local modules a solution imports, transitively.
+
+    Modules are looked up in the day directory; importing aoc_utils adds every
+    file of the shared package. Standard library and installed packages are
+    ignored.
+    """
+    solution_file = Path(solution_file).resolve()
+    day_dir = solution_file.parent
+    found, pending = [], [solution_file]
+    while pending:
+        path = pending.pop()
+        try:
+            tree = ast.parse(path.read_text(), filename=str(path))
+        except (OSError, SyntaxError):
+            continue
+        names = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.update(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names.add(node.module.split(".")[0])
+        for name in sorted(names):
+            candidates = [day_dir / f"{name}.py", day_dir / name / "__init__.py"]
+            module_file = next((c for c in candidates if c.exists()), None)
+            if module_file and module_file not in found and module_file != solution_file:
+                found.append(module_file)
+                pending.append(module_file)
+            elif name == "aoc_utils" and module_file is None:
+                # The shared package imports its submodules lazily, so
+                # there are no import statements to follow.
+                for package_file in sorted((REPO_DIR / "aoc_utils").glob("*.py")):
+                    if package_file not in found:
+                        found.append(package_file)
+    return sorted(found)
+
+
+def solution_fingerprint(solution_file, example=False, extra=""):
+    """Hash of everything a day's answers depend on (see section comment)."""
+    solution_file = Path(solution_file).resolve()
+    manifest = DayManifest.load(solution_file.parent)
+    in_file = manifest.input_file(example)
+    digest = hashlib.sha256()
+    for path in [solution_file, *local_imports(solution_file), in_file, manifest.path]:
+        digest.update(path.name.encode() + b"\0")
+        digest.update(path.read_bytes() if path.exists() else b"<missing>")
+        digest.update(b"\0")
+    digest.update(sys.version.encode())
+    digest.update(extra.encode())
+    return digest.hexdigest()
+
+
+def day_key(solution_file):
+    """(year, day) of a solution file under YEAR/DayN/."""
+    day_dir = Path(solution_file).resolve().parent
+    return int(day_dir.parent.name), int(day_dir.name.replace("Day", ""))
+
+
+class ResultCache:
+    """Last outcome per (year, day, part, kind), valid while its fingerprint matches.
+
+    Lives in performance.db next to perf.py's measurements.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS result_cache (
+            year INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            part INTEGER NOT NULL,
+            kind TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (year, day, part, kind)
+        );
+    """
+
+    def __init__(self, data_file=REPO_DIR / "performance.db"):
+        self.conn = sqlite3.connect(data_file)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def get(self, year, day, part, kind, fingerprint):
+        """Return (data, timestamp) for a matching entry, or None."""
+        row = self.conn.execute(
+            "SELECT data, timestamp FROM result_cache"
+            " WHERE year = ? AND day = ? AND part = ? AND kind = ? AND fingerprint = ?",
+            (year, day, part, kind, fingerprint),
+        ).fetchone()
+        return None if row is None else (json.loads(row[0]), row[1])
+
+    def put(self, year, day, part, kind, fingerprint, data):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO result_cache"
+                " (year, day, part, kind, fingerprint, timestamp, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    year,
+                    day,
+                    part,
+                    kind,
+                    fingerprint,
+                    datetime.now().isoformat(),
+                    json.dumps(data, default=str),
+                ),
+            )
+
+
+# Warm worker
+#
+# worker.py keeps a long-lived interpreter with numpy and friends imported and
+# each day module loaded, re-importing a day only when one of its files
+# changes. --warm sends runs to it (starting it on first use) and --watch
+# re-runs through it whenever the solution, its local imports or its inputs
+# are saved.
+
+
+def run_warm(solution_file, part=None, example=False, log=False):
+    """Run through the warm worker and print the outcomes; returns success."""
+    import worker
+
+    response = worker.run_warm(solution_file, part, example, log)
+    if "outcomes" not in response:
+        print(f"Worker error: {response.get('error')}")
         return False
+    for fields in response["outcomes"]:
+        fields["results"] = {int(p): r for p, r in fields["results"].items()}
+        outcome = PartResult(**fields)
+        if log and outcome.output:
+            print(outcome.output, end="")
+        print_part_result(outcome)
+    state = "reloaded" if response["reloaded"] else "warm"
+    print(f"  ({state}, round trip {format_ns(response['client_ns'])})")
+    return response["ok"]
+
+
+def watched_files(solution_file):
+    """Files whose changes should trigger a re-run in --watch mode."""
+    manifest = DayManifest.load(Path(solution_file).resolve().parent)
+    inputs = [manifest.input_file(False), manifest.input_file(True), manifest.path]
+    return [Path(solution_file).resolve(), *local_imports(solution_file), *inputs]
+
+
+def watch(solution_file, part=None, example=False, log=False, interval=0.3):
+    """Re-run a solution through the warm worker every time one of its files changes."""
+
+    def snapshot():
+        return {p: p.stat().st_mtime_ns for p in watched_files(solution_file) if p.exists()}
+
+    seen = None
+    print(f"Watching {solution_file} (Ctrl-C to stop)")
+    try:
+        while True:
+            current = snapshot()
+            if current != seen:
+                seen = current
+                print("-" * 50)
+                run_warm(solution_file, part, example, log)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print()
+
+
+# Run all
+#
+# --all runs every day of a year (or of every year) in a small pool of warm
+# worker processes: each imports the heavy third-party modules once and then
+# runs days in-process as the parent hands them out. A day that overruns its
+# timeout has its worker killed and replaced. The report is a calendar of
+# answers and times, checked against a whole-year budget. A part that runs
+# but returns no answer (an unfinished day) is reported as such, not as a
+# success.
+
+
+@dataclass
+class DayRun:
+    """Answers and time of one day run by run_all."""
+
+    year: int
+    day: int
+    answers: dict = field(default_factory=dict)  # part -> answer
+    correct: dict = field(default_factory=dict)  # part -> True/False/None
+    missing: list = field(default_factory=list)  # parts that gave no answer
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        """"error", "wrong", "no answer" or "ok", worst first."""
+        if self.error is not None:
+            return "error"
+        if False in self.correct.values():
+            return "wrong"
+        if self.missing:
+            return "no answer"
+        return "ok"
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+def find_days(year=None, base_dir=REPO_DIR):
+    """(year, day, solution_file) for every day with a solution, in order."""
+    days = []
+    for year_dir in sorted(base_dir.iterdir()):
+        if not (year_dir.is_dir() and year_dir.name.isdigit()):
+            continue
+        if year and int(year_dir.name) != year:
+            continue
+        day_dirs = [d for d in year_dir.iterdir() if d.is_dir() and d.name.startswith("Day")]
+        for day_dir in sorted(day_dirs, key=lambda d: int(d.name[3:])):
+            solution_file = find_solution_file(day_dir)
+            if solution_file:
+                days.append((int(year_dir.name), int(day_dir.name[3:]), solution_file))
+    return days
+
+
+def _run_day(solution_file):
+    """Run every part of a day in this process; returns a DayRun as a dict."""
+    year, day = day_key(solution_file)
+    run = DayRun(year, day)
+    try:
+        outcomes = run_in_process(solution_file, quiet=True)
+    except BaseException as e:
+        run.error = f"{type(e).__name__}: {e}"
+        return run.__dict__
+
+    run.seconds = outcomes[0].import_ns / 1e9 if outcomes else 0.0
+    for outcome in outcomes:
+        run.seconds += ((outcome.parse_ns or 0) + outcome.solve_ns) / 1e9
+        if not outcome.ok:
+            run.error = outcome.error.strip().splitlines()[-1]
+            continue
+        if outcome.part is None:
+            run.answers.update(outcome.results)
+        elif outcome.result is not None:
+            run.answers[outcome.part] = outcome.result
+            run.correct[outcome.part] = outcome.correct
+    if run.error is None:
+        run.missing = [part for part in (1, 2) if run.answers.get(part) is None]
+    run.answers = {part: str(answer) for part, answer in run.answers.items()}
+    return run.__dict__
+
+
+def _day_worker(conn):
+    """Pool worker: run each solution file received until sent None."""
+    from worker import PRELOAD
+
+    for name in PRELOAD:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+    # Solutions print freely (some at import time); only the results matter.
+    sys.stdout = open(os.devnull, "w")
+    while True:
+        solution_file = conn.recv()
+        if solution_file is None:
+            break
+        conn.send(_run_day(solution_file))
+
+
+def run_all(days, workers=1, timeout=10.0):
+    """Run (year, day, solution_file) days in a warm pool, yielding DayRuns.
+
+    Results arrive in completion order. workers defaults to 1 so that days
+    do not compete for the CPU while being timed.
+    """
+    import multiprocessing
+    from multiprocessing.connection import wait
+
+    context = multiprocessing.get_context("spawn")
+
+    def start_worker():
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(target=_day_worker, args=(child_conn,), daemon=True)
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    pending = list(reversed(days))
+    idle = [start_worker() for _ in range(max(1, min(workers, len(days))))]
+    busy = {}  # conn -> (worker, (year, day), deadline)
+    try:
+        while pending or busy:
+            while idle and pending:
+                worker = idle.pop()
+                year, day, solution_file = pending.pop()
+                worker[1].send(str(solution_file))
+                busy[worker[1]] = (worker, (year, day), time.monotonic() + timeout)
+
+            next_deadline = min(deadline for _, _, deadline in busy.values())
+            for conn in wait(list(busy), timeout=max(0.0, next_deadline - time.monotonic())):
+                worker, (year, day), _ = busy.pop(conn)
+                try:
+                    yield DayRun(**conn.recv())
+                    idle.append(worker)
+                except EOFError:
+                    worker[0].join()
+                    yield DayRun(year, day, error=f"Worker exited with code {worker[0].exitcode}")
+                    idle.append(start_worker())
+
+            now = time.monotonic()
+            for conn, (worker, (year, day), deadline) in list(busy.items()):
+                if now >= deadline:
+                    del busy[conn]
+                    worker[0].kill()
+                    worker[0].join()
+                    yield DayRun(year, day, seconds=timeout, error=f"Timed out after {timeout:g}s")
+                    idle.append(start_worker())
+    finally:
+        for process, conn in idle:
+            conn.send(None)
+        for process, conn in [*idle, *(worker for worker, _, _ in busy.values())]:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.kill()
+
+
+def _shorten(text, width):
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+def print_calendar(year, runs, budget=1.0, top=5):
+    """Print one year's answers, times and shares, then check the budget.
+
+    Returns True if every day ran, answered both parts, matched its
+    manifest and the year fits the budget.
+    """
+    total = sum(run.seconds for run in runs)
+    print(f"\n{year}")
+    print(f"{'Day':>4}  {'Part 1':<20} {'Part 2':<20} {'Time':>9} {'Share':>6}")
+    for run in sorted(runs, key=lambda r: r.day):
+        cells = []
+        for part in (1, 2):
+            if part in run.missing:
+                cells.append("(no answer)")
+                continue
+            answer = run.answers.get(part, "-")
+            mark = {True: "✅ ", False: "❌ "}.get(run.correct.get(part), "")
+            cells.append(_shorten(mark + answer, 20))
+        share = run.seconds / total if total else 0.0
+        bar = "█" * round(share * 20)
+        line = (
+            f"{run.day:>4}  {cells[0]:<20} {cells[1]:<20} {run.seconds:>8.4f}s"
+            f" {share:>6.1%} {bar}"
+        )
+        if run.error:
+            line += f"  {_shorten(run.error, 60)}"
+        print(line)
+
+    over = total > budget
+    verdict = f"over by {total - budget:.4f}s" if over else "within budget"
+    print(f"Total {total:.4f}s of a {budget:g}s budget ({total / budget:.0%}, {verdict})")
+    statuses = Counter(run.status for run in runs)
+    print(
+        "Days: "
+        + ", ".join(
+            f"{statuses[status]} {status}"
+            for status in ("ok", "no answer", "wrong", "error")
+            if statuses[status]
+        )
+    )
+    ranked = sorted(runs, key=lambda r: r.seconds, reverse=True)[:top]
+    if over and ranked:
+        print("Biggest shares of the budget:")
+        for rank, run in enumerate(ranked, 1):
+            print(
+                f"  {rank}. Day {run.day:<3} {run.seconds:.4f}s"
+                f"  {run.seconds / budget:.0%} of the budget"
+            )
+    return not over and all(run.ok for run in runs)
 
 
-def test_solution(day_dir):
-    """Test a solution against both example and actual input."""
+# Concurrent testing
+#
+# --test runs both parts on the example and the actual input as four
+# concurrent subprocesses, so checking a day takes about as long as its
+# slowest run rather than the sum of all four. Output lines are prefixed with
+# the run they came from. An example run that fails (error, timeout or wrong
+# answer) cancels the actual-input runs still in flight.
+
+TEST_RUNS = [(1, True), (1, False), (2, True), (2, False)]
+
+
+def _run_label(part, example):
+    return f"[P{part} {'example' if example else 'actual'}]"
+
+
+def _check_answer(solution_file, part, example, result):
+    """Compare result with the manifest's answer; False only on a mismatch."""
+    manifest = DayManifest.load(Path(solution_file).parent)
+    verdict = manifest.check_answer(part, result, example)
+    label = _run_label(part, example)
+    if verdict is False:
+        print(f"{label} ❌ got {result}, expected {manifest.expected(part, example)}")
+    elif verdict:
+        print(f"{label} ✅ matches the expected answer")
+    return verdict is not False
+
+
+async def stream_solution_async(solution_file, part, example=False, log=False, timeout=60.0):
+    """Run one part as a subprocess, printing its output prefixed by the run.
+
+    Returns (success, output, seconds). A run that overruns timeout, or whose
+    task is cancelled, has its process killed.
+    """
+    cmd = ["python3", solution_file.name, "-p", str(part)]
+    if example:
+        cmd.append("-e")
+    if log:
+        cmd.append("-l")
+    label = _run_label(part, example)
+
+    lines = []
+    start = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=solution_file.parent,
+        env=solution_env(),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        limit=2**20,  # Some days print whole grids on one line
+    )
+
+    async def pump():
+        async for raw in process.stdout:
+            line = raw.decode(errors="replace").rstrip("\n")
+            print(f"{label} {line}", flush=True)
+            lines.append(line + "\n")
+        return await process.wait()
+
+    try:
+        returncode = await asyncio.wait_for(pump(), timeout)
+    except asyncio.TimeoutError:
+        print(f"{label} timed out after {timeout:g}s")
+        returncode = None
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    return returncode == 0, "".join(lines), time.perf_counter() - start
+
+
+async def _test_run(solution_file, part, example, cache, force, timeout):
+    """One --test run, answered from the result cache while the day is unchanged.
+
+    A run whose answer contradicts the day's manifest counts as a failure and
+    is not cached.
+    """
+    label = _run_label(part, example)
+    if cache is not None:
+        year, day = day_key(solution_file)
+        kind = "test-example" if example else "test-actual"
+        fingerprint = solution_fingerprint(solution_file, example)
+        cached = None if force else cache.get(year, day, part, kind, fingerprint)
+        if cached:
+            data, timestamp = cached
+            print(f"{label} unchanged since {timestamp}, cached answer: {data['result']}")
+            return True
+
+    success, output, seconds = await stream_solution_async(
+        solution_file, part, example, log=example, timeout=timeout
+    )
+    result = results_from_output(output).get(part)
+    success = _check_answer(solution_file, part, example, result) and success
+    if cache is not None and success and result is not None:
+        data = {"result": result, "seconds": seconds}
+        cache.put(year, day, part, kind, fingerprint, data)
+    return success
+
+
+async def test_solution_async(solution_file, cache=None, force=False, timeout=60.0):
+    """Run the four --test runs concurrently; returns {(part, example): status}.
+
+    status is "ok", "failed" or "cancelled".
+    """
+    tasks = {
+        asyncio.create_task(_test_run(solution_file, part, example, cache, force, timeout)): (
+            part,
+            example,
+        )
+        for part, example in TEST_RUNS
+    }
+    statuses = {}
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            part, example = tasks[task]
+            if task.cancelled():
+                statuses[part, example] = "cancelled"
+                continue
+            error = task.exception()
+            if error is not None:
+                print(f"{_run_label(part, example)} {type(error).__name__}: {error}")
+            ok = error is None and task.result()
+            statuses[part, example] = "ok" if ok else "failed"
+            if example and not ok:
+                for other in pending:
+                    if not tasks[other][1]:
+                        other.cancel()
+    return statuses
+
+
+def test_solution(day_dir, cache=None, force=False, timeout=60.0):
+    """Test a solution against both example and actual input, concurrently.
+
+    With a ResultCache, runs whose fingerprint matches a previous successful
+    run print the cached answer instead; force re-runs them regardless. Any
+    answer contradicting the day's manifest makes the test fail. Each run is
+    killed after timeout seconds.
+    """
     solution_file = find_solution_file(day_dir)
     if not solution_file:
         print(f"No solution file found in {day_dir}")
         return False
 
     print(f"Testing solution: {solution_file}")
+    start = time.perf_counter()
+    statuses = asyncio.run(test_solution_async(solution_file, cache, force, timeout))
 
-    # Test Part 1 with example
-    print("\n=== Part 1 (Example) ===")
-    success = run_solution(solution_file, part=1, example=True, log=True)
-
-    if success:
-        print("\n=== Part 1 (Actual) ===")
-        run_solution(solution_file, part=1, example=False)
+    print("\n=== Summary ===")
+    for part, example in TEST_RUNS:
+        print(f"  Part {part} ({'example' if example else 'actual'}): {statuses[part, example]}")
+    print(f"  Finished in {time.perf_counter() - start:.2f}s")
+    return all(status == "ok" for status in statuses.values())
 
-        print("\n=== Part 2 (Example) ===")
-        success = run_solution(solution_file, part=2, example=True, log=True)
 
-        if success:
-            print("\n=== Part 2 (Actual) ===")
-            run_solution(solution_file, part=2, example=False)
-
-
-def benchmark_solution(day_dir, runs=5):
+def benchmark_solution(day_dir, runs=5, in_process=False):
     """Benchmark a solution by running it multiple times."""
     solution_file = find_solution_file(day_dir)
     if not solution_file:
         print(f"No solution file found in {day_dir}")
         return
 
-    import time
+    if in_process:
+        return benchmark_in_process(solution_file, runs)
 
     for part in [1, 2]:
         times = []
         print(f"\nBenchmarking Part {part} ({runs} runs)...")
 
         for i in range(runs):
-            start = time.time()
-            cmd = ["python3", str(solution_file), "-p", str(part)]
-            subprocess.run(cmd, cwd=solution_file.parent, capture_output=True)
-            end = time.time()
+            start = time.perf_counter()
+            cmd = ["python3", solution_file.name, "-p", str(part)]
+            subprocess.run(
+                cmd, cwd=solution_file.parent, env=solution_env(), capture_output=True
+            )
+            end = time.perf_counter()
             times.append(end - start)
             print(f"  Run {i+1}: {times[-1]:.4f}s")
 
@@ -142,10 +1545,121 @@ def main():
     parser.add_argument(
         "-b", "--benchmark", action="store_true", help="Benchmark solution"
     )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Import the solution once and call its parts directly",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="Load parser results from the on-disk parse cache (implies --in-process)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Report tracemalloc peak, top allocation sites and max RSS of each part,"
+        " each run in a fresh process",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the part(s), writing .pstats and collapsed-stack files",
+    )
+    parser.add_argument(
+        "--profile-mode",
+        choices=["deterministic", "sample"],
+        default="deterministic",
+        help="cProfile every call, or sample the stack for long runs",
+    )
+    parser.add_argument(
+        "--profile-top", type=int, default=15, help="Functions listed by --profile"
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=0.001,
+        help="Seconds between stack samples in sample mode",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With --test, re-run days even if unchanged since their cached result",
+    )
+    parser.add_argument(
+        "--warm",
+        action="store_true",
+        help="Run through the warm worker, starting it if needed",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Re-run through the warm worker whenever the day's files change",
+    )
+    parser.add_argument(
+        "--serve", action="store_true", help="Run the warm worker in the foreground"
+    )
+    parser.add_argument(
+        "--stop-worker", action="store_true", help="Stop a running warm worker"
+    )
+    parser.add_argument(
+        "--write-manifest",
+        nargs="?",
+        const="",
+        metavar="ENTRY",
+        help="Write the day's manifest.json with the answers the solution gives now;"
+        " ENTRY picks the script when the day has several",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Run every day of the year (or of every year without -y) in warm workers",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=1.0,
+        help="Whole-year runtime budget in seconds for --all",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="Per-day timeout in seconds for --all (default 10), per-run for --test"
+        " (default 60)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="Worker processes for --all"
+    )
     parser.add_argument("--list", action="store_true", help="List available days")
 
     args = parser.parse_args()
 
+    if args.serve or args.stop_worker:
+        import worker
+
+        if args.serve:
+            return worker.serve()
+        return 0 if worker.stop_worker() else 1
+
+    if args.all:
+        days = find_days(args.year)
+        if not days:
+            print("No solved days found")
+            return 1
+        print(f"Running {len(days)} days on {min(args.jobs, len(days))} warm worker(s)...")
+        by_year = {}
+        for run in run_all(days, args.jobs, args.timeout or 10.0):
+            status = run.error or ", ".join(
+                [f"{p}: {a}" for p, a in sorted(run.answers.items())]
+                + [f"{p}: no answer" for p in run.missing]
+            )
+            print(f"  {run.year} day {run.day}: {run.seconds:.4f}s  {_shorten(status, 60)}", flush=True)
+            by_year.setdefault(run.year, []).append(run)
+        ok = True
+        for year, runs in sorted(by_year.items()):
+            ok = print_calendar(year, runs, args.budget) and ok
+        return 0 if ok else 1
+
     # Determine year and day directory
     if args.year:
         year_dir = Path(f"{args.year}")
@@ -188,17 +1702,78 @@ def main():
         return 1
 
     # Run the appropriate action
+    if args.write_manifest is not None:
+        if args.write_manifest:
+            solution_file = day_dir / args.write_manifest
+        else:
+            solution_file = find_solution_file(day_dir)
+        if not solution_file or not solution_file.exists():
+            print(f"No solution file found in {day_dir}")
+            return 1
+        manifest = write_manifest(solution_file)
+        print(f"Wrote {manifest.path}:")
+        print(manifest.path.read_text(), end="")
+        return 0
     if args.benchmark:
-        benchmark_solution(day_dir)
+        benchmark_solution(day_dir, in_process=args.in_process)
     elif args.test:
-        test_solution(day_dir)
+        cache = ResultCache()
+        try:
+            return 0 if test_solution(day_dir, cache, args.force, args.timeout or 60.0) else 1
+        finally:
+            cache.close()
     else:
         solution_file = find_solution_file(day_dir)
-        if solution_file:
-            run_solution(solution_file, args.part, args.example, args.log)
-        else:
+        if not solution_file:
             print(f"No solution file found in {day_dir}")
             return 1
+        if args.profile:
+            solution = load_solution(solution_file)
+            parts = [args.part] if args.part else sorted(solution.entry_points(), key=lambda p: p or 0)
+            ok = True
+            for part in parts:
+                outcome, written = profile_part(
+                    solution_file,
+                    part,
+                    args.example,
+                    args.profile_mode,
+                    args.profile_top,
+                    args.sample_interval,
+                )
+                print("-" * 50)
+                print_part_result(outcome)
+                for path in written:
+                    print(f"  wrote {path}")
+                ok = ok and outcome.ok
+            return 0 if ok else 1
+        if args.memory:
+            solution = load_solution(solution_file)
+            parts = [args.part] if args.part else sorted(solution.entry_points(), key=lambda p: p or 0)
+            memories = [
+                measure_memory_isolated(solution_file, part, args.example) for part in parts
+            ]
+            print("-" * 50)
+            for memory in memories:
+                print_memory_result(memory)
+            return 0 if not any(m.error for m in memories) else 1
+        if args.watch:
+            watch(solution_file, args.part, args.example, args.log)
+            return 0
+        if args.warm:
+            return 0 if run_warm(solution_file, args.part, args.example, args.log) else 1
+        if args.in_process or args.parse_cache:
+            outcomes = run_in_process(
+                solution_file,
+                args.part,
+                args.example,
+                args.log,
+                parse_cache=args.parse_cache or None,
+            )
+            print("-" * 50)
+            for outcome in outcomes:
+                print_part_result(outcome)
+            return 0 if all(o.ok and o.correct is not False for o in outcomes) else 1
+        run_solution(solution_file, args.part, args.example, args.log)
 
     return 0
 
@@ -4,23 +4,33 @@ Day X: [Problem Title]
 [Brief description of the problem]
 """
 
+import os
+import sys
+
+# Run from the day directory, so put the repo root (home of aoc_utils) on the path.
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
 from aoc_utils import *
 
 
-def parse_input(data):
-    """Parse the input data into a useful format."""
+def parse(data):
+    """Parse the input data once; the result is passed to both parts.
+
+    The harness may reuse the parsed object for part 2, so the parts should
+    treat it as read-only (or copy what they need to change).
+    """
     lines = parse_lines(data)
     # TODO: Implement parsing logic
     return lines
 
 
 @timer
-def part_1(data, log=False):
+def part_1(parsed, log=False):
     """Solve part 1 of the problem."""
-    parsed_data = parse_input(data)
-
     if log:
-        debug_print(f"Parsed data: {parsed_data[:5]}...")  # Show first 5 items
+        debug_print(f"Parsed data: {parsed[:5]}...")  # Show first 5 items
 
     # TODO: Implement part 1 logic here
     result = None
@@ -29,12 +39,10 @@ def part_1(data, log=False):
 
 
 @timer
-def part_2(data, log=False):
+def part_2(parsed, log=False):
     """Solve part 2 of the problem."""
-    parsed_data = parse_input(data)
-
     if log:
-        debug_print(f"Parsed data: {parsed_data[:5]}...")  # Show first 5 items
+        debug_print(f"Parsed data: {parsed[:5]}...")  # Show first 5 items
 
     # TODO: Implement part 2 logic here
     result = None
@@ -79,10 +87,11 @@ if __name__ == "__main__":
     if log:
         print(f"Running Part {part} with logging enabled\n")
 
+    parsed = parse(data)
     if part == 1:
-        result = part_1(data, log=log)
+        result = part_1(parsed, log=log)
     elif part == 2:
-        result = part_2(data, log=log)
+        result = part_2(parsed, log=log)
     else:
         raise ValueError("Invalid part specified. Use 1 or 2.")
 
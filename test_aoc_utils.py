@@ -0,0 +1,420 @@
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+import aoc_utils
+from aoc_utils import (
+    TRACER,
+    Grid,
+    ParseCache,
+    Point,
+    Tracer,
+    astar,
+    bfs,
+    bfs_indexed,
+    bfs_search,
+    cached_parse,
+    day_parser,
+    dfs,
+    dfs_walk,
+    dijkstra,
+    dijkstra_indexed,
+    find_cycle,
+    from_complex,
+    iddfs,
+    pack_point,
+    parse_grid,
+    span,
+    timer,
+    to_complex,
+    topological_order,
+    traced,
+    unpack_point,
+)
+
+
+@pytest.fixture
+def tracer():
+    TRACER.reset()
+    TRACER.enable()
+    yield TRACER
+    TRACER.disable()
+    TRACER.reset()
+
+
+class TestTracer:
+    """Test cases for span tracing."""
+
+    def test_disabled_records_nothing(self):
+        tracer = Tracer()
+        with tracer.span("parse"):
+            pass
+        assert tracer.spans == []
+
+    def test_nested_spans(self, tracer):
+        @traced
+        def parse_input(data):
+            return data.split()
+
+        @timer
+        def part_1(data):
+            with span("solve"):
+                return len(parse_input(data))
+
+        assert part_1("a b c") == 3
+        assert [(s.name, s.path, s.depth) for s in tracer.spans] == [
+            ("parse_input", "part_1/solve/parse_input", 2),
+            ("solve", "part_1/solve", 1),
+            ("part_1", "part_1", 0),
+        ]
+
+    def test_total_does_not_double_count_recursion(self, tracer):
+        @traced(name="parse_input")
+        def parse(depth):
+            return parse(depth - 1) if depth else 0
+
+        parse(3)
+        outermost = tracer.spans[-1]
+        assert tracer.total_ns("parse_input") == outermost.duration_ns
+
+    def test_traced_is_transparent(self):
+        @traced
+        def add(a, b=1):
+            """Add numbers."""
+            return a + b
+
+        assert add(2, b=3) == 5
+        assert add.__name__ == "add"
+        assert add.__traced__
+
+
+@pytest.fixture
+def parse_cache(tmp_path):
+    return ParseCache(tmp_path / "cache")
+
+
+class TestParseCache:
+    """Test cases for the on-disk parse cache."""
+
+    def test_second_call_is_a_hit(self, parse_cache):
+        calls = []
+
+        @cached_parse(cache=parse_cache)
+        def parse(data):
+            calls.append(data)
+            return [int(x) for x in data.split()]
+
+        assert parse("1 2 3") == [1, 2, 3]
+        assert parse("1 2 3") == [1, 2, 3]
+        assert calls == ["1 2 3"]
+        assert (parse_cache.hits, parse_cache.misses) == (1, 1)
+        assert parse("4") == [4]
+
+    def test_key_depends_on_parser_source(self, parse_cache):
+        def split_words(data):
+            return data.split()
+
+        def split_lines(data):
+            return data.splitlines()
+
+        assert parse_cache.key(split_words, "a b") != parse_cache.key(split_lines, "a b")
+        assert parse_cache.key(split_words, "a b") == parse_cache.key(split_words, "a b")
+
+    def test_unpicklable_results_are_not_cached(self, parse_cache):
+        @cached_parse(cache=parse_cache)
+        def parse(data):
+            return (c for c in data)
+
+        assert list(parse("ab")) == ["a", "b"]
+        assert parse_cache.entries() == []
+
+    def test_too_deeply_nested_results_are_not_cached(self, parse_cache):
+        nested = []
+        for _ in range(100_000):
+            nested = [nested]
+        assert parse_cache.put("deep", nested) is False
+        assert parse_cache.entries() == []
+
+    def test_evicts_least_recently_used(self, parse_cache):
+        for key in "ab":
+            parse_cache.put(key, key * 10)
+        for age, (_, _, path) in enumerate(parse_cache.entries()):
+            os.utime(path, (age, age))  # a older than b
+        assert parse_cache.get("a")[0]  # now b is least recently used
+        parse_cache.max_bytes = sum(size for _, size, _ in parse_cache.entries())
+        parse_cache.put("c", "c" * 10)
+        assert sorted(p.stem for _, _, p in parse_cache.entries()) == ["a", "c"]
+
+    def test_arrays_load_memory_mapped(self, parse_cache):
+        np = pytest.importorskip("numpy")
+        parse_cache.put("grid", np.arange(12).reshape(3, 4))
+        hit, grid = parse_cache.get("grid")
+        assert hit and isinstance(grid, np.memmap)
+        assert grid[2, 3] == 11
+        assert not grid.flags.writeable
+
+
+class TestPackage:
+    """Test cases for the lazily importing package."""
+
+    def test_import_loads_no_submodules(self):
+        code = (
+            "import sys, aoc_utils; "
+            "print(sorted(m for m in sys.modules if m.startswith('aoc_utils.')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "[]"
+
+    def test_day_scripts_run_from_their_directory(self):
+        day_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "2024", "Day8")
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+        out = subprocess.run(
+            [sys.executable, "day_8.py", "-e", "-p", "1"],
+            cwd=day_dir,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert "Result for Part 1: 14" in out
+
+    def test_star_import_names_resolve(self):
+        namespace = {}
+        exec("from aoc_utils import *", namespace)
+        assert set(aoc_utils.__all__) <= set(namespace)
+        assert namespace["defaultdict"] is __import__("collections").defaultdict
+        assert "cached_parse" not in namespace
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            aoc_utils.not_a_helper
+
+    def test_point_in_bounds(self):
+        grid = [[0] * 3 for _ in range(2)]
+        assert Point(1, 2).inBounds(grid)
+        assert not Point(2, 0).inBounds(grid)
+        assert Point(1, 2).within(2, 3) and not Point(-1, 0).within(2, 3)
+
+    def test_point_is_immutable_and_hashable(self):
+        point = Point(1, 2) + Point(3, 4) - Point(1, 1)
+        assert point == Point(3, 5) and (point.x, point.y) == (3, 5)
+        assert point != Point(5, 3) and hash(point) == hash(Point(3, 5))
+        assert {Point(3, 5), point} == {point}
+        with pytest.raises(AttributeError):
+            point.x = 0
+        assert pickle.loads(pickle.dumps(point)) == point
+
+    def test_point_only_equals_points(self):
+        point = Point(1, 2)
+        assert point != (1, 2) and (1, 2) != point and point != "not a point"
+        assert (1, 2) not in {point}
+        with pytest.raises(TypeError):
+            point < Point(2, 3)
+
+    def test_packed_and_complex_points(self):
+        for x, y in ((0, 0), (-3, 5), (7, -9), (12, -(2**31))):
+            assert unpack_point(pack_point(x, y)) == (x, y)
+            assert unpack_point(pack_point(x, y) + pack_point(-1, 1)) == (x - 1, y + 1)
+            assert from_complex(to_complex(x, y) + 1j) == (x, y + 1)
+
+    def test_day_parser_infile(self):
+        args = day_parser().parse_args(["-i", "other.txt", "-p", "2"])
+        assert (args.infile, args.part, args.example) == ("other.txt", 2, False)
+
+
+class TestGrid:
+    """Test cases for the flat bytearray grid."""
+
+    TEXT = "ab.\n.#c\n"
+
+    def test_round_trips_list_grids(self):
+        grid = Grid.from_text(self.TEXT)
+        assert (grid.height, grid.width) == (2, 3)
+        assert grid.to_lists() == parse_grid(self.TEXT)
+        assert str(Grid.from_lists(parse_grid(self.TEXT))) == self.TEXT.strip()
+        with pytest.raises(ValueError):
+            Grid(["ab", "c"])
+
+    def test_indices_and_border(self):
+        grid = Grid.from_text(self.TEXT)
+        corner = grid.index(0, 0)
+        assert grid.position(corner) == (0, 0)
+        assert grid[corner] == "a" and grid[1, 2] == "c"
+        assert not grid.in_bounds(corner + grid.deltas["N"])
+        assert grid.in_bounds(corner + grid.deltas["SE"])
+        assert [grid[i] for i in grid.neighbors_4(corner)] == [".", "b"]
+        assert len(grid.neighbors_8(grid.index(1, 1))) == 5
+        assert "".join(grid[i] for i in grid.indices()) == "ab..#c"
+
+    def test_find(self):
+        grid = Grid.from_text(self.TEXT)
+        assert grid.position(grid.find("#")) == (1, 1)
+        assert grid.find("z") == -1
+        assert [grid.position(i) for i in grid.find_all(".")] == [(0, 2), (1, 0)]
+
+    def test_views_share_cells(self):
+        grid = Grid.from_text(self.TEXT)
+        assert bytes(grid.row(1)) == b".#c"
+        assert bytes(grid.column(2)) == b".c"
+        grid.column(0)[1] = ord("X")
+        assert grid[1, 0] == "X"
+        copy = grid.copy()
+        copy[0, 0] = "Z"
+        assert grid[0, 0] == "a"
+
+    def test_numpy_view(self):
+        pytest.importorskip("numpy")
+        grid = Grid.from_text(self.TEXT)
+        array = grid.as_array()
+        assert array.shape == (4, 5)
+        array[1, 1] = ord("q")
+        assert grid[0, 0] == "q"
+
+
+HILL = """Sabqponm
+abcryxxl
+accszExk
+acctuvwj
+abdefghi"""
+
+
+class TestBFS:
+    """Test cases for the BFS engine."""
+
+    def hill(self):
+        grid = Grid.from_text(HILL)
+        heights = bytearray(grid.cells.replace(b"S", b"a").replace(b"E", b"z"))
+
+        def climbs(index):
+            return [n for n in grid.neighbors_4(index) if heights[n] <= heights[index] + 1]
+
+        def descends(index):
+            return [n for n in grid.neighbors_4(index) if heights[index] <= heights[n] + 1]
+
+        return grid, heights, climbs, descends
+
+    def test_indexed_single_and_multi_source(self):
+        grid, heights, climbs, descends = self.hill()
+        end = grid.find("E")
+        result = bfs_indexed(len(grid.cells), [grid.find("S")], climbs, end.__eq__)
+        assert result.goal == end and result.distance(end) == 31
+        path = result.path()
+        assert (path[0], path[-1], len(path)) == (grid.find("S"), end, 32)
+
+        lowest = grid.find_all("a") + [grid.find("S")]
+        result = bfs_indexed(len(grid.cells), lowest, climbs, end.__eq__)
+        assert result.distance(end) == 29
+        result = bfs_indexed(len(grid.cells), [end], descends, lambda i: heights[i] == ord("a"))
+        assert result.distance(result.goal) == 29
+
+    def test_max_depth_and_unreached(self):
+        grid, _, climbs, _ = self.hill()
+        result = bfs_indexed(len(grid.cells), [grid.find("S")], climbs, max_depth=2)
+        assert max(result.distances) == 2
+        assert result.distance(grid.find("E")) is None and result.path(grid.find("E")) is None
+
+    def test_generic_matches_indexed(self):
+        grid, _, climbs, _ = self.hill()
+        position = grid.position
+
+        def neighbors(node):
+            return [position(n) for n in climbs(grid.index(*node))]
+
+        result = bfs_search([(0, 0)], neighbors)
+        assert result.distance((2, 5)) == 31
+        assert result.path((0, 1)) == [(0, 0), (0, 1)]
+        assert bfs((0, 0), neighbors, lambda node: node == (2, 5)) == ((2, 5), 31)
+        visited, distances = bfs((0, 0), neighbors)
+        assert visited == set(distances) and distances[(2, 5)] == 31
+
+
+RISKS = """1163751742
+1381373672
+2136511328
+3694931569
+7463417111
+1319128137
+1359912421
+3125421639
+1293138521
+2311944581"""
+
+
+class TestDijkstra:
+    """Test cases for Dijkstra and A*."""
+
+    def test_indexed_with_heuristic(self):
+        grid = Grid.from_text(RISKS)
+        start, end = grid.index(0, 0), grid.index(9, 9)
+
+        def neighbors(index):
+            return [(n, grid.cells[n] - 48) for n in grid.neighbors_4(index)]
+
+        plain = dijkstra_indexed(len(grid.cells), [start], neighbors, end.__eq__)
+        guided = dijkstra_indexed(
+            len(grid.cells), [start], neighbors, end.__eq__, lambda i: grid.manhattan(i, end)
+        )
+        assert plain.distance(end) == guided.distance(end) == 40
+        assert guided.path()[0] == start and guided.path()[-1] == end
+        assert 0 < guided.expanded <= plain.expanded
+        assert plain.peak_frontier > 1
+
+    def test_hashable_states_and_max_cost(self):
+        rows = RISKS.split()
+
+        def neighbors(node):
+            r, c = node
+            for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if 0 <= nr < 10 and 0 <= nc < 10:
+                    yield (nr, nc), int(rows[nr][nc])
+
+        def at_end(node):
+            return node == (9, 9)
+
+        assert dijkstra([(0, 0)], neighbors, at_end).distance((9, 9)) == 40
+        result = astar([(0, 0)], neighbors, at_end, lambda n: 18 - n[0] - n[1])
+        assert result.goal == (9, 9) and result.distance((9, 9)) == 40
+        capped = dijkstra([(0, 0)], neighbors, at_end, max_cost=39)
+        assert capped.goal is None and not capped.reached((9, 9))
+        assert max(capped.distances.values()) <= 39
+
+
+TREE = {1: [2, 5], 2: [3, 4], 3: [], 4: [], 5: [2]}
+
+
+class TestDFS:
+    """Test cases for the iterative DFS helpers."""
+
+    def test_orders_and_paths(self):
+        assert list(dfs_walk([1], TREE.get)) == [1, 2, 3, 4, 5]
+        assert list(dfs_walk([1], TREE.get, order="post")) == [3, 4, 2, 5, 1]
+        assert dict(dfs_walk([1], TREE.get, paths=True))[4] == (1, 2, 4)
+        assert list(dfs_walk([1], TREE.get, max_depth=1)) == [1, 2, 5]
+        with pytest.raises(ValueError):
+            list(dfs_walk([1], TREE.get, order="in"))
+
+    def test_deep_graphs_do_not_recurse(self):
+        depth = 10 * sys.getrecursionlimit()
+        corridor = lambda n: [n + 1] if n < depth else []
+        walk = dfs_walk([0], corridor, order="post")
+        assert next(walk) == depth
+        assert dfs(0, corridor, lambda n: n == depth) == depth
+
+    def test_iterative_deepening_finds_fewest_steps(self):
+        assert iddfs(1, TREE.get, lambda n: n == 4, max_depth=5) == [1, 2, 4]
+        assert iddfs(1, TREE.get, lambda n: n == 4, max_depth=1) is None
+        assert iddfs(1, TREE.get, lambda n: n == 9, max_depth=50) is None
+
+    def test_directed_cycles(self):
+        assert find_cycle([1], TREE.get) is None
+        order = topological_order([1], TREE.get)
+        assert order.index(5) < order.index(2) < order.index(3)
+        looped = {**TREE, 4: [5]}
+        assert find_cycle([1], looped.get) == [2, 4, 5]
+        with pytest.raises(ValueError):
+            topological_order([1], looped.get)
@@ -0,0 +1,460 @@
+import inspect
+import json
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from perf import (
+    BenchmarkJob,
+    BenchmarkStats,
+    CoordinatorServer,
+    Estimate,
+    IN_PROCESS,
+    SUBPROCESS,
+    JobBoard,
+    benchmark_parts,
+    PerformanceTracker,
+    ResourceUsage,
+    bootstrap_ci,
+    check_regressions,
+    classify_change,
+    fit_exponent,
+    measure_variants,
+    resolve_revision,
+    revision_worktrees,
+    run_child,
+    run_worker,
+    sweep_solution,
+    _post,
+)
+from run import REPO_DIR
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = PerformanceTracker(str(tmp_path / "performance.db"), legacy_file=None)
+    yield tracker
+    tracker.close()
+
+
+class TestPerformanceTracker:
+    """Test cases for the SQLite-backed performance store."""
+
+    def test_best_times(self, tracker):
+        tracker.record_performance(2024, 1, 1, 0.5, 42)
+        tracker.record_performance(2024, 1, 1, 0.25, 42)
+        tracker.record_performance(2024, 1, 2, 1.0)
+        tracker.record_performance(2023, 3, 1, 2.0)
+        assert tracker.get_best_times() == {
+            "2024-1": {"part_1": 0.25, "part_2": 1.0},
+            "2023-3": {"part_1": 2.0},
+        }
+        assert list(tracker.get_best_times(2023)) == ["2023-3"]
+
+    def test_history_is_ordered(self, tracker):
+        tracker.record_performance(2024, 5, 2, 0.3, "abc")
+        tracker.record_performance(2024, 5, 2, 0.2, "abc")
+        history = tracker.get_history(2024, 5, 2)
+        assert [h["runtime"] for h in history] == [0.3, 0.2]
+        assert history[0]["result"] == "abc"
+
+    def test_persists_between_instances(self, tmp_path):
+        db = str(tmp_path / "performance.db")
+        first = PerformanceTracker(db, legacy_file=None)
+        first.record_performance(2022, 9, 1, 0.1)
+        first.close()
+        second = PerformanceTracker(db, legacy_file=None)
+        assert second.get_best_times() == {"2022-9": {"part_1": 0.1}}
+        second.close()
+
+    def test_files_default_to_repo_root(self):
+        # Not the cwd, which would split history between directories.
+        defaults = inspect.signature(PerformanceTracker).parameters
+        assert defaults["data_file"].default == REPO_DIR / "performance.db"
+        assert defaults["legacy_file"].default == REPO_DIR / "performance.json"
+
+    def test_stats_round_trip(self, tracker):
+        stats = BenchmarkStats.from_samples([0.1, 0.2, 0.3])
+        tracker.record_performance(2024, 2, 1, stats.best, stats=stats.as_dict())
+        (entry,) = tracker.get_history(2024, 2, 1)
+        assert entry["stats"]["median"] == pytest.approx(0.2)
+        assert entry["stats"]["samples"] == [0.1, 0.2, 0.3]
+
+    def test_unknown_fields_rejected(self, tracker):
+        with pytest.raises(ValueError):
+            tracker.record_performance(2024, 2, 1, 0.1, colour="red")
+
+    def test_migrates_legacy_json(self, tmp_path):
+        legacy = tmp_path / "performance.json"
+        legacy.write_text(
+            json.dumps(
+                {
+                    "2024-7": {
+                        "part_1": [
+                            {"timestamp": "2024-12-07T10:00:00", "runtime": 2.0, "result": 12},
+                            {"timestamp": "2024-12-08T10:00:00", "runtime": 1.5, "result": 12},
+                        ]
+                    }
+                }
+            )
+        )
+        tracker = PerformanceTracker(tmp_path / "performance.db", legacy)
+        assert tracker.get_best_times() == {"2024-7": {"part_1": 1.5}}
+        assert not legacy.exists()
+        assert (tmp_path / "performance.json.migrated").exists()
+        tracker.close()
+
+    def test_corrupt_legacy_json_is_kept(self, tmp_path, capsys):
+        legacy = tmp_path / "performance.json"
+        legacy.write_text("{not json")
+        tracker = PerformanceTracker(str(tmp_path / "performance.db"), str(legacy))
+        assert tracker.get_best_times() == {}
+        assert legacy.exists()
+        assert "Could not migrate" in capsys.readouterr().out
+        tracker.close()
+
+
+class TestBenchmarkEngine:
+    """Test cases for the statistics and variant timing helpers."""
+
+    def test_summary_statistics(self):
+        stats = BenchmarkStats.from_samples([1.0, 2.0, 3.0, 4.0, 5.0])
+        assert stats.best == 1.0
+        assert stats.median == 3.0
+        assert stats.iqr == pytest.approx(2.0)
+        assert stats.ci_low <= stats.median <= stats.ci_high
+
+    def test_single_sample(self):
+        stats = BenchmarkStats.from_samples([0.5])
+        assert (stats.iqr, stats.ci_low, stats.ci_high) == (0, 0.5, 0.5)
+
+    def test_bootstrap_is_deterministic(self):
+        samples = [0.9, 1.1, 1.0, 1.3, 0.95, 1.05]
+        assert bootstrap_ci(samples) == bootstrap_ci(samples)
+
+    def test_variants_are_interleaved(self):
+        calls = []
+        variants = {"a": lambda: calls.append("a"), "b": lambda: calls.append("b")}
+        stats, _, errors = measure_variants(variants, repeat=4, warmup=0)
+        assert not errors
+        assert calls == ["a", "b", "b", "a", "a", "b", "b", "a"]
+        assert len(stats["a"].samples) == 4
+
+    def test_autorange_loops_fast_calls(self):
+        stats, results, _ = measure_variants({"x": lambda: 42}, repeat=2, min_time=0.01)
+        assert stats["x"].loops > 1
+        assert results["x"] == 42
+
+    def test_self_timed_variants_report_their_own_time(self):
+        def call():
+            time.sleep(0.01)  # Harness work outside the measured span
+            return "x", 0.001
+
+        call.self_timed = True
+        stats, results, _ = measure_variants({"x": call}, repeat=2, warmup=1)
+        assert stats["x"].samples == [0.001, 0.001] and results["x"] == "x"
+
+    def test_in_process_samples_are_the_traced_span(self, tmp_path):
+        solution_file = tmp_path / "day_1.py"
+        solution_file.write_text("def part_1(data):\n    return len(data)\n")
+        (tmp_path / "input.txt").write_text("abc\n")
+        (part_data,) = benchmark_parts(
+            solution_file, parts=(1,), runs=3, warmup=0, min_time=0, in_process=True
+        ).values()
+        traced = part_data["solve_time"] + (part_data["parse_time"] or 0)
+        assert part_data["best_time"] == pytest.approx(traced)
+
+    def test_failing_variant_is_dropped(self):
+        def broken():
+            raise RuntimeError("boom")
+
+        stats, _, errors = measure_variants({"ok": lambda: 1, "bad": broken}, repeat=2)
+        assert list(stats) == ["ok"]
+        assert errors == {"bad": "boom"}
+
+
+class TestRegressionGate:
+    """Test cases for baseline pinning and change classification."""
+
+    def test_classify_change(self):
+        assert classify_change(1.0, 1.05) == "ok"
+        assert classify_change(1.0, 1.2) == "regression"
+        assert classify_change(1.0, 0.8) == "improvement"
+
+    def test_absolute_threshold_ignores_tiny_parts(self):
+        assert classify_change(0.001, 0.002) == "ok"
+        assert classify_change(0.001, 0.002, abs_threshold=0.0) == "regression"
+
+    def test_pinned_baseline_replaces_previous(self, tracker):
+        tracker.pin_baseline(2024, 6, 2, 4.0)
+        tracker.pin_baseline(2024, 6, 2, 3.5)
+        assert tracker.get_baselines() == {"2024-6": {"part_2": 3.5}}
+        assert tracker.get_baselines(2023) == {}
+
+    def test_in_process_baseline_does_not_gate_subprocess_runs(
+        self, tracker, tmp_path, monkeypatch
+    ):
+        day_dir = tmp_path / "2099" / "Day1"
+        day_dir.mkdir(parents=True)
+        (day_dir / "day_1.py").write_text(SCRIPT_PARTS)
+        (day_dir / "input.txt").write_text("abc\n")
+        monkeypatch.chdir(tmp_path)
+
+        tracker.record_performance(2099, 1, 1, 1e-6, 3, mode=IN_PROCESS, loops=1000)
+        assert tracker.pin_latest(2099, mode=IN_PROCESS) == 1
+        assert tracker.get_baselines(2099) == {}
+        assert tracker.get_baselines(2099, IN_PROCESS) == {"2099-1": {"part_1": 1e-6}}
+
+        comparisons = check_regressions(tracker, 2099, 1, runs=1, workers=1, warmup=0)
+        assert [(c.part, c.status) for c in comparisons] == [(1, "new"), (2, "new")]
+        (latest,) = [h for h in tracker.get_history(2099, 1, 1) if h["mode"] == SUBPROCESS]
+        assert latest["loops"] == 1
+
+    def test_unchanged_part_is_not_judged_against_a_lucky_best(
+        self, tracker, tmp_path, monkeypatch
+    ):
+        day_dir = tmp_path / "2099" / "Day1"
+        day_dir.mkdir(parents=True)
+        (day_dir / "day_1.py").write_text(SCRIPT_PARTS)
+        (day_dir / "input.txt").write_text("abc\n")
+        monkeypatch.chdir(tmp_path)
+
+        # An implausibly fast old run, then a typical one whose interval covers any rerun.
+        wide = {"median": 1.0, "ci_low": 0.0, "ci_high": 60.0}
+        for part in (1, 2):
+            tracker.record_performance(2099, 1, part, 1e-9, 3)
+            tracker.record_performance(2099, 1, part, 1.0, 3, stats=wide)
+        estimates = tracker.get_estimates(2099, source="latest")
+        assert estimates["2099-1"]["part_1"] == Estimate(1.0, 0.0, 60.0)
+
+        comparisons = check_regressions(tracker, 2099, 1, runs=1, workers=1, warmup=0)
+        assert [(c.part, c.baseline, c.status) for c in comparisons] == [
+            (1, 1.0, "ok"),
+            (2, 1.0, "ok"),
+        ]
+
+    def test_estimates_overlap(self):
+        base = Estimate(1.0, 0.9, 1.1)
+        assert base.overlaps(Estimate(1.15, 1.05, 1.3))
+        assert not base.overlaps(Estimate(1.5, 1.4, 1.6))
+        assert Estimate.from_stats(None, 0.5) == Estimate(0.5, 0.5, 0.5)
+
+    def test_old_baselines_take_their_measurement_mode(self, tmp_path):
+        db = tmp_path / "performance.db"
+        conn = sqlite3.connect(db)
+        conn.executescript(
+            "CREATE TABLE measurements (id INTEGER PRIMARY KEY, year INTEGER, day INTEGER,"
+            " part INTEGER, timestamp TEXT, runtime REAL, result TEXT, solve_time REAL);"
+            "INSERT INTO measurements VALUES (1, 2024, 8, 1, 't', 0.001, '14', 0.0009);"
+            "INSERT INTO measurements VALUES (2, 2024, 8, 1, 't', 0.07, '14', NULL);"
+            "CREATE TABLE baselines (year INTEGER, day INTEGER, part INTEGER,"
+            " runtime REAL, timestamp TEXT, PRIMARY KEY (year, day, part));"
+            "INSERT INTO baselines VALUES (2024, 8, 1, 0.001, 't');"
+        )
+        conn.close()
+        tracker = PerformanceTracker(str(db), legacy_file=None)
+        assert tracker.get_baselines(mode=IN_PROCESS) == {"2024-8": {"part_1": 0.001}}
+        assert tracker.get_baselines() == {}
+        assert tracker.get_best_times(mode=SUBPROCESS) == {"2024-8": {"part_1": 0.07}}
+        tracker.close()
+
+
+SCRIPT_PARTS = """
+import sys
+
+
+def part_1(data):
+    return len(data)
+
+
+def part_2(data):
+    return 2 * len(data)
+
+
+if __name__ == "__main__":
+    part = int(sys.argv[sys.argv.index("-p") + 1])
+    data = open("input.txt").read().strip()
+    print(f"Result for Part {part}: {(part_1, part_2)[part - 1](data)}")
+"""
+
+
+SWEPT_DAY = """
+from aoc_utils import input_generator
+
+
+@input_generator(sizes=(100, 200, 400), budget={1: 1.5, 2: 1.5}, param="count")
+def generate_input(size, rng):
+    return " ".join(str(rng.randint(1, 9)) for _ in range(size))
+
+
+def parse(data):
+    return [int(x) for x in data.split()]
+
+
+def part_1(numbers, log=False):
+    return sum(numbers)
+
+
+def part_2(numbers, log=False):
+    return sum(a * b for a in numbers for b in numbers)
+"""
+
+
+class TestSweep:
+    """Test cases for size sweeps over generated inputs."""
+
+    def test_fit_exponent(self):
+        sizes = [10, 20, 40, 80]
+        assert fit_exponent(sizes, [s**2 * 1e-6 for s in sizes]) == pytest.approx(2.0)
+        assert fit_exponent([10, 10], [1.0, 2.0]) is None
+
+    def test_generator_is_seeded(self):
+        from aoc_utils import input_generator
+
+        @input_generator(sizes=(1,), budget=2)
+        def generate(size, rng):
+            return str(rng.random())
+
+        generator = generate.__input_generator__
+        assert generator(1, seed=3) == generator(1, seed=3)
+        assert generator.budget == {1: 2, 2: 2}
+
+    def test_sweep_flags_parts_over_budget(self, tmp_path):
+        solution_file = tmp_path / "day_1.py"
+        solution_file.write_text(SWEPT_DAY)
+        part_1, part_2 = sweep_solution(solution_file, repeat=3, warmup=0)
+        assert part_1.sizes == part_2.sizes == [100, 200, 400]
+        assert not part_1.over_budget
+        assert part_2.exponent > 1.5 and part_2.over_budget
+
+    def test_generator_module_from_manifest(self, tmp_path):
+        generator_code, solution_code = SWEPT_DAY.split("def parse(data):")
+        (tmp_path / "day_1.py").write_text("def parse(data):" + solution_code)
+        (tmp_path / "generator.py").write_text(generator_code)
+        (tmp_path / "manifest.json").write_text('{"generator": "generator.py"}')
+        part_1, part_2 = sweep_solution(tmp_path / "day_1.py", sizes=[10, 20], repeat=1, warmup=0)
+        assert part_1.sizes == part_2.sizes == [10, 20]
+
+
+def test_wrong_answers_are_not_recorded(tmp_path):
+    day_dir = tmp_path / "2099" / "Day1"
+    day_dir.mkdir(parents=True)
+    (day_dir / "day_1.py").write_text(
+        "def part_1(data):\n    return 6\n\n\ndef part_2(data):\n    return 7\n"
+    )
+    (day_dir / "input.txt").write_text("1 2 3\n")
+    (day_dir / "manifest.json").write_text('{"answers": {"actual": {"1": 6, "2": 12}}}')
+    measured = benchmark_parts(day_dir / "day_1.py", runs=1, min_time=0, in_process=True)
+    assert list(measured) == [1]
+    assert measured[1]["verified"] == 1
+
+
+class TestRevisionComparison:
+    """Test cases for the git worktree helpers behind --compare."""
+
+    def test_unknown_revision(self):
+        with pytest.raises(ValueError):
+            resolve_revision("no-such-revision")
+
+    def test_worktrees_are_removed(self):
+        sha = resolve_revision("HEAD")
+        with revision_worktrees([sha, sha]) as roots:
+            assert len(roots) == 2
+            assert all((root / "perf.py").exists() for root in roots)
+        assert not any(root.exists() for root in roots)
+
+
+class TestResourceUsage:
+    """Test cases for per-run resource accounting."""
+
+    def test_child_usage(self, tmp_path):
+        code = "x = bytearray(50_000_000); print(sum(range(10**6)))"
+        returncode, stdout, _, usage = run_child(
+            [sys.executable, "-c", code], tmp_path, None, timeout=30
+        )
+        assert (returncode, stdout.strip()) == (0, str(sum(range(10**6))))
+        assert usage.user_time > 0
+        assert usage.max_rss_kb > 50_000
+        assert usage.minor_faults > 0
+
+    def test_child_timeout(self, tmp_path):
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_child([sys.executable, "-c", "while True: pass"], tmp_path, None, 0.5)
+
+    def test_memory_bound(self):
+        compute = ResourceUsage(1.0, 0.95, 0.02, 30_000, 1, 5, 0, 2_000)
+        paging = ResourceUsage(1.0, 0.4, 0.5, 900_000, 1, 5, 0, 200_000)
+        assert compute.cpu_ratio == pytest.approx(0.97)
+        assert not compute.memory_bound and paging.memory_bound
+        assert ResourceUsage.from_columns(1.0, compute.columns()) == compute
+
+    def test_summary_flags_memory_bound_parts(self, tracker, capsys):
+        paging = ResourceUsage(1.0, 0.4, 0.5, 900_000, 1, 5, 0, 200_000)
+        tracker.record_performance(2024, 6, 1, 1.0, **paging.columns())
+        tracker.record_performance(2024, 6, 2, 1.0)
+        tracker.print_summary(2024)
+        out = capsys.readouterr().out
+        assert "cpu/wall 0.90  MEMORY-BOUND" in out
+        assert "Memory-bound (heavy paging): 2024 day 6 part_1" in out
+
+
+class TestDistributed:
+    """Test cases for the benchmark coordinator and workers."""
+
+    def test_expired_leases_are_handed_out_again(self):
+        board = JobBoard([BenchmarkJob(0, 2099, 1, 1)], lease=10)
+        assert board.take("a", now=0).id == 0
+        assert board.take("b", now=5) is None
+        assert board.take("b", now=11).id == 0
+        assert board.finish(0, "a", {"best_time": 1.0}) is None
+        assert board.finish(0, "b", {"best_time": 2.0}).id == 0
+        assert board.done and board.finished == {0: ("b", {"best_time": 2.0})}
+
+    def test_board_stalls_without_progress(self):
+        board = JobBoard([BenchmarkJob(0, 2099, 1, 1)], lease=10)
+        board.take("a", now=board.last_progress)
+        assert not board.stalled(now=board.last_progress + 15)
+        board.expire(now=board.last_progress + 15)
+        assert list(board.waiting) and not board.leased
+        assert board.stalled(now=board.last_progress + 21)
+
+    def test_coordinator_gives_up_on_a_stuck_worker(self, tracker):
+        jobs = [BenchmarkJob(0, 2099, 1, 1), BenchmarkJob(1, 2099, 1, 2)]
+        with CoordinatorServer(("127.0.0.1", 0), JobBoard(jobs, lease=0.2), tracker) as server:
+            stuck = threading.Thread(
+                target=lambda: _post(server.url, "/job", {"host": "stuck"})
+            )
+            stuck.start()  # Takes job 0 and never reports it
+            with pytest.raises(TimeoutError, match="2 job"):
+                server.serve_until_done()
+            stuck.join(timeout=10)
+        assert server.board.finished == {} and len(server.board.waiting) == 2
+
+    def test_roles_on_localhost(self, tmp_path, tracker):
+        day_dir = tmp_path / "2099" / "Day1"
+        day_dir.mkdir(parents=True)
+        (day_dir / "day_1.py").write_text("def part_1(data):\n    return len(data)\n")
+        (day_dir / "input.txt").write_text("abc\n")
+        options = {"in_process": True, "warmup": 0, "min_time": 0}
+        jobs = [BenchmarkJob(0, 2099, 1, 1, runs=1, options=options)]
+
+        with CoordinatorServer(("127.0.0.1", 0), JobBoard(jobs), tracker) as server:
+            worker = threading.Thread(
+                target=run_worker,
+                args=(server.url,),
+                kwargs={"base_dir": tmp_path, "host": "builder-1", "poll": 0.05},
+            )
+            worker.start()
+            server.serve_until_done()
+        worker.join(timeout=10)
+        assert not worker.is_alive()
+
+        assert tracker.get_best_times() == {}
+        assert list(tracker.get_best_times(host="builder-1")) == ["2099-1"]
+        (entry,) = tracker.get_history(2099, 1, 1, host="builder-1")
+        assert entry["result"] == "3" and entry["host"] == "builder-1"
+        assert "builder-1" in tracker.get_hosts()
@@ -0,0 +1,370 @@
+import asyncio
+import sys
+import time
+
+import pytest
+
+from aoc_utils import ParseCache
+from run import (
+    DayManifest,
+    ResultCache,
+    find_days,
+    find_solution_file,
+    local_imports,
+    load_solution,
+    measure_memory,
+    measure_memory_isolated,
+    profile_part,
+    print_calendar,
+    read_input,
+    run_all,
+    run_in_process,
+    run_part_in_process,
+    solution_fingerprint,
+    write_manifest,
+)
+from run import test_solution_async as check_day  # Not a pytest test
+
+
+TEMPLATE_DAY = '''
+from helper import double
+
+
+def parse_input(data):
+    return [int(x) for x in data.split()]
+
+
+def part_1(data, log=False):
+    return sum(parse_input(data))
+
+
+def part_2(data):
+    return double(sum(parse_input(data)))
+'''
+
+MAIN_DAY = '''
+def main(data, log=False):
+    print(f"Part 1: {len(data)}")
+    print(f"Part 2: {data.count('1')}")
+'''
+
+PARSE_ONCE_DAY = '''
+CALLS = 0
+
+
+def parse(data):
+    global CALLS
+    CALLS += 1
+    return [int(x) for x in data.split()]
+
+
+def part_1(numbers, log=False):
+    return sum(numbers)
+
+
+def part_2(numbers):
+    return CALLS
+'''
+
+
+@pytest.fixture
+def template_day(tmp_path):
+    day_dir = tmp_path / "2099" / "Day1"
+    day_dir.mkdir(parents=True)
+    (day_dir / "day_1.py").write_text(TEMPLATE_DAY)
+    (day_dir / "helper.py").write_text("def double(x):\n    return 2 * x\n")
+    (day_dir / "input.txt").write_text("1 2 3\n")
+    (day_dir / "example.txt").write_text("4 5\n")
+    return day_dir
+
+
+class TestInProcess:
+    """Test cases for the in-process runner."""
+
+    def test_runs_both_parts(self, template_day):
+        outcomes = run_in_process(template_day / "day_1.py", quiet=True)
+        assert [o.part for o in outcomes] == [1, 2]
+        assert [o.result for o in outcomes] == [6, 12]
+        assert all(o.ok for o in outcomes)
+
+    def test_example_input(self, template_day):
+        (outcome,) = run_in_process(template_day / "day_1.py", part=1, example=True)
+        assert outcome.result == 9
+
+    def test_parse_time_is_separated(self, template_day):
+        (outcome,) = run_in_process(template_day / "day_1.py", part=1, quiet=True)
+        assert outcome.parse_ns is not None
+        assert outcome.solve_ns >= 0
+        assert outcome.import_ns > 0
+
+    def test_local_modules_do_not_leak(self, template_day):
+        load_solution(template_day / "day_1.py")
+        assert "helper" not in sys.modules
+
+    def test_main_style_results_from_output(self, tmp_path):
+        day_dir = tmp_path / "Day2"
+        day_dir.mkdir()
+        (day_dir / "day_2.py").write_text(MAIN_DAY)
+        (day_dir / "input.txt").write_text("1101\n")
+        (outcome,) = run_in_process(day_dir / "day_2.py", quiet=True)
+        assert outcome.part is None
+        assert outcome.results == {1: "4", 2: "3"}
+
+    def test_log_only_passed_by_name(self, tmp_path):
+        day_dir = tmp_path / "Day5"
+        day_dir.mkdir()
+        (day_dir / "day_5.py").write_text(
+            "def part_1(data, scale=10):\n    return len(data) * scale\n"
+        )
+        (day_dir / "input.txt").write_text("abc\n")
+        (outcome,) = run_in_process(day_dir / "day_5.py", part=1, log=True, quiet=True)
+        assert outcome.result == 30
+
+    def test_main_needing_several_inputs_is_not_an_entry_point(self, tmp_path):
+        day_dir = tmp_path / "Day6"
+        day_dir.mkdir()
+        (day_dir / "day_6.py").write_text("def main(board_data, call_data):\n    return 0\n")
+        (day_dir / "input.txt").write_text("abc\n")
+        assert load_solution(day_dir / "day_6.py").entry_points() == {}
+        (outcome,) = run_in_process(day_dir / "day_6.py", quiet=True)
+        assert "No part_N or main(data) entry point" in outcome.error
+
+    def test_errors_are_captured(self, template_day):
+        solution = load_solution(template_day / "day_1.py")
+        outcome = run_part_in_process(solution, 1, "not numbers")
+        assert not outcome.ok
+        assert "ValueError" in outcome.error
+
+    def test_read_input_strips(self, template_day):
+        assert read_input(template_day) == "1 2 3"
+
+    def test_parse_once_shares_parsed_input(self, tmp_path):
+        day_dir = tmp_path / "Day4"
+        day_dir.mkdir()
+        (day_dir / "day_4.py").write_text(PARSE_ONCE_DAY)
+        (day_dir / "input.txt").write_text("1 2 3\n")
+        first, second = run_in_process(day_dir / "day_4.py", quiet=True)
+        assert (first.result, second.result) == (6, 1)
+        assert first.parse_ns > 0 and not first.parse_cached
+        assert second.parse_cached and second.parse_ns == 0
+
+    def test_parse_cache_serves_second_run(self, template_day, tmp_path):
+        cache = ParseCache(tmp_path / "cache")
+        for _ in range(2):
+            (outcome,) = run_in_process(
+                template_day / "day_1.py", part=1, quiet=True, parse_cache=cache
+            )
+            assert outcome.result == 6
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_parse_once_without_reuse(self, tmp_path):
+        day_dir = tmp_path / "Day4"
+        day_dir.mkdir()
+        (day_dir / "day_4.py").write_text(PARSE_ONCE_DAY)
+        solution = load_solution(day_dir / "day_4.py")
+        for _ in range(2):
+            outcome = run_part_in_process(solution, 2, "1 2", reuse_parsed=False)
+            assert not outcome.parse_cached
+        assert outcome.result == 2
+
+
+MEMORY_DAY = '''
+def part_1(data):
+    big = [i for i in range(int(data))]
+    return len(big)
+'''
+
+HOARDING_DAY = '''
+HOARD = []
+
+def part_1(data):
+    HOARD.append(b"x" * (int(data) << 20))
+    return len(HOARD[0])
+
+def part_2(data):
+    return len(HOARD)
+'''
+
+
+class TestMemory:
+    """Test cases for tracemalloc-based memory measurement."""
+
+    def test_peak_and_sites(self, tmp_path):
+        day_dir = tmp_path / "Day3"
+        day_dir.mkdir()
+        (day_dir / "day_3.py").write_text(MEMORY_DAY)
+        (day_dir / "input.txt").write_text("100000")
+        memory = measure_memory(day_dir / "day_3.py", 1)
+        assert memory.error is None
+        assert memory.result == 100000
+        # 100k ints plus the list itself comfortably exceed 1MB.
+        assert memory.peak_bytes > 1_000_000
+        assert memory.top_sites[0]["site"] == "day_3.py:3"
+
+    def test_isolated_max_rss_is_per_part(self, tmp_path):
+        day_dir = tmp_path / "Day3"
+        day_dir.mkdir()
+        (day_dir / "day_3.py").write_text(HOARDING_DAY)
+        (day_dir / "input.txt").write_text("64")
+        first, second = (measure_memory_isolated(day_dir / "day_3.py", p) for p in (1, 2))
+        assert (first.error, second.error) == (None, None)
+        # Part 1's 64MiB stays live, but only in its own process.
+        assert first.maxrss_kb - second.maxrss_kb > 48 * 1024
+
+
+class TestProfile:
+    """Test cases for --profile output files."""
+
+    def test_deterministic_writes_pstats_and_collapsed(self, template_day, capsys):
+        outcome, written = profile_part(template_day / "day_1.py", 1, top=3)
+        assert outcome.result == 6
+        assert [p.suffix for p in written] == [".pstats", ".collapsed"]
+        lines = written[1].read_text().splitlines()
+        assert lines
+        assert all(line.startswith("part_1 (day_1.py:") for line in lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        assert "Top 3 functions by cumulative time" in capsys.readouterr().out
+
+    def test_sample_mode_writes_collapsed_only(self, template_day):
+        outcome, written = profile_part(template_day / "day_1.py", 2, mode="sample")
+        assert outcome.result == 12
+        assert [p.name for p in written] == ["day_1_part2.collapsed"]
+
+
+class TestResultCache:
+    """Test cases for fingerprinting and the result cache."""
+
+    def test_local_imports_are_followed(self, template_day):
+        assert [p.name for p in local_imports(template_day / "day_1.py")] == ["helper.py"]
+
+    def test_fingerprint_tracks_helpers_and_input(self, template_day):
+        solution = template_day / "day_1.py"
+        before = solution_fingerprint(solution)
+        assert solution_fingerprint(solution) == before
+        assert solution_fingerprint(solution, example=True) != before
+        (template_day / "helper.py").write_text("def double(x):\n    return x + x\n")
+        changed_helper = solution_fingerprint(solution)
+        assert changed_helper != before
+        (template_day / "input.txt").write_text("1 2 4\n")
+        assert solution_fingerprint(solution) != changed_helper
+
+    def test_entries_match_on_fingerprint(self, tmp_path):
+        cache = ResultCache(tmp_path / "performance.db")
+        cache.put(2024, 6, 1, "benchmark", "abc", {"best_time": 0.5})
+        data, _ = cache.get(2024, 6, 1, "benchmark", "abc")
+        assert data == {"best_time": 0.5}
+        assert cache.get(2024, 6, 1, "benchmark", "def") is None
+        assert cache.get(2024, 6, 1, "test-actual", "abc") is None
+        cache.close()
+
+
+class TestManifest:
+    """Test cases for per-day manifests."""
+
+    def test_days_without_manifest_use_defaults(self, template_day):
+        manifest = DayManifest.load(template_day)
+        assert manifest.entry is None
+        assert manifest.input_file(example=True) == template_day / "example.txt"
+        assert manifest.check_answer(1, 6) is None
+
+    def test_entry_and_inputs(self, template_day, monkeypatch):
+        (template_day / "other.py").write_text("")
+        (template_day / "day_1.py").rename(template_day / "solve.py")
+        monkeypatch.setattr("builtins.input", lambda prompt: pytest.fail("prompted"))
+        assert find_solution_file(template_day) is None
+
+        (template_day / "small.txt").write_text("7\n")
+        (template_day / "manifest.json").write_text(
+            '{"entry": "solve.py", "inputs": {"actual": "small.txt"}, "budget": 0.5}'
+        )
+        assert find_solution_file(template_day) == template_day / "solve.py"
+        assert read_input(template_day) == "7"
+        assert DayManifest.load(template_day).budget == {1: 0.5, 2: 0.5}
+
+    def test_renamed_callables(self, template_day):
+        (template_day / "day_1.py").write_text(
+            "def solve(data):\n    return len(data)\n"
+        )
+        (template_day / "manifest.json").write_text('{"callables": {"part_1": "solve"}}')
+        (outcome,) = run_in_process(template_day / "day_1.py", quiet=True)
+        assert (outcome.part, outcome.result) == (1, 5)
+
+    def test_written_answers_are_checked(self, template_day):
+        manifest = write_manifest(template_day / "day_1.py")
+        assert manifest.answers == {"example": {1: "9", 2: "18"}, "actual": {1: "6", 2: "12"}}
+        assert DayManifest.load(template_day).answers == manifest.answers
+
+        outcomes = run_in_process(template_day / "day_1.py", quiet=True)
+        assert [o.correct for o in outcomes] == [True, True]
+        (template_day / "helper.py").write_text("def double(x):\n    return 3 * x\n")
+        outcomes = run_in_process(template_day / "day_1.py", quiet=True)
+        assert [o.correct for o in outcomes] == [True, False]
+
+
+class TestRunAll:
+    """Test cases for running a whole year in warm workers."""
+
+    def test_answers_and_timeouts(self, tmp_path, capsys):
+        for day, body in (
+            (1, "def part_1(data):\n    return len(data)\n\ndef part_2(data):\n    return 0\n"),
+            (2, "def part_1(data):\n    while True:\n        pass\n"),
+            (3, "def part_1(data):\n    return len(data)\n"),
+        ):
+            day_dir = tmp_path / "2099" / f"Day{day}"
+            day_dir.mkdir(parents=True)
+            (day_dir / f"day_{day}.py").write_text(body)
+            (day_dir / "input.txt").write_text("abc\n")
+        days = find_days(base_dir=tmp_path)
+        assert [(y, d) for y, d, _ in days] == [(2099, 1), (2099, 2), (2099, 3)]
+
+        runs = {run.day: run for run in run_all(days, timeout=2)}
+        assert runs[1].answers == {1: "3", 2: "0"} and runs[1].ok
+        assert runs[2].error.startswith("Timed out")
+        assert runs[3].missing == [2] and runs[3].status == "no answer"
+        assert not runs[3].ok
+
+        assert not print_calendar(2099, list(runs.values()), budget=1.0)
+        out = capsys.readouterr().out
+        assert "over by" in out and "(no answer)" in out
+        assert "Days: 1 ok, 1 no answer, 1 error" in out
+
+
+SCRIPT_DAY = """
+import sys
+import time
+
+part = sys.argv[sys.argv.index("-p") + 1]
+if "-e" in sys.argv:
+    print(f"Result for Part {part}: {40 + int(part)}")
+else:
+    time.sleep(30)
+"""
+
+
+class TestConcurrentTest:
+    """Test cases for the concurrent --test runner."""
+
+    def test_failed_example_cancels_actual_runs(self, tmp_path):
+        day_dir = tmp_path / "2099" / "Day1"
+        day_dir.mkdir(parents=True)
+        (day_dir / "day_1.py").write_text(SCRIPT_DAY)
+        (day_dir / "manifest.json").write_text('{"answers": {"example": {"1": "41", "2": "0"}}}')
+
+        start = time.perf_counter()
+        statuses = asyncio.run(check_day(day_dir / "day_1.py"))
+        assert time.perf_counter() - start < 10
+        assert statuses == {
+            (1, True): "ok",
+            (2, True): "failed",
+            (1, False): "cancelled",
+            (2, False): "cancelled",
+        }
+
+    def test_runs_time_out(self, tmp_path):
+        day_dir = tmp_path / "2099" / "Day1"
+        day_dir.mkdir(parents=True)
+        (day_dir / "day_1.py").write_text(SCRIPT_DAY)
+
+        statuses = asyncio.run(check_day(day_dir / "day_1.py", timeout=1))
+        assert statuses[1, True] == statuses[2, True] == "ok"
+        assert statuses[1, False] == statuses[2, False] == "failed"
@@ -0,0 +1,78 @@
+import os
+import threading
+import time
+
+import pytest
+
+import worker
+from worker import WarmState
+
+
+DAY = '''
+def parse(data):
+    return [int(x) for x in data.split()]
+
+
+def part_1(numbers, log=False):
+    return sum(numbers)
+'''
+
+
+@pytest.fixture
+def day_file(tmp_path):
+    day_dir = tmp_path / "2099" / "Day1"
+    day_dir.mkdir(parents=True)
+    (day_dir / "day_1.py").write_text(DAY)
+    (day_dir / "input.txt").write_text("1 2 3\n")
+    return day_dir / "day_1.py"
+
+
+def _touch_later(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestWarmState:
+    """Test cases for the worker's module and input reuse."""
+
+    def test_reuses_loaded_solution(self, day_file):
+        state = WarmState()
+        first, reloaded = state.solution(day_file)
+        assert reloaded
+        again, reloaded = state.solution(day_file)
+        assert again is first and not reloaded
+
+    def test_reloads_changed_solution(self, day_file):
+        state = WarmState()
+        assert state.run({"path": str(day_file)})["outcomes"][0]["result"] == 6
+        day_file.write_text(DAY.replace("sum(numbers)", "max(numbers)"))
+        _touch_later(day_file)
+        response = state.run({"path": str(day_file)})
+        assert response["reloaded"]
+        assert response["outcomes"][0]["result"] == 3
+
+    def test_inputs_are_held_until_changed(self, day_file):
+        state = WarmState()
+        assert state.input(day_file.parent) == ("1 2 3", False)
+        assert state.input(day_file.parent) == ("1 2 3", True)
+        (day_file.parent / "input.txt").write_text("4\n")
+        _touch_later(day_file.parent / "input.txt")
+        assert state.input(day_file.parent) == ("4", False)
+
+
+def test_serves_runs_over_socket(day_file, tmp_path):
+    socket_path = tmp_path / "w.sock"
+    thread = threading.Thread(target=worker.serve, args=(socket_path, ()), daemon=True)
+    thread.start()
+    for _ in range(100):
+        if worker.is_listening(socket_path):
+            break
+        time.sleep(0.02)
+    try:
+        response = worker.run_warm(day_file, part=1, socket_path=socket_path)
+        assert response["ok"]
+        assert response["outcomes"][0]["result"] == 6
+    finally:
+        assert worker.stop_worker(socket_path)
+        thread.join(timeout=5)
+    assert not socket_path.exists()
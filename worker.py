@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Warm worker for Advent of Code solutions.
+Keeps heavy modules imported and day modules loaded between runs, serving
+run requests from run.py over a local Unix socket.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from run import (
+    REPO_DIR,
+    DayManifest,
+    load_solution,
+    local_imports,
+    read_input,
+    run_part_in_process,
+)
+
+SOCKET_PATH = Path(os.environ.get("AOC_WORKER_SOCKET", REPO_DIR / ".aoc_worker.sock"))
+
+# Third-party modules the solutions use; imported once when the worker starts.
+PRELOAD = ("numpy", "termcolor")
+
+
+# Server
+#
+# Requests and responses are single JSON lines. The server handles one
+# connection at a time: solutions chdir and mutate module state, so runs must
+# not overlap. A day module is re-imported only when its file, its manifest,
+# one of its local imports or (for aoc_utils) the shared package changes;
+# everything else stays warm.
+
+
+def _mtimes(paths):
+    return tuple((str(p), p.stat().st_mtime_ns if p.exists() else None) for p in paths)
+
+
+class WarmState:
+    """Loaded solutions and inputs, refreshed when their files change."""
+
+    def __init__(self):
+        self.solutions = {}  # path -> (mtimes, LoadedSolution)
+        self.inputs = {}  # (day_dir, example) -> (mtime_ns, data)
+
+    def solution(self, path):
+        """Return (LoadedSolution, reloaded) for path, re-importing if it changed."""
+        path = Path(path).resolve()
+        dependencies = [path, *local_imports(path), DayManifest.load(path.parent).path]
+        mtimes = _mtimes(dependencies)
+        entry = self.solutions.get(path)
+        if entry and entry[0] == mtimes:
+            return entry[1], False
+
+        if entry:
+            changed = {Path(p) for p, m in set(mtimes) - set(entry[0])}
+            # Shared modules (e.g. the aoc_utils package) stay in sys.modules;
+            # drop every package with a changed file so the day's import
+            # picks up the new code.
+            stale = set()
+            for name, module in list(sys.modules.items()):
+                module_file = getattr(module, "__file__", None)
+                if module_file and Path(module_file).resolve() in changed:
+                    stale.add(name.partition(".")[0])
+            for name in list(sys.modules):
+                if name.partition(".")[0] in stale:
+                    del sys.modules[name]
+        solution = load_solution(path)
+        self.solutions[path] = (mtimes, solution)
+        return solution, True
+
+    def input(self, day_dir, example=False):
+        """Return (data, cached) for a day's input, re-reading it if it changed."""
+        in_file = DayManifest.load(day_dir).input_file(example)
+        mtime = in_file.stat().st_mtime_ns
+        entry = self.inputs.get((str(day_dir), example))
+        if entry and entry[0] == mtime:
+            return entry[1], True
+        data = read_input(day_dir, example)
+        self.inputs[str(day_dir), example] = (mtime, data)
+        return data, False
+
+    def run(self, request):
+        """Handle a run request: {"path", "part", "example", "log"}."""
+        solution, reloaded = self.solution(request["path"])
+        example = request.get("example", False)
+        data, input_cached = self.input(solution.day_dir, example)
+        entry = solution.entry_points()
+        part = request.get("part")
+        if part is not None:
+            parts = [part]
+        elif None in entry:
+            parts = [None]
+        else:
+            parts = sorted(entry)
+
+        outcomes, ok = [], True
+        for p in parts:
+            outcome = run_part_in_process(solution, p, data, request.get("log", False))
+            outcome.expected = solution.manifest.expected(p, example)
+            ok = ok and outcome.ok and outcome.correct is not False
+            fields = asdict(outcome)
+            del fields["spans"]
+            # A warm run imports nothing; report import time only when reloaded.
+            fields["import_ns"] = solution.import_ns if reloaded else 0
+            outcomes.append(fields)
+        return {
+            "ok": ok,
+            "reloaded": reloaded,
+            "input_cached": input_cached,
+            "outcomes": outcomes,
+        }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                op = request.get("op", "run")
+                if op == "ping":
+                    response = {"ok": True, "pid": os.getpid()}
+                elif op == "shutdown":
+                    response = {"ok": True}
+                    self.server.stopping = True
+                elif op == "run":
+                    response = self.server.state.run(request)
+                else:
+                    response = {"ok": False, "error": f"Unknown op {op!r}"}
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+
+class WorkerServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path):
+        self.state = WarmState()
+        self.stopping = False
+        super().__init__(str(socket_path), _Handler)
+
+
+def serve(socket_path=SOCKET_PATH, preload=PRELOAD):
+    """Run the worker in the foreground until asked to shut down."""
+    socket_path = Path(socket_path)
+    if is_listening(socket_path):
+        print(f"A worker is already listening on {socket_path}")
+        return 1
+    socket_path.unlink(missing_ok=True)
+
+    for name in preload:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+    with WorkerServer(socket_path) as server:
+        print(f"Worker {os.getpid()} listening on {socket_path}", flush=True)
+        try:
+            while not server.stopping:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+    return 0
+
+
+# Client
+
+
+def request(payload, socket_path=SOCKET_PATH, timeout=None):
+    """Send one request to the worker and return its decoded response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError("Worker closed the connection without replying")
+    return json.loads(line)
+
+
+def is_listening(socket_path=SOCKET_PATH):
+    """True if something accepts connections on socket_path.
+
+    A worker busy with a long solve still accepts (its reply just waits), so
+    this does not send a request.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def ensure_worker(socket_path=SOCKET_PATH, startup_timeout=10):
+    """Start a background worker unless one is already listening."""
+    if is_listening(socket_path):
+        return False
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "--socket", str(socket_path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if is_listening(socket_path):
+            return True
+        time.sleep(0.05)
+    raise TimeoutError(f"Worker did not start listening on {socket_path}")
+
+
+def run_warm(solution_file, part=None, example=False, log=False, socket_path=SOCKET_PATH):
+    """Run a solution through the warm worker, starting it if needed.
+
+    Returns the worker's response with the round trip added as "client_ns".
+    """
+    ensure_worker(socket_path)
+    start = time.perf_counter_ns()
+    response = request(
+        {
+            "op": "run",
+            "path": str(Path(solution_file).resolve()),
+            "part": part,
+            "example": example,
+            "log": log,
+        },
+        socket_path,
+    )
+    response["client_ns"] = time.perf_counter_ns() - start
+    return response
+
+
+def stop_worker(socket_path=SOCKET_PATH):
+    """Ask a running worker to exit; returns False if none was running."""
+    if not is_listening(socket_path):
+        return False
+    request({"op": "shutdown"}, socket_path)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Warm worker serving run.py requests",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--socket", default=str(SOCKET_PATH), help="Unix socket path")
+    parser.add_argument("--stop", action="store_true", help="Stop a running worker")
+    args = parser.parse_args()
+
+    if args.stop:
+        return 0 if stop_worker(args.socket) else 1
+    return serve(args.socket)
+
+
+if __name__ == "__main__":
+    sys.exit(main())